@@ -0,0 +1,191 @@
+"""Module d'analyse de positions en lot
+
+Lit des positions, soit toutes celles des parties d'un fichier d'enregistrement
+(voir enregistrement), soit des états au format de l'API à raison d'un objet
+JSON par ligne, et les analyse dans un groupe de processus: meilleur coup et
+score de la recherche alpha-bêta, évaluation statique, longueurs des plus
+courts chemins, nœuds visités et durée. Les résultats sont écrits au format
+JSONL, une ligne par position, dans l'ordre de lecture.
+
+    python analyse.py parties.bin -t 0.5 -p 8 -o analyses.jsonl
+    python analyse.py - < états.jsonl
+
+Une ligne d'états peut préciser, par la clé 'trait', l'indice du joueur qui doit
+jouer; c'est le premier joueur par défaut.
+
+Functions:
+    * positions_enregistrées - Produire les positions de parties enregistrées.
+    * positions_json - Produire les positions d'un flux d'états JSON.
+    * analyser - Analyser une position.
+    * analyser_en_lot - Analyser une suite de positions dans un groupe de processus.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from damier import case
+from enregistrement import SIGNATURE, lire_parties
+from etat import ÉtatPartie
+from recherche import Recherche, formater_coup, évaluer
+from transposition import TableTransposition
+
+# Nombre de positions soumises à la fois au groupe de processus
+LOT = 1000
+
+# Table de transposition propre à chaque processus, conservée d'une position à l'autre
+_TABLE = None
+
+
+def positions_enregistrées(chemin):
+    """Produire, avant chaque coup, les positions des parties d'un fichier d'enregistrement.
+
+    Args:
+        chemin (str): le fichier des parties.
+
+    Yields:
+        tuple: une étiquette {'partie', 'coup'}, la position (ÉtatPartie) et le trait.
+    """
+    for numéro_partie, enregistrée in enumerate(lire_parties(chemin)):
+        état = ÉtatPartie(("1", "2"), (case(5, 1), case(5, 9)))
+        for numéro_coup, (type_coup, position) in enumerate(enregistrée.coups):
+            joueur = numéro_coup % 2
+            yield {"partie": numéro_partie, "coup": numéro_coup}, état, joueur
+            état = état.jouer(joueur, type_coup, position)
+
+
+def positions_json(flux):
+    """Produire les positions d'un flux d'états JSON, un objet par ligne.
+
+    Args:
+        flux (Iterable): les lignes du flux; les lignes vides sont ignorées.
+
+    Yields:
+        tuple: une étiquette {'ligne'}, la position (ÉtatPartie) et le trait.
+    """
+    for numéro, ligne in enumerate(flux, 1):
+        if ligne.strip():
+            état = json.loads(ligne)
+            yield {"ligne": numéro}, ÉtatPartie.depuis_état(état), état.get("trait", 0)
+
+
+def analyser(état, trait, temps=0.5, profondeur_max=20):
+    """Analyser une position.
+
+    Args:
+        état (ÉtatPartie): la position.
+        trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+        temps (float, optionnel): le budget de temps de la recherche, en secondes.
+        profondeur_max (int, optionnel): la profondeur maximale de la recherche.
+
+    Returns:
+        Dict: le meilleur coup, avec le score et la profondeur de l'itération qui l'a
+            retenu, l'évaluation statique, les longueurs des plus courts chemins des
+            deux joueurs, le nombre de nœuds visités et la durée de l'analyse, en
+            secondes.
+    """
+    global _TABLE  # pylint: disable=global-statement
+    if _TABLE is None:
+        _TABLE = TableTransposition()
+    début = time.perf_counter()
+    partie = état.en_partie()
+    damier = état.damier()
+    résultat = {
+        "trait": trait,
+        "distances": [damier.distance(0), damier.distance(1)],
+        "évaluation": évaluer(partie, damier, trait),
+    }
+    if partie.partie_terminée():
+        résultat.update(meilleur_coup=None, score=None, profondeur=0, nœuds=0)
+    else:
+        recherche = Recherche(temps=temps, profondeur_max=profondeur_max, table=_TABLE)
+        coup = recherche.meilleur_coup(partie, trait)
+        if recherche.historique:
+            # Le coup partiel d'une itération interrompue n'a pas de score: le coup,
+            # le score et la profondeur sont ceux de la dernière itération terminée
+            profondeur, score, meilleur = recherche.historique[-1]
+            coup = formater_coup(meilleur)
+        else:
+            profondeur, score = 0, None
+        résultat["meilleur_coup"] = list(coup)
+        résultat["score"] = score
+        résultat["profondeur"] = profondeur
+        résultat["nœuds"] = recherche.nœuds
+    résultat["durée"] = time.perf_counter() - début
+    return résultat
+
+
+def _analyser(position, temps, profondeur_max):
+    """Analyser une position étiquetée (dans un processus)."""
+    étiquette, état, trait = position
+    return {**étiquette, **analyser(état, trait, temps, profondeur_max)}
+
+
+def analyser_en_lot(positions, temps=0.5, profondeur_max=20, processus=None):
+    """Analyser une suite de positions dans un groupe de processus.
+
+    Les positions sont lues et soumises par lots de LOT: la mémoire utilisée ne
+    dépend pas de la longueur de la suite.
+
+    Args:
+        positions (Iterable): des tuples (étiquette, ÉtatPartie, trait), l'étiquette
+            étant un dictionnaire recopié dans le résultat.
+        temps (float, optionnel): le budget de temps de chaque recherche, en secondes.
+        profondeur_max (int, optionnel): la profondeur maximale des recherches.
+        processus (int, optionnel): le nombre de processus; un par cœur par défaut.
+
+    Yields:
+        Dict: le résultat de chaque position, dans l'ordre des positions.
+    """
+    positions = iter(positions)
+    with ProcessPoolExecutor(max_workers=processus) as exécuteur:
+        while True:
+            lot = list(itertools.islice(positions, LOT))
+            if not lot:
+                return
+            yield from exécuteur.map(_analyser, lot, itertools.repeat(temps),
+                                     itertools.repeat(profondeur_max), chunksize=8)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="analyse.py",
+                                     description="Analyse de positions en lot")
+    parser.add_argument("entrée",
+                        help="Fichier d'enregistrement de parties, fichier d'états JSONL, "
+                             "ou - pour lire des états JSONL sur l'entrée standard.")
+    parser.add_argument("-o", "--sortie", help="Fichier JSONL des résultats (sortie standard "
+                                               "par défaut).")
+    parser.add_argument("-t", "--temps", type=float, default=0.5,
+                        help="Temps de recherche par position, en secondes.")
+    parser.add_argument("-d", "--profondeur", type=int, default=20,
+                        help="Profondeur maximale de la recherche.")
+    parser.add_argument("-p", "--processus", type=int, default=os.cpu_count(),
+                        help="Nombre de processus.")
+    args = parser.parse_args()
+
+    if args.entrée == "-":
+        source = positions_json(sys.stdin)
+    else:
+        with open(args.entrée, "rb") as fichier_entrée:
+            enregistré = fichier_entrée.read(len(SIGNATURE)) == SIGNATURE
+        if enregistré:
+            source = positions_enregistrées(args.entrée)
+        else:
+            # Le fichier reste ouvert pendant toute l'analyse
+            # pylint: disable-next=consider-using-with
+            source = positions_json(open(args.entrée, encoding="utf-8"))
+
+    # pylint: disable-next=consider-using-with
+    sortie = open(args.sortie, "w", encoding="utf-8") if args.sortie else sys.stdout
+    début_analyse = time.perf_counter()
+    nombre = 0
+    for analyse in analyser_en_lot(source, args.temps, args.profondeur, args.processus):
+        sortie.write(json.dumps(analyse, ensure_ascii=False) + "\n")
+        nombre += 1
+    if sortie is not sys.stdout:
+        sortie.close()
+    print(f"{nombre} positions analysées en {time.perf_counter() - début_analyse:.1f} s",
+          file=sys.stderr)
@@ -1,74 +1,303 @@
-"""Module d'API du jeu Quoridor"""
+"""Module d'API du jeu Quoridor
 
-import requests
+Les requêtes passent par un ClientAPI qui conserve une session HTTP (connexions
+réutilisées d'une requête à l'autre), impose des délais de connexion et de
+lecture, réessaie les échecs passagers et mesure la latence de chaque requête.
+Les fonctions du module utilisent un client partagé, créé au premier appel.
+
+Classes:
+    * ClientAPI - Client HTTP du serveur de parties.
+
+Functions:
+    * client_par_défaut - Produire le client partagé par les fonctions du module.
+    * définir_client_par_défaut - Remplacer le client partagé.
+    * créer_une_partie - Créer une nouvelle partie.
+    * récupérer_une_partie - Récupérer l'état d'une partie existante.
+    * appliquer_un_coup - Appliquer un coup à une partie.
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from attente import AttenteExponentielle
 
 URL = "https://pax.ulaval.ca/quoridor/api/h25"
 
+# Codes indiquant une erreur passagère du serveur ou d'un intermédiaire
+CODES_PASSAGERS = (500, 502, 503, 504)
 
-def créer_une_partie(idul, secret):
-    """Créer une nouvelle partie"""
-    print("DEBUG:", idul, secret)  # ← ici, pour voir exactement ce que tu envoies
+# Codes pour lesquels la requête n'a certainement pas été traitée; un 502 d'une
+# passerelle ne le garantit pas, le serveur ayant pu appliquer la requête
+CODES_NON_TRAITÉS = (503,)
 
-    rep = requests.post(f"{URL}/parties", auth=(idul, secret))
 
-    if rep.status_code == 200:
-        data = rep.json()
-        return data["id"], data["état"]
+def _erreurs_réseau():
+    """Produire les exceptions de requests à intercepter, sans importer requests.
 
-    elif rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
+    Si requests n'a pas été importé, aucune session ne peut lever ses exceptions.
 
-    elif rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"])
+    Returns:
+        tuple: l'exception du délai de connexion dépassé et celles des autres échecs
+            de connexion ou délais dépassés, ou des tuples vides.
+    """
+    if "requests" not in sys.modules:
+        return (), ()
+    exceptions = sys.modules["requests"].exceptions
+    return exceptions.ConnectTimeout, (exceptions.ConnectionError, exceptions.Timeout)
 
-    else:
-        raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
 
-def récupérer_une_partie(id_partie, idul, secret):
-    """Récupérer l'état d'une partie existante"""
-    rep = requests.get(f"{URL}/parties/{id_partie}", auth=(idul, secret))
+class ClientAPI:
+    """Client HTTP du serveur de parties.
+
+    Les requêtes GET sont réessayées après toute erreur de connexion, tout délai
+    dépassé ou toute erreur 5xx. Les requêtes POST et PUT, qui ne peuvent pas être
+    rejouées sans risque, ne le sont que si la connexion n'a pas pu être établie
+    ou si le serveur indique ne pas avoir traité la requête (503). Les attentes
+    entre les essais suivent une AttenteExponentielle du module attente.
+
+    Attributes:
+        url (str): l'adresse de base de l'API.
+        délais (tuple): les délais de connexion et de lecture, en secondes.
+        tentatives (int): le nombre maximal d'essais par requête.
+        attente (float): l'attente avant le deuxième essai, doublée à chaque essai et
+            réduite d'une part aléatoire.
+        session (Session): la session HTTP du fil courant; sauf si une session est
+            fournie, chaque fil a la sienne et toutes partagent les mêmes connexions.
+        latences (Dict): pour chaque opération, les dernières durées mesurées, en secondes.
+        essais (Dict): pour chaque opération, le nombre total d'essais effectués.
+    """
+
+    def __init__(self, url=URL, délai_connexion=3.05, délai_lecture=10.0, tentatives=3,
+                 attente=0.25, connexions=10, session=None):
+        """Constructeur de la classe ClientAPI.
+
+        Args:
+            url (str, optionnel): l'adresse de base de l'API.
+            délai_connexion (float, optionnel): le délai d'établissement de la connexion.
+            délai_lecture (float, optionnel): le délai de réception de la réponse.
+            tentatives (int, optionnel): le nombre maximal d'essais par requête.
+            attente (float, optionnel): l'attente avant le deuxième essai, en secondes.
+            connexions (int, optionnel): le nombre de connexions conservées ouvertes.
+            session (Session, optionnel): une session existante à utiliser.
+
+        Raises:
+            ValueError: Le nombre d'essais est inférieur à 1.
+        """
+        if tentatives < 1:
+            raise ValueError("Le nombre d'essais doit être d'au moins 1.")
+        self.url = url
+        self.délais = (délai_connexion, délai_lecture)
+        self.tentatives = tentatives
+        self.attente = attente
+        self.latences = defaultdict(lambda: deque(maxlen=1000))
+        self.essais = defaultdict(int)
+        # Les mesures sont mises à jour par tous les fils qui partagent le client
+        self._verrou = threading.Lock()
+        self._session = session
+        self._locales = threading.local()
+        self._sessions = []
+        self._nouvelle_session = self._adaptateur = None
+        if session is None:
+            # requests n'est importé que pour une vraie session HTTP
+            import requests  # pylint: disable=import-outside-toplevel
+            from requests.adapters import HTTPAdapter  # pylint: disable=import-outside-toplevel
+            self._nouvelle_session = requests.Session
+            self._adaptateur = HTTPAdapter(pool_connections=connexions,
+                                           pool_maxsize=connexions)
+
+    @property
+    def session(self):
+        """Produire la session HTTP du fil courant.
+
+        Une Session de requests n'est pas garantie sûre entre fils: chaque fil reçoit
+        la sienne, montée sur l'adaptateur commun qui conserve les connexions.
+        """
+        if self._session is not None:
+            return self._session
+        session = getattr(self._locales, "session", None)
+        if session is None:
+            session = self._nouvelle_session()
+            session.mount("https://", self._adaptateur)
+            session.mount("http://", self._adaptateur)
+            self._locales.session = session
+            with self._verrou:
+                self._sessions.append(session)
+        return session
+
+    def _requête(self, opération, méthode, chemin, auth, **kwargs):
+        """Envoyer une requête en réessayant les échecs passagers.
+
+        Args:
+            opération (str): le nom de l'opération, pour les mesures.
+            méthode (str): la méthode HTTP.
+            chemin (str): le chemin relatif à l'adresse de base.
+            auth (tuple): l'IDUL et le secret.
+
+        Returns:
+            Response: la réponse du serveur.
+
+        Raises:
+            ConnectionError: Le serveur est resté injoignable après tous les essais.
+        """
+        rejouable = méthode == "GET"
+        délai_connexion_dépassé, erreurs_connexion = _erreurs_réseau()
+        politique = AttenteExponentielle(initial=self.attente, maximum=float("inf"))
+        for essai in range(self.tentatives):
+            if essai:
+                time.sleep(politique.prochain_délai())
+            with self._verrou:
+                self.essais[opération] += 1
+            début = time.perf_counter()
+            try:
+                rep = self.session.request(méthode, f"{self.url}{chemin}", auth=auth,
+                                           timeout=self.délais, **kwargs)
+            except délai_connexion_dépassé as exc:
+                erreur = repr(exc)
+                continue
+            except erreurs_connexion as exc:
+                erreur = repr(exc)
+                if rejouable:
+                    continue
+                break
+            with self._verrou:
+                self.latences[opération].append(time.perf_counter() - début)
+
+            passager = rep.status_code in (CODES_PASSAGERS if rejouable else CODES_NON_TRAITÉS)
+            if not passager or essai == self.tentatives - 1:
+                return rep
+            erreur = f"code {rep.status_code}"
+
+        raise ConnectionError(f"Serveur injoignable ({erreur})")
+
+    def créer_une_partie(self, idul, secret):
+        """Créer une nouvelle partie"""
+        rep = self._requête("créer", "POST", "/parties", (idul, secret))
+
+        if rep.status_code == 200:
+            data = rep.json()
+            return data["id"], data["état"]
+
+        elif rep.status_code == 401:
+            raise PermissionError(rep.json()["message"])
+
+        elif rep.status_code == 406:
+            raise RuntimeError(rep.json()["message"])
+
+        else:
+            raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
+
+    def récupérer_une_partie(self, id_partie, idul, secret):
+        """Récupérer l'état d'une partie existante"""
+        rep = self._requête("récupérer", "GET", f"/parties/{id_partie}", (idul, secret))
 
-    if rep.status_code == 200:
-        data = rep.json()
-        return data["id"], data["état"]
+        if rep.status_code == 200:
+            data = rep.json()
+            return data["id"], data["état"]
 
-    elif rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
+        elif rep.status_code == 401:
+            raise PermissionError(rep.json()["message"])
 
-    elif rep.status_code == 404:
-        raise ReferenceError(rep.json()["message"])
+        elif rep.status_code == 404:
+            raise ReferenceError(rep.json()["message"])
 
-    elif rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"])
+        elif rep.status_code == 406:
+            raise RuntimeError(rep.json()["message"])
 
-    else:
-        raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
+        else:
+            raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
+
+    def appliquer_un_coup(self, id_partie, coup, position, idul, secret):
+        """Appliquer un coup à une partie"""
+        rep = self._requête(
+            "appliquer", "PUT", f"/parties/{id_partie}", (idul, secret),
+            json={"coup": coup, "position": position},
+        )
+
+        if rep.status_code == 200:
+            data = rep.json()
+
+            if data["partie"] == "terminée":
+                raise StopIteration(data["gagnant"])
+
+            return data["coup"], data["position"]
+
+        elif rep.status_code == 401:
+            raise PermissionError(rep.json()["message"])
+
+        elif rep.status_code == 404:
+            raise ReferenceError(rep.json()["message"])
+
+        elif rep.status_code == 406:
+            raise RuntimeError(rep.json()["message"])
+
+        else:
+            raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
+
+    def métriques(self):
+        """Résumer les latences mesurées pour chaque opération.
+
+        Returns:
+            Dict: pour chaque opération, le nombre de réponses et d'essais, puis les
+                latences moyenne, médiane, au 99e centile et maximale, en millisecondes.
+        """
+        with self._verrou:
+            latences = {opération: sorted(durées) for opération, durées in self.latences.items()}
+            essais = dict(self.essais)
+        résumé = {}
+        for opération, triées in latences.items():
+            if not triées:
+                continue
+            résumé[opération] = {
+                "réponses": len(triées),
+                "essais": essais.get(opération, 0),
+                "moyenne_ms": 1000 * sum(triées) / len(triées),
+                "p50_ms": 1000 * triées[len(triées) // 2],
+                "p99_ms": 1000 * triées[min(len(triées) - 1, len(triées) * 99 // 100)],
+                "max_ms": 1000 * triées[-1],
+            }
+        return résumé
+
+    def fermer(self):
+        """Fermer les connexions ouvertes."""
+        if self._session is not None:
+            self._session.close()
+            return
+        with self._verrou:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+        self._adaptateur.close()
+
+
+_CLIENT = None
+
+
+def client_par_défaut():
+    """Produire le client partagé par les fonctions du module, créé au premier appel."""
+    global _CLIENT  # pylint: disable=global-statement
+    if _CLIENT is None:
+        _CLIENT = ClientAPI()
+    return _CLIENT
+
+
+def définir_client_par_défaut(client):
+    """Remplacer le client partagé par les fonctions du module, par exemple par un
+    client relié au serveur local."""
+    global _CLIENT  # pylint: disable=global-statement
+    _CLIENT = client
+
+
+def créer_une_partie(idul, secret):
+    """Créer une nouvelle partie"""
+    return client_par_défaut().créer_une_partie(idul, secret)
+
+
+def récupérer_une_partie(id_partie, idul, secret):
+    """Récupérer l'état d'une partie existante"""
+    return client_par_défaut().récupérer_une_partie(id_partie, idul, secret)
 
 
 def appliquer_un_coup(id_partie, coup, position, idul, secret):
     """Appliquer un coup à une partie"""
-    rep = requests.put(
-        f"{URL}/parties/{id_partie}",
-        auth=(idul, secret),
-        json={"coup": coup, "position": position},
-    )
-
-    if rep.status_code == 200:
-        data = rep.json()
-
-        if data["partie"] == "terminée":
-            raise StopIteration(data["gagnant"])
-        
-        return data["coup"], data ["position"]
-    
-    elif rep.status_code == 401:
-        raise PermissionError(rep.json()["message"])
-    
-    elif rep.status_code == 404:
-        raise ReferenceError(rep.json()["message"])
-    
-    elif rep.status_code == 406:
-        raise RuntimeError(rep.json()["message"])
-    
-    else:
-        raise ConnectionError(f"Erreur inattendue ({rep.status_code})")
+    return client_par_défaut().appliquer_un_coup(id_partie, coup, position, idul, secret)
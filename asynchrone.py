@@ -0,0 +1,238 @@
+"""Module du client asynchrone et des parties concurrentes
+
+Les trois opérations de l'API existent en version asynchrone; les requêtes
+bloquantes du ClientAPI s'exécutent dans un groupe de fils qui ont chacun leur
+session HTTP, mais partagent les mêmes connexions ouvertes. La réflexion des
+joueurs automatiques est confiée à un groupe de processus, si bien qu'une
+attente réseau ne retarde jamais le calcul d'un coup, ni l'inverse.
+
+Classes:
+    * PartieTerminée - Signale la fin d'une partie au client asynchrone.
+    * ClientAsynchrone - Version asynchrone du ClientAPI.
+
+Functions:
+    * jouer_une_partie - Jouer une partie complète contre le serveur.
+    * jouer_des_parties - Jouer plusieurs parties simultanément.
+    * résumer - Résumer les résultats d'une série de parties.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from api import ClientAPI
+from attente import AttenteExponentielle, attendre_changement_asynchrone
+from quoridor import Quoridor, STRATÉGIES
+
+
+class PartieTerminée(Exception):
+    """Signale la fin d'une partie au client asynchrone.
+
+    Une coroutine ne peut pas lever StopIteration; cette exception la remplace.
+
+    Attributes:
+        gagnant (str): le nom du gagnant.
+    """
+
+    def __init__(self, gagnant):
+        super().__init__(gagnant)
+        self.gagnant = gagnant
+
+
+def _appliquer(client, *args):
+    """Appliquer un coup en remplaçant StopIteration par PartieTerminée."""
+    try:
+        return client.appliquer_un_coup(*args)
+    except StopIteration as fin:
+        raise PartieTerminée(fin.value) from None
+
+
+class ClientAsynchrone:
+    """Version asynchrone du ClientAPI.
+
+    Attributes:
+        client (ClientAPI): le client dont les requêtes sont exécutées.
+        connexions (int): le nombre de requêtes menées en même temps.
+    """
+
+    def __init__(self, connexions=32, client=None):
+        """Constructeur de la classe ClientAsynchrone.
+
+        Args:
+            connexions (int, optionnel): le nombre de requêtes menées en même temps,
+                qui est aussi le nombre de connexions conservées ouvertes.
+            client (ClientAPI, optionnel): un client existant à utiliser.
+        """
+        self.client = client or ClientAPI(connexions=connexions)
+        self.connexions = connexions
+        self._fils = ThreadPoolExecutor(max_workers=connexions, thread_name_prefix="api")
+
+    async def _exécuter(self, fonction, *args):
+        """Exécuter une requête bloquante dans le groupe de fils."""
+        return await asyncio.get_running_loop().run_in_executor(self._fils, fonction, *args)
+
+    async def créer_une_partie(self, idul, secret):
+        """Créer une nouvelle partie"""
+        return await self._exécuter(self.client.créer_une_partie, idul, secret)
+
+    async def récupérer_une_partie(self, id_partie, idul, secret):
+        """Récupérer l'état d'une partie existante"""
+        return await self._exécuter(self.client.récupérer_une_partie, id_partie, idul, secret)
+
+    async def appliquer_un_coup(self, id_partie, coup, position, idul, secret):
+        """Appliquer un coup à une partie.
+
+        Raises:
+            PartieTerminée: Le coup a terminé la partie.
+        """
+        return await self._exécuter(_appliquer, self.client,
+                                    id_partie, coup, position, idul, secret)
+
+    def fermer(self):
+        """Arrêter le groupe de fils et fermer les connexions."""
+        self._fils.shutdown()
+        self.client.fermer()
+
+
+def _réfléchir(état, idul, stratégie, temps):
+    """Choisir le coup d'un joueur (dans un processus)."""
+    partie = Quoridor(état["joueurs"], état["murs"], état.get("tour", 1))
+    return partie.jouer_un_coup(idul, stratégie, temps)
+
+
+async def _état(client, id_partie, idul, secret):
+    """Récupérer l'état seul d'une partie."""
+    _, état = await client.récupérer_une_partie(id_partie, idul, secret)
+    return état
+
+
+async def jouer_une_partie(client, idul, secret, exécuteur, stratégie="heuristique",
+                           temps=1.0, politique=None):
+    """Jouer une partie complète contre le serveur.
+
+    Args:
+        client (ClientAsynchrone): le client du serveur.
+        idul (str): l'IDUL du joueur.
+        secret (str): le jeton du joueur.
+        exécuteur (Executor): le groupe où la réflexion est exécutée.
+        stratégie (str, optionnel): la stratégie du joueur automatique.
+        temps (float, optionnel): le temps de réflexion par coup, en secondes.
+        politique (Politique, optionnel): la politique d'attente du coup adverse;
+            par défaut, une attente exponentielle.
+
+    Returns:
+        Dict: l'identifiant de la partie, le gagnant, le nombre de coups joués et
+            le temps passé à réfléchir et à attendre le serveur, en secondes.
+    """
+    boucle = asyncio.get_running_loop()
+    politique = politique or AttenteExponentielle()
+    id_partie, état = await client.créer_une_partie(idul, secret)
+    coups = 0
+    réflexion = 0.0
+    début = time.perf_counter()
+    while True:
+        if état["joueurs"][0]["nom"] != idul:
+            état = await attendre_changement_asynchrone(
+                lambda: _état(client, id_partie, idul, secret), état, politique)
+            continue
+
+        départ = time.perf_counter()
+        type_coup, position = await boucle.run_in_executor(
+            exécuteur, _réfléchir, état, idul, stratégie, temps)
+        réflexion += time.perf_counter() - départ
+        coups += 1
+        try:
+            await client.appliquer_un_coup(id_partie, type_coup, position, idul, secret)
+        except PartieTerminée as fin:
+            gagnant = fin.gagnant
+            break
+        _, état = await client.récupérer_une_partie(id_partie, idul, secret)
+
+    durée = time.perf_counter() - début
+    return {
+        "id": id_partie,
+        "gagnant": gagnant,
+        "coups": coups,
+        "réflexion": réflexion,
+        "réseau": durée - réflexion,
+    }
+
+
+async def jouer_des_parties(idul, secret, nombre, simultanées=16, stratégie="heuristique",
+                            temps=1.0, processus=None, client=None):
+    """Jouer plusieurs parties simultanément.
+
+    Args:
+        idul (str): l'IDUL du joueur.
+        secret (str): le jeton du joueur.
+        nombre (int): le nombre de parties à jouer.
+        simultanées (int, optionnel): le nombre maximal de parties en cours à la fois.
+        stratégie (str, optionnel): la stratégie du joueur automatique.
+        temps (float, optionnel): le temps de réflexion par coup, en secondes.
+        processus (int, optionnel): le nombre de processus de réflexion; par défaut,
+            un par processeur.
+        client (ClientAsynchrone, optionnel): un client existant à utiliser.
+
+    Returns:
+        List: pour chaque partie, le dictionnaire produit par jouer_une_partie, ou
+            l'exception qui l'a interrompue.
+    """
+    propre = client is None
+    client = client or ClientAsynchrone(connexions=simultanées)
+    limite = asyncio.Semaphore(simultanées)
+
+    async def jouer(exécuteur):
+        async with limite:
+            return await jouer_une_partie(client, idul, secret, exécuteur, stratégie, temps)
+
+    try:
+        with ProcessPoolExecutor(max_workers=processus or os.cpu_count()) as exécuteur:
+            return await asyncio.gather(*(jouer(exécuteur) for _ in range(nombre)),
+                                        return_exceptions=True)
+    finally:
+        if propre:
+            client.fermer()
+
+
+def résumer(résultats, idul):
+    """Résumer les résultats d'une série de parties.
+
+    Args:
+        résultats (List): les résultats produits par jouer_des_parties.
+        idul (str): l'IDUL du joueur.
+
+    Returns:
+        str: le nombre de victoires, de défaites et d'erreurs et la longueur moyenne.
+    """
+    terminées = [résultat for résultat in résultats if isinstance(résultat, dict)]
+    victoires = sum(résultat["gagnant"] == idul for résultat in terminées)
+    coups = sum(résultat["coups"] for résultat in terminées)
+    return (f"{len(terminées)} parties terminées: {victoires} victoires, "
+            f"{len(terminées) - victoires} défaites, {len(résultats) - len(terminées)} erreurs, "
+            f"{coups / max(len(terminées), 1):.1f} coups en moyenne")
+
+
+if __name__ == "__main__":
+    from main import JETONS  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(prog="asynchrone.py",
+                                     description="Parties simultanées de Quoridor")
+    parser.add_argument("idul", help="IDUL du joueur")
+    parser.add_argument("-n", "--nombre", type=int, default=10, help="Nombre de parties.")
+    parser.add_argument("-c", "--simultanées", type=int, default=16,
+                        help="Nombre maximal de parties en cours à la fois.")
+    parser.add_argument("-s", "--stratégie", choices=STRATÉGIES, default="heuristique",
+                        help="Stratégie du joueur automatique.")
+    parser.add_argument("-t", "--temps", type=float, default=1.0,
+                        help="Temps de réflexion par coup, en secondes.")
+    parser.add_argument("-p", "--processus", type=int, default=None,
+                        help="Nombre de processus de réflexion.")
+    args = parser.parse_args()
+
+    parties = asyncio.run(jouer_des_parties(args.idul, JETONS[args.idul], args.nombre,
+                                            args.simultanées, args.stratégie, args.temps,
+                                            args.processus))
+    for partie in parties:
+        print(partie)
+    print(résumer(parties, args.idul))
@@ -0,0 +1,186 @@
+"""Module des stratégies d'attente du coup adverse
+
+Pendant que l'adversaire réfléchit, l'état de la partie est consulté à
+intervalles réguliers. Une politique d'attente fixe ces intervalles: la
+politique exponentielle commence par des consultations rapprochées, les
+espace tant que rien ne change et ajoute une part aléatoire pour que des
+parties simultanées n'interrogent pas le serveur au même instant. Un état
+identique au précédent n'est pas retourné, ce qui évite de reconstruire et de
+réafficher la partie inutilement.
+
+Classes:
+    * Politique - Interface d'une politique d'attente.
+    * AttenteFixe - Intervalle constant entre les consultations.
+    * AttenteExponentielle - Intervalle croissant, avec gigue aléatoire.
+
+Functions:
+    * créer_politique - Créer une politique d'après son nom.
+    * attendre_changement - Consulter l'état jusqu'à ce qu'il change.
+    * attendre_changement_asynchrone - Version asynchrone d'attendre_changement.
+"""
+
+import abc
+import random
+import time
+
+
+class Politique(abc.ABC):
+    """Interface d'une politique d'attente.
+
+    Une politique produit la pause à observer avant chaque consultation et
+    revient à son état initial lorsqu'un changement est détecté.
+    """
+
+    @abc.abstractmethod
+    def prochain_délai(self):
+        """Produire la pause à observer avant la prochaine consultation, en secondes."""
+
+    def réinitialiser(self):
+        """Revenir à l'état initial après un changement."""
+
+
+class AttenteFixe(Politique):
+    """Intervalle constant entre les consultations.
+
+    Attributes:
+        délai (float): la pause entre deux consultations, en secondes.
+    """
+
+    def __init__(self, délai=0.5):
+        """Constructeur de la classe AttenteFixe.
+
+        Args:
+            délai (float, optionnel): la pause entre deux consultations, en secondes.
+        """
+        self.délai = délai
+
+    def prochain_délai(self):
+        """Produire la pause à observer avant la prochaine consultation, en secondes."""
+        return self.délai
+
+
+class AttenteExponentielle(Politique):
+    """Intervalle croissant entre les consultations, avec gigue aléatoire.
+
+    La n-ième pause vaut initial * facteur ** n, plafonnée à maximum, puis
+    réduite d'une fraction aléatoire comprise entre 0 et gigue.
+
+    Attributes:
+        initial (float): la première pause, en secondes.
+        maximum (float): la plus longue pause, en secondes.
+        facteur (float): le facteur d'allongement d'une pause à la suivante.
+        gigue (float): la fraction maximale retirée au hasard de chaque pause.
+        essais (int): le nombre de pauses produites depuis le dernier changement.
+    """
+
+    def __init__(self, initial=0.05, maximum=2.0, facteur=2.0, gigue=0.5, aléa=None):
+        """Constructeur de la classe AttenteExponentielle.
+
+        Args:
+            initial (float, optionnel): la première pause, en secondes.
+            maximum (float, optionnel): la plus longue pause, en secondes.
+            facteur (float, optionnel): le facteur d'allongement des pauses.
+            gigue (float, optionnel): la fraction maximale retirée au hasard, entre 0 et 1.
+            aléa (Random, optionnel): le générateur de nombres aléatoires à utiliser.
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.facteur = facteur
+        self.gigue = gigue
+        self.essais = 0
+        self._aléa = aléa or random.Random()
+
+    def prochain_délai(self):
+        """Produire la pause à observer avant la prochaine consultation, en secondes."""
+        délai = min(self.maximum, self.initial * self.facteur ** self.essais)
+        if délai < self.maximum:
+            self.essais += 1
+        return délai * (1 - self.gigue * self._aléa.random())
+
+    def réinitialiser(self):
+        """Revenir à la première pause après un changement."""
+        self.essais = 0
+
+
+POLITIQUES = {
+    "fixe": AttenteFixe,
+    "exponentielle": AttenteExponentielle,
+}
+
+
+def créer_politique(nom):
+    """Créer une politique d'attente d'après son nom.
+
+    Args:
+        nom (str): 'fixe' ou 'exponentielle'.
+
+    Returns:
+        Politique: la politique, avec ses paramètres par défaut.
+
+    Raises:
+        ValueError: Le nom ne correspond à aucune politique.
+    """
+    if nom not in POLITIQUES:
+        raise ValueError(f"La politique d'attente {nom} est inconnue.")
+    return POLITIQUES[nom]()
+
+
+def attendre_changement(récupérer, état, politique, condition=None, limite=None,
+                        dormir=time.sleep):
+    """Consulter l'état d'une partie jusqu'à ce qu'il change.
+
+    Args:
+        récupérer (Callable): la fonction sans argument qui retourne l'état courant.
+        état (Dict): le dernier état connu.
+        politique (Politique): la politique qui fixe les pauses.
+        condition (Callable, optionnel): un prédicat que le nouvel état doit aussi
+            satisfaire, par exemple que ce soit au tour du joueur.
+        limite (float, optionnel): la durée d'attente maximale, en secondes.
+        dormir (Callable, optionnel): la fonction qui observe une pause.
+
+    Returns:
+        Dict: le nouvel état.
+
+    Raises:
+        TimeoutError: L'état n'a pas changé avant la limite.
+    """
+    échéance = None if limite is None else time.monotonic() + limite
+    while True:
+        délai = politique.prochain_délai()
+        if échéance is not None and time.monotonic() + délai > échéance:
+            raise TimeoutError("L'état de la partie n'a pas changé dans le délai alloué.")
+        dormir(délai)
+        nouvel_état = récupérer()
+        if nouvel_état != état and (condition is None or condition(nouvel_état)):
+            politique.réinitialiser()
+            return nouvel_état
+
+
+async def attendre_changement_asynchrone(récupérer, état, politique, condition=None, limite=None):
+    """Consulter l'état d'une partie jusqu'à ce qu'il change, sans bloquer la boucle.
+
+    Args:
+        récupérer (Callable): la coroutine sans argument qui retourne l'état courant.
+        état (Dict): le dernier état connu.
+        politique (Politique): la politique qui fixe les pauses.
+        condition (Callable, optionnel): un prédicat que le nouvel état doit aussi satisfaire.
+        limite (float, optionnel): la durée d'attente maximale, en secondes.
+
+    Returns:
+        Dict: le nouvel état.
+
+    Raises:
+        TimeoutError: L'état n'a pas changé avant la limite.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    échéance = None if limite is None else time.monotonic() + limite
+    while True:
+        délai = politique.prochain_délai()
+        if échéance is not None and time.monotonic() + délai > échéance:
+            raise TimeoutError("L'état de la partie n'a pas changé dans le délai alloué.")
+        await asyncio.sleep(délai)
+        nouvel_état = await récupérer()
+        if nouvel_état != état and (condition is None or condition(nouvel_état)):
+            politique.réinitialiser()
+            return nouvel_état
@@ -0,0 +1,232 @@
+"""Module des parties entre joueurs automatiques
+
+Oppose deux stratégies sur un grand nombre de parties, sans affichage et sans
+réseau, en alternant le joueur qui commence, et rapporte les taux de victoire,
+la longueur des parties et le débit de coups. Avec l'option --serveur, le
+joueur qui commence joue à travers le ClientAPI contre le serveur local, qui
+joue l'autre stratégie, ce qui exerce aussi le client et le protocole de l'API.
+
+Functions:
+    * nouvelle_partie - Créer une partie à la position de départ.
+    * jouer_une_partie - Jouer une partie entre deux stratégies.
+    * jouer_contre_serveur - Jouer une partie contre le serveur local.
+    * tournoi - Jouer une série de parties et en résumer les résultats.
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from api import ClientAPI
+from enregistrement import Enregistreur, déduire_coup
+from quoridor import Quoridor, STRATÉGIES
+from serveur_local import ServeurLocal, SessionLocale
+
+# Nombre de coups au-delà duquel une partie est déclarée nulle
+LIMITE_COUPS = 200
+
+
+def nouvelle_partie(nom_1="A", nom_2="B"):
+    """Créer une partie à la position de départ.
+
+    Args:
+        nom_1 (str, optionnel): le nom du joueur qui commence.
+        nom_2 (str, optionnel): le nom de l'autre joueur.
+
+    Returns:
+        Quoridor: la nouvelle partie.
+    """
+    return Quoridor([
+        {"nom": nom_1, "murs": 10, "position": [5, 1]},
+        {"nom": nom_2, "murs": 10, "position": [5, 9]},
+    ])
+
+
+def jouer_une_partie(stratégies, temps=0.1, limite=LIMITE_COUPS, enregistreur=None):
+    """Jouer une partie entre deux stratégies.
+
+    Args:
+        stratégies (tuple): les stratégies du joueur qui commence et de l'autre.
+        temps (float, optionnel): le temps de réflexion par coup, en secondes.
+        limite (int, optionnel): le nombre de coups au-delà duquel la partie est nulle.
+        enregistreur (Enregistreur, optionnel): l'enregistreur auquel ajouter la partie.
+
+    Returns:
+        Dict: l'indice du gagnant (0, 1 ou None), le nombre de coups et le temps
+            total de réflexion, en secondes.
+    """
+    partie = nouvelle_partie()
+    noms = ("A", "B")
+    coups = 0
+    réflexion = 0.0
+    while not partie.partie_terminée() and coups < limite:
+        joueur = coups % 2
+        départ = time.perf_counter()
+        type_coup, position = partie.jouer_un_coup(noms[joueur], stratégies[joueur], temps)
+        réflexion += time.perf_counter() - départ
+        partie.appliquer_un_coup(noms[joueur], position, type_coup)
+        if enregistreur:
+            enregistreur.ajouter(type_coup, position)
+        coups += 1
+    gagnant = partie.partie_terminée()
+    if enregistreur:
+        enregistreur.terminer(noms.index(gagnant) if gagnant else None)
+    return {
+        "gagnant": noms.index(gagnant) if gagnant else None,
+        "coups": coups,
+        "réflexion": réflexion,
+    }
+
+
+def jouer_contre_serveur(client, stratégie, temps=0.1, idul="autojeu", limite=LIMITE_COUPS,
+                         enregistreur=None):
+    """Jouer une partie contre le serveur local à travers le client de l'API.
+
+    Args:
+        client (ClientAPI): un client relié à une SessionLocale.
+        stratégie (str): la stratégie du joueur, qui commence.
+        temps (float, optionnel): le temps de réflexion par coup, en secondes.
+        idul (str, optionnel): l'IDUL du joueur.
+        limite (int, optionnel): le nombre de coups au-delà duquel la partie est nulle.
+        enregistreur (Enregistreur, optionnel): l'enregistreur auquel ajouter la partie.
+
+    Returns:
+        Dict: le résultat, sous la même forme que pour jouer_une_partie; le temps de
+            réflexion est toutefois celui du joueur seul, celui de l'adversaire étant
+            relevé par le serveur.
+    """
+    id_partie, état = client.créer_une_partie(idul, "")
+    partie = Quoridor(état["joueurs"], état["murs"], état["tour"])
+    coups = 0
+    réflexion = 0.0
+    gagnant = None
+    while coups < limite:
+        départ = time.perf_counter()
+        type_coup, position = partie.jouer_un_coup(idul, stratégie, temps)
+        réflexion += time.perf_counter() - départ
+        coups += 1
+        if enregistreur:
+            enregistreur.ajouter(type_coup, position)
+        try:
+            coup_adverse, position_adverse = client.appliquer_un_coup(
+                id_partie, type_coup, position, idul, "")
+        except StopIteration as fin:
+            gagnant = 0 if fin.value == idul else 1
+            break
+        partie.appliquer_un_coup(idul, position, type_coup)
+        partie.appliquer_un_coup(ServeurLocal.ADVERSAIRE, position_adverse, coup_adverse)
+        if enregistreur:
+            enregistreur.ajouter(coup_adverse, position_adverse)
+        coups += 1
+    if gagnant == 1:
+        # Le serveur ne renvoie pas la réponse de l'adversaire qui a fini la partie
+        coups += 1
+        if enregistreur:
+            partie.appliquer_un_coup(idul, position, type_coup)
+            _, état = client.récupérer_une_partie(id_partie, idul, "")
+            coup_final = déduire_coup(partie.état_partie(), état, 1)
+            if coup_final:
+                enregistreur.ajouter(*coup_final)
+            else:
+                gagnant = None
+    if enregistreur:
+        enregistreur.terminer(gagnant)
+    return {
+        "gagnant": gagnant,
+        "coups": coups,
+        "réflexion": réflexion,
+    }
+
+
+def _jouer(numéro, stratégie_a, stratégie_b, temps, serveur, enregistrement):
+    """Jouer la partie d'un tournoi et ramener le gagnant à A (0) ou B (1)."""
+    enregistreur = Enregistreur(enregistrement) if enregistrement else None
+    # A commence les parties paires, B les parties impaires
+    inversée = numéro % 2 == 1
+    stratégies = (stratégie_b, stratégie_a) if inversée else (stratégie_a, stratégie_b)
+    if serveur:
+        # Le joueur qui commence passe par le client de l'API, l'autre est le serveur
+        serveur_local = ServeurLocal(stratégie=stratégies[1], temps=temps)
+        client = ClientAPI(session=SessionLocale(serveur_local))
+        résultat = jouer_contre_serveur(client, stratégies[0], temps, enregistreur=enregistreur)
+        résultat["réflexion"] += serveur_local.réflexion
+    else:
+        résultat = jouer_une_partie(stratégies, temps, enregistreur=enregistreur)
+    if inversée and résultat["gagnant"] is not None:
+        résultat["gagnant"] = 1 - résultat["gagnant"]
+    return résultat
+
+
+def tournoi(stratégie_a, stratégie_b, parties, temps=0.1, processus=1, serveur=False,
+            enregistrement=None):
+    """Jouer une série de parties entre deux stratégies et en résumer les résultats.
+
+    Args:
+        stratégie_a (str): la première stratégie.
+        stratégie_b (str): la seconde stratégie.
+        parties (int): le nombre de parties.
+        temps (float, optionnel): le temps de réflexion par coup, en secondes.
+        processus (int, optionnel): le nombre de parties jouées en parallèle.
+        serveur (bool, optionnel): faire jouer le joueur qui commence à travers le
+            client de l'API, contre le serveur local.
+        enregistrement (str, optionnel): le fichier auquel ajouter les parties jouées.
+
+    Returns:
+        Dict: les victoires de A et de B, les parties nulles, la longueur moyenne et
+            médiane des parties, le débit de coups par seconde de réflexion et la
+            durée totale, en secondes.
+    """
+    début = time.perf_counter()
+    arguments = (range(parties), [stratégie_a] * parties, [stratégie_b] * parties,
+                 [temps] * parties, [serveur] * parties, [enregistrement] * parties)
+    if processus > 1:
+        with ProcessPoolExecutor(max_workers=processus) as exécuteur:
+            résultats = list(exécuteur.map(_jouer, *arguments))
+    else:
+        résultats = list(map(_jouer, *arguments))
+    durée = time.perf_counter() - début
+
+    longueurs = [résultat["coups"] for résultat in résultats]
+    réflexion = sum(résultat["réflexion"] for résultat in résultats)
+    return {
+        "parties": parties,
+        "victoires_a": sum(résultat["gagnant"] == 0 for résultat in résultats),
+        "victoires_b": sum(résultat["gagnant"] == 1 for résultat in résultats),
+        "nulles": sum(résultat["gagnant"] is None for résultat in résultats),
+        "longueur_moyenne": statistics.mean(longueurs) if longueurs else 0,
+        "longueur_médiane": statistics.median(longueurs) if longueurs else 0,
+        "coups_par_seconde": sum(longueurs) / réflexion if réflexion else 0.0,
+        "durée": durée,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="autojeu.py",
+                                     description="Parties entre joueurs automatiques")
+    parser.add_argument("-n", "--parties", type=int, default=100, help="Nombre de parties.")
+    parser.add_argument("-a", "--stratégie-a", choices=STRATÉGIES, default="alphabeta",
+                        help="Stratégie du joueur A.")
+    parser.add_argument("-b", "--stratégie-b", choices=STRATÉGIES, default="heuristique",
+                        help="Stratégie du joueur B.")
+    parser.add_argument("-t", "--temps", type=float, default=0.1,
+                        help="Temps de réflexion par coup, en secondes.")
+    parser.add_argument("-p", "--processus", type=int, default=1,
+                        help="Nombre de parties jouées en parallèle.")
+    parser.add_argument("-e", "--enregistrer", metavar="FICHIER",
+                        help="Ajouter les parties à ce fichier d'enregistrement.")
+    parser.add_argument("--serveur", action="store_true",
+                        help="Faire jouer le joueur qui commence à travers le client de l'API "
+                             "contre le serveur local.")
+    args = parser.parse_args()
+
+    bilan = tournoi(args.stratégie_a, args.stratégie_b, args.parties, args.temps,
+                    args.processus, args.serveur, args.enregistrer)
+    print(f"A ({args.stratégie_a}): {bilan['victoires_a']} victoires "
+          f"({100 * bilan['victoires_a'] / max(bilan['parties'], 1):.1f} %)")
+    print(f"B ({args.stratégie_b}): {bilan['victoires_b']} victoires "
+          f"({100 * bilan['victoires_b'] / max(bilan['parties'], 1):.1f} %)")
+    print(f"Nulles: {bilan['nulles']}")
+    print(f"Longueur des parties: {bilan['longueur_moyenne']:.1f} coups en moyenne, "
+          f"{bilan['longueur_médiane']} en médiane")
+    print(f"Débit: {bilan['coups_par_seconde']:.1f} coups par seconde de réflexion, "
+          f"{bilan['parties'] / bilan['durée']:.2f} parties par seconde")
@@ -0,0 +1,385 @@
+"""Module du banc d'essai des opérations critiques
+
+Chronomètre, une à une, les opérations dont dépend la vitesse du jeu sur un
+corpus reproductible de positions de milieu et de fin de partie: des
+positions issues d'une partie entre joueurs heuristiques et des positions
+aléatoires comptant beaucoup de murs, ou un corpus enregistré en JSON. Chaque
+mesure rapporte la médiane, le 99e centile et le débit en opérations par
+seconde; les résultats peuvent être sauvegardés puis comparés à une référence.
+Le temps de démarrage du client, qui importe main.py dans un nouvel
+interpréteur, est mesuré de la même façon, et les dépendances lourdes qu'il
+chargerait sont signalées comme une régression.
+
+    python banc_essai.py --sauvegarder référence.json
+    python banc_essai.py --comparer référence.json
+
+Functions:
+    * positions_enregistrées - Produire les positions d'une partie entre joueurs heuristiques.
+    * positions_aléatoires - Produire des positions aléatoires comptant beaucoup de murs.
+    * mesurer - Chronométrer chaque opération du banc d'essai.
+    * comparer - Comparer des mesures à une référence.
+    * modules_lourds_chargés - Relever les dépendances lourdes chargées par un module.
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from damier import BAS, Damier, case, coordonnées, position_mur, vider_caches
+from etat import ÉtatPartie
+from graphe import construire_graphe
+from legalite import murs_légaux
+from mcts import RechercheMonteCarlo
+from quoridor import Quoridor
+from quoridor_error import QuoridorError
+from recherche import Recherche
+
+# Dépendances lourdes qui ne doivent être chargées qu'à l'usage
+MODULES_LOURDS = ("asyncio", "networkx", "requests", "turtle")
+
+_DOSSIER = os.path.dirname(os.path.abspath(__file__))
+
+
+def _départ():
+    """Créer une partie à la position de départ."""
+    return Quoridor([
+        {"nom": "A", "murs": 10, "position": [5, 1]},
+        {"nom": "B", "murs": 10, "position": [5, 9]},
+    ])
+
+
+def positions_enregistrées(début=10):
+    """Produire les positions d'une partie entre deux joueurs heuristiques.
+
+    Args:
+        début (int, optionnel): le nombre de coups joués avant la première position retenue.
+
+    Returns:
+        List: les états des positions où le joueur A doit jouer.
+    """
+    partie = _départ()
+    positions = []
+    coups = 0
+    while not partie.partie_terminée() and coups < 200:
+        if coups >= début and coups % 2 == 0:
+            positions.append(partie.état_partie())
+        nom = "AB"[coups % 2]
+        type_coup, position = partie.jouer_un_coup(nom)
+        partie.appliquer_un_coup(nom, position, type_coup)
+        coups += 1
+    return positions
+
+
+def positions_aléatoires(nombre, graine=0, murs_min=8):
+    """Produire des positions aléatoires comptant beaucoup de murs.
+
+    Chaque partie alterne des murs légaux pris au hasard et des pas vers la ligne
+    d'arrivée; les positions où le joueur A doit jouer sont retenues dès que
+    murs_min murs sont posés.
+
+    Args:
+        nombre (int): le nombre de positions.
+        graine (int, optionnel): la graine du générateur aléatoire.
+        murs_min (int, optionnel): le nombre minimal de murs posés.
+
+    Returns:
+        List: les états des positions.
+    """
+    aléa = random.Random(graine)
+    positions = []
+    while len(positions) < nombre:
+        partie = _départ()
+        coups = 0
+        while not partie.partie_terminée() and len(positions) < nombre:
+            indice = coups % 2
+            nom = "AB"[indice]
+            damier = partie.damier()
+            murs = murs_légaux(damier) if partie.joueurs[indice]["murs"] else []
+            if murs and aléa.random() < 0.6:
+                orientation, x, y = aléa.choice(murs)
+                partie.placer_un_mur(nom, [x, y], orientation)
+            else:
+                distances = damier.carte_distances(indice)
+                voisins = ([s for s in damier.successeurs(indice) if distances[s] is not None]
+                           or damier.successeurs(indice))
+                if aléa.random() < 0.7:
+                    voisins = [min(voisins, key=distances.__getitem__)]
+                partie.déplacer_un_joueur(nom, list(coordonnées(aléa.choice(voisins))))
+            coups += 1
+            posés = len(partie.murs["horizontaux"]) + len(partie.murs["verticaux"])
+            if coups % 2 == 0 and posés >= murs_min and not partie.partie_terminée():
+                positions.append(partie.état_partie())
+    return positions
+
+
+def _partie(état):
+    """Créer une partie à partir d'un état."""
+    return Quoridor(état["joueurs"], état["murs"], état.get("tour", 1))
+
+
+def _placer_un_mur(corpus, aléa):
+    """Valider et placer des murs pris au hasard, légaux ou non."""
+    for état in corpus:
+        for _ in range(10):
+            orientation = aléa.choice(("MH", "MV"))
+            x, y = position_mur(orientation, aléa.randrange(64))
+            partie = _partie(état)
+
+            def placer(partie=partie, orientation=orientation, x=x, y=y):
+                try:
+                    partie.placer_un_mur("A", [x, y], orientation)
+                except QuoridorError:
+                    pass
+            yield placer
+
+
+def _déplacer_un_joueur(corpus, aléa):
+    """Valider et jouer des déplacements pris au hasard, légaux ou non."""
+    for état in corpus:
+        for _ in range(10):
+            position = [aléa.randint(1, 9), aléa.randint(1, 9)]
+            partie = _partie(état)
+
+            def déplacer(partie=partie, position=position):
+                try:
+                    partie.déplacer_un_joueur("A", position)
+                except QuoridorError:
+                    pass
+            yield déplacer
+
+
+def _construire_graphe(corpus, _):
+    """Construire le graphe networkx des déplacements."""
+    for état in corpus:
+        positions = [joueur["position"] for joueur in état["joueurs"]]
+        yield lambda positions=positions, murs=état["murs"]: construire_graphe(
+            positions, murs["horizontaux"], murs["verticaux"])
+
+
+def _distances(corpus, _):
+    """Calculer la longueur du plus court chemin de chaque joueur."""
+    for état in corpus:
+        damier = _partie(état).damier()
+        yield lambda damier=damier: (damier.distance(0), damier.distance(1))
+
+
+def _coups_légaux(corpus, _):
+    """Énumérer tous les coups légaux: déplacements et murs."""
+    for état in corpus:
+        partie = _partie(état)
+
+        def énumérer(partie=partie):
+            # Les cartes de distances sont mises en cache; on mesure le calcul à froid
+            vider_caches()
+            damier = Damier.depuis_listes(
+                [joueur["position"] for joueur in partie.joueurs],
+                partie.murs["horizontaux"], partie.murs["verticaux"])
+            return damier.successeurs(0), murs_légaux(damier)
+        yield énumérer
+
+
+def _menacée(état):
+    """Placer le jeton de B à un pas de sa ligne d'arrivée, pour que A doive le bloquer.
+
+    Returns:
+        Dict: l'état modifié, ou None si A n'a plus de murs ou si aucune case ne convient.
+    """
+    if not état["joueurs"][0]["murs"]:
+        return None
+    damier = _partie(état).damier()
+    for x in range(1, 10):
+        numéro = case(x, 2)
+        if numéro != damier.positions[0] and damier.est_ouvert(numéro, BAS):
+            joueurs = [dict(joueur) for joueur in état["joueurs"]]
+            joueurs[1]["position"] = [x, 2]
+            return {**état, "joueurs": joueurs}
+    return None
+
+
+def _coup_bloquant(corpus, _):
+    """Choisir un coup heuristique lorsque l'adversaire est à un pas de gagner.
+
+    La stratégie heuristique cherche alors le mur qui allonge le plus son chemin.
+    """
+    for état in filter(None, map(_menacée, corpus)):
+        partie = _partie(état)
+
+        def bloquer(partie=partie):
+            vider_caches()
+            return partie.jouer_un_coup("A", "heuristique")
+        yield bloquer
+
+
+def _heuristique(corpus, _):
+    """Choisir un coup avec la stratégie heuristique."""
+    for état in corpus:
+        partie = _partie(état)
+
+        def jouer(partie=partie):
+            vider_caches()
+            return partie.jouer_un_coup("A", "heuristique")
+        yield jouer
+
+
+def _recherche(corpus, _):
+    """Choisir un coup par une recherche alpha-bêta de profondeur 2."""
+    for état in corpus[:20]:
+        partie = _partie(état)
+        yield lambda partie=partie: Recherche(temps=60, profondeur_max=2).meilleur_coup(partie, 0)
+
+
+def _simulation_mcts(corpus, _):
+    """Jouer une simulation rapide de la recherche Monte-Carlo jusqu'à la fin de la partie."""
+    simuler = RechercheMonteCarlo(graine=0).simuler
+    for état in corpus:
+        yield lambda état=ÉtatPartie.depuis_état(état): simuler(état, 0)
+
+
+def _démarrage(_, __):
+    """Importer main.py dans un nouvel interpréteur, comme au lancement d'une partie."""
+    for _ in range(5):
+        yield lambda: subprocess.run([sys.executable, "-c", "import main"], cwd=_DOSSIER,
+                                     check=True)
+
+
+OPÉRATIONS = {
+    "placer_un_mur": _placer_un_mur,
+    "déplacer_un_joueur": _déplacer_un_joueur,
+    "construire_graphe": _construire_graphe,
+    "distances": _distances,
+    "coups_légaux": _coups_légaux,
+    "coup_bloquant": _coup_bloquant,
+    "jouer_un_coup_heuristique": _heuristique,
+    "recherche_profondeur_2": _recherche,
+    "simulation_mcts": _simulation_mcts,
+    "démarrage": _démarrage,
+}
+
+
+def mesurer(corpus, opérations=None, répétitions=3, graine=0):
+    """Chronométrer chaque opération du banc d'essai.
+
+    Chaque appel est chronométré séparément; sa préparation, comme la copie de la
+    partie qu'il modifie, ne l'est pas.
+
+    Args:
+        corpus (List): les états des positions.
+        opérations (Iterable, optionnel): les noms des opérations; toutes par défaut.
+        répétitions (int, optionnel): le nombre de passages sur le corpus.
+        graine (int, optionnel): la graine des coups tirés au hasard.
+
+    Returns:
+        Dict: pour chaque opération, le nombre d'appels, la médiane et le 99e
+            centile de leur durée en microsecondes et le débit en appels par seconde.
+    """
+    résultats = {}
+    for nom in opérations or OPÉRATIONS:
+        aléa = random.Random(graine)
+        durées = []
+        for _ in range(répétitions):
+            for appel in OPÉRATIONS[nom](corpus, aléa):
+                début = time.perf_counter()
+                appel()
+                durées.append(time.perf_counter() - début)
+        durées.sort()
+        résultats[nom] = {
+            "appels": len(durées),
+            "p50_us": 1e6 * durées[len(durées) // 2],
+            "p99_us": 1e6 * durées[min(len(durées) - 1, len(durées) * 99 // 100)],
+            "ops_par_s": len(durées) / sum(durées),
+        }
+    return résultats
+
+
+def comparer(résultats, référence, seuil=0.2):
+    """Comparer des mesures à une référence.
+
+    Args:
+        résultats (Dict): les mesures produites par mesurer.
+        référence (Dict): des mesures antérieures.
+        seuil (float, optionnel): l'allongement relatif de la médiane tenu pour
+            une régression.
+
+    Returns:
+        Dict: pour chaque opération mesurée des deux côtés, le rapport des médianes
+            (nouvelle sur ancienne) et s'il s'agit d'une régression.
+    """
+    return {
+        nom: {
+            "rapport": résultats[nom]["p50_us"] / référence[nom]["p50_us"],
+            "régression": résultats[nom]["p50_us"] > (1 + seuil) * référence[nom]["p50_us"],
+        }
+        for nom in résultats if nom in référence
+    }
+
+
+def modules_lourds_chargés(module="main"):
+    """Relever les dépendances lourdes chargées par l'importation d'un module.
+
+    Args:
+        module (str, optionnel): le module importé dans un nouvel interpréteur.
+
+    Returns:
+        List: les noms des modules de MODULES_LOURDS qui ont été chargés.
+    """
+    code = (f"import sys, {module}; "
+            f"print(*(nom for nom in {MODULES_LOURDS!r} if nom in sys.modules))")
+    sortie = subprocess.run([sys.executable, "-c", code], cwd=_DOSSIER, check=True,
+                            capture_output=True, text=True)
+    return sortie.stdout.split()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="banc_essai.py",
+                                     description="Banc d'essai des opérations critiques")
+    parser.add_argument("-o", "--opération", action="append", choices=sorted(OPÉRATIONS),
+                        help="Opération à mesurer (plusieurs permises); toutes par défaut.")
+    parser.add_argument("-n", "--positions", type=int, default=40,
+                        help="Nombre de positions aléatoires du corpus.")
+    parser.add_argument("-r", "--répétitions", type=int, default=3,
+                        help="Nombre de passages sur le corpus.")
+    parser.add_argument("--corpus", help="Fichier JSON d'états à utiliser comme corpus.")
+    parser.add_argument("--enregistrer-corpus", help="Fichier JSON où écrire le corpus.")
+    parser.add_argument("--sauvegarder", help="Fichier JSON où écrire les mesures.")
+    parser.add_argument("--comparer", help="Fichier JSON des mesures de référence.")
+    parser.add_argument("--seuil", type=float, default=0.2,
+                        help="Allongement relatif de la médiane tenu pour une régression.")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as fichier:
+            positions = json.load(fichier)
+    else:
+        positions = positions_enregistrées() + positions_aléatoires(args.positions)
+    if args.enregistrer_corpus:
+        with open(args.enregistrer_corpus, "w", encoding="utf-8") as fichier:
+            json.dump(positions, fichier, ensure_ascii=False)
+
+    mesures = mesurer(positions, args.opération, args.répétitions)
+    comparaison = {}
+    if args.comparer:
+        with open(args.comparer, encoding="utf-8") as fichier:
+            comparaison = comparer(mesures, json.load(fichier), args.seuil)
+
+    print(f"{len(positions)} positions")
+    print(f"{'opération':<28}{'appels':>8}{'p50 µs':>12}{'p99 µs':>12}{'ops/s':>12}")
+    for nom_opération, mesure in mesures.items():
+        ligne = (f"{nom_opération:<28}{mesure['appels']:>8}{mesure['p50_us']:>12.1f}"
+                 f"{mesure['p99_us']:>12.1f}{mesure['ops_par_s']:>12.0f}")
+        if nom_opération in comparaison:
+            écart = comparaison[nom_opération]
+            ligne += f"  x{écart['rapport']:.2f}{'  RÉGRESSION' if écart['régression'] else ''}"
+        print(ligne)
+
+    lourds = modules_lourds_chargés() if "démarrage" in mesures else []
+    if lourds:
+        print(f"RÉGRESSION: main.py charge au démarrage {', '.join(lourds)}")
+
+    if args.sauvegarder:
+        with open(args.sauvegarder, "w", encoding="utf-8") as fichier:
+            json.dump(mesures, fichier, ensure_ascii=False, indent=2)
+    if lourds or any(écart["régression"] for écart in comparaison.values()):
+        sys.exit(1)
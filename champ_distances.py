@@ -0,0 +1,142 @@
+"""Module des champs de distances vectorisés avec NumPy
+
+Calcule d'un seul coup la distance de chaque case à la ligne d'arrivée d'un
+joueur, par un parcours en largeur inverse sur un tableau d'adjacence, et
+évalue en lot l'effet de N murs candidats sur les distances des deux joueurs.
+
+Ce module dépend de NumPy; il n'est importé que par le code qui en a besoin.
+
+Functions:
+    * adjacence - Construire le tableau d'adjacence d'un damier.
+    * cartes_distances - Calculer les champs de distances d'un lot de damiers.
+    * carte_distances - Calculer le champ de distances d'un damier.
+    * distances_après_murs - Évaluer en lot les distances après chaque mur candidat.
+"""
+
+import numpy as np
+from damier import FERMETURES_H, FERMETURES_V, LIGNES_BUT, indice_mur
+
+
+def _booléens(masque):
+    """Convertir un ensemble de cases en tableau de 81 booléens."""
+    return np.array([masque >> numéro & 1 for numéro in range(81)], dtype=bool)
+
+
+LIGNES_BUT_NP = np.stack([_booléens(ligne) for ligne in LIGNES_BUT])
+
+# Sorties fermées par chacun des 128 murs: 0 à 63 horizontaux, 64 à 127 verticaux
+FERMETURES = np.zeros((128, 81, 4), dtype=bool)
+for _indice in range(64):
+    FERMETURES[_indice, :, 0] = _booléens(FERMETURES_H[_indice][0])
+    FERMETURES[_indice, :, 1] = _booléens(FERMETURES_H[_indice][1])
+    FERMETURES[64 + _indice, :, 2] = _booléens(FERMETURES_V[_indice][0])
+    FERMETURES[64 + _indice, :, 3] = _booléens(FERMETURES_V[_indice][1])
+
+
+def adjacence(damier):
+    """Construire le tableau d'adjacence d'un damier.
+
+    Args:
+        damier (Damier): le damier à convertir.
+
+    Returns:
+        ndarray: un tableau (81, 4) de booléens, vrai si l'on peut quitter la case
+            dans la direction HAUT, BAS, DROITE ou GAUCHE.
+    """
+    return np.stack([_booléens(ouverture) for ouverture in damier.ouvertures], axis=-1)
+
+
+def _étendre(frontière, haut, bas, droite, gauche):
+    """Calculer les cases voisines d'une frontière d'où l'on peut l'atteindre en un pas."""
+    suivantes = np.zeros_like(frontière)
+    suivantes[..., :-1, :] |= haut[..., :-1, :] & frontière[..., 1:, :]
+    suivantes[..., 1:, :] |= bas[..., 1:, :] & frontière[..., :-1, :]
+    suivantes[..., :, :-1] |= droite[..., :, :-1] & frontière[..., :, 1:]
+    suivantes[..., :, 1:] |= gauche[..., :, 1:] & frontière[..., :, :-1]
+    return suivantes
+
+
+def _directions(ouvert):
+    """Séparer un tableau d'adjacence (..., 81, 4) en quatre grilles (..., 9, 9)."""
+    grilles = ouvert.reshape(ouvert.shape[:-2] + (9, 9, 4))
+    return tuple(grilles[..., direction] for direction in range(4))
+
+
+def cartes_distances(ouvert, joueur):
+    """Calculer les champs de distances d'un lot de damiers.
+
+    Args:
+        ouvert (ndarray): un tableau (..., 81, 4) d'adjacence.
+        joueur (int): l'indice du joueur dont on vise la ligne d'arrivée (0 ou 1).
+
+    Returns:
+        ndarray: un tableau (..., 81) d'entiers, -1 pour les cases isolées de la ligne.
+    """
+    directions = _directions(ouvert)
+    forme = ouvert.shape[:-2] + (9, 9)
+    frontière = np.broadcast_to(LIGNES_BUT_NP[joueur].reshape(9, 9), forme).copy()
+    atteintes = frontière.copy()
+    # Chaque case compte les couches parcourues avant d'être atteinte
+    distances = np.zeros(forme, dtype=np.int16)
+    while frontière.any():
+        frontière = _étendre(frontière, *directions) & ~atteintes
+        distances += ~atteintes
+        atteintes |= frontière
+    distances[~atteintes] = -1
+    return distances.reshape(ouvert.shape[:-1])
+
+
+def carte_distances(damier, joueur):
+    """Calculer le champ de distances d'un damier pour un joueur.
+
+    Args:
+        damier (Damier): le damier à analyser.
+        joueur (int): l'indice du joueur (0 ou 1).
+
+    Returns:
+        ndarray: les 81 distances à la ligne d'arrivée, -1 pour les cases isolées.
+    """
+    return cartes_distances(adjacence(damier), joueur)
+
+
+def distances_après_murs(damier, murs):
+    """Évaluer en lot les distances des deux joueurs après chaque mur candidat.
+
+    Les parcours des deux joueurs pour tous les murs avancent ensemble, couche par
+    couche, et s'arrêtent dès que chaque jeton a été atteint. Les murs ne sont pas
+    validés: un mur qui chevauche un mur posé est évalué comme s'il fermait les
+    mêmes passages.
+
+    Args:
+        damier (Damier): le damier de départ.
+        murs (Iterable): les murs candidats, sous forme de tuples (orientation, x, y).
+
+    Returns:
+        ndarray: un tableau (N, 2) des longueurs des plus courts chemins des joueurs
+            1 et 2 après chaque mur, -1 si le mur enferme le joueur.
+    """
+    numéros = np.array([indice_mur(orientation, x, y) + (64 if orientation == "MV" else 0)
+                        for orientation, x, y in murs], dtype=np.intp)
+    directions = _directions(adjacence(damier)[None] & ~FERMETURES[numéros])
+    directions = tuple(grille[None] for grille in directions)
+
+    # Lot (2, N, 9, 9): un parcours par joueur et par mur
+    frontière = np.broadcast_to(LIGNES_BUT_NP.reshape(2, 1, 9, 9),
+                                (2, len(numéros), 9, 9)).copy()
+    atteintes = frontière.copy()
+    lignes = np.array([numéro // 9 for numéro in damier.positions]).reshape(2, 1)
+    colonnes = np.array([numéro % 9 for numéro in damier.positions]).reshape(2, 1)
+    joueurs = np.arange(2).reshape(2, 1)
+    lots = np.arange(len(numéros)).reshape(1, -1)
+
+    résultat = np.full((2, len(numéros)), -1, dtype=np.int16)
+    distance = 0
+    while True:
+        arrivées = atteintes[joueurs, lots, lignes, colonnes] & (résultat < 0)
+        résultat[arrivées] = distance
+        if not frontière.any() or (résultat >= 0).all():
+            break
+        frontière = _étendre(frontière, *directions) & ~atteintes
+        atteintes |= frontière
+        distance += 1
+    return résultat.T
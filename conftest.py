@@ -0,0 +1,41 @@
+"""Configuration commune des tests
+
+Fournit un corpus reproductible de positions: des parties où chaque joueur pose
+au hasard un mur légal ou fait un pas au hasard, dont chaque position est
+retenue.
+"""
+
+import random
+import pytest
+from autojeu import nouvelle_partie
+from damier import coordonnées
+from legalite import murs_légaux
+
+# Nombre de parties jouées pour constituer le corpus
+PARTIES = 30
+
+
+@pytest.fixture(scope="session")
+def positions():
+    """Produire les états (format de état_partie) et le trait de positions aléatoires."""
+    aléa = random.Random(2025)
+    résultat = []
+    for _ in range(PARTIES):
+        partie = nouvelle_partie()
+        trait = 0
+        while not partie.partie_terminée():
+            résultat.append((partie.état_partie(), trait))
+            nom = "AB"[trait]
+            damier = partie.damier()
+            murs = murs_légaux(damier) if partie.joueurs[trait]["murs"] else []
+            if murs and aléa.random() < 0.4:
+                orientation, x, y = aléa.choice(murs)
+                partie.placer_un_mur(nom, [x, y], orientation)
+            else:
+                distances = damier.carte_distances(trait)
+                voisins = damier.successeurs(trait)
+                if aléa.random() < 0.6:
+                    voisins = [min(voisins, key=lambda s: distances[s])]
+                partie.déplacer_un_joueur(nom, list(coordonnées(aléa.choice(voisins))))
+            trait = 1 - trait
+    return résultat
@@ -0,0 +1,398 @@
+"""Module du damier compact du jeu Quoridor
+
+Représente le damier par des entiers utilisés comme ensembles de bits, afin de
+valider les coups sans construire de graphe networkx.
+
+Les 81 cases sont numérotées de 0 à 80 avec case = (y - 1) * 9 + (x - 1), et un
+ensemble de cases est un entier dont le bit i vaut 1 si la case i en fait partie.
+Les murs sont conservés dans deux masques de 64 bits, un par orientation:
+
+    * mur horizontal [x, y] (1 <= x <= 8, 2 <= y <= 9): bit (y - 2) * 8 + (x - 1)
+    * mur vertical [x, y] (2 <= x <= 9, 1 <= y <= 8): bit (y - 1) * 8 + (x - 2)
+
+Comme dans les règles du jeu, les jetons ne bloquent pas les chemins: seuls les
+murs sont pris en compte par les requêtes de chemin et de distance.
+
+Des tables précalculées relient murs et passages entre cases: les sorties de
+cases que ferme chaque mur (FERMETURES_H, FERMETURES_V), les murs qui coupent
+chaque sortie (COUPURES_HAUT, COUPURES_DROITE) et les emplacements qu'occupe
+ou croise chaque mur (CONFLITS_H, CONFLITS_V).
+
+Classes:
+    * Damier - Damier compact avec les requêtes de déplacement et de chemin.
+
+Functions:
+    * case - Convertir une position [x, y] en numéro de case.
+    * coordonnées - Convertir un numéro de case en position [x, y].
+    * mur_valide - Vérifier qu'une position de mur est sur le damier.
+    * indice_mur - Convertir une position de mur en numéro de bit.
+    * position_mur - Convertir un numéro de bit en position de mur.
+    * énumérer_bits - Énumérer les numéros des bits à 1 d'un masque.
+    * code_coup - Convertir un coup en code d'un octet.
+    * coup_du_code - Convertir un code d'un octet en coup.
+    * vider_caches - Oublier les cartes de distances mémorisées.
+"""
+
+from functools import lru_cache
+
+HAUT, BAS, DROITE, GAUCHE = range(4)
+DÉCALAGES = (9, -9, 1, -1)
+PERPENDICULAIRES = ((DROITE, GAUCHE), (DROITE, GAUCHE), (HAUT, BAS), (HAUT, BAS))
+
+
+def case(x, y):
+    """Convertir une position [x, y] en numéro de case (0 à 80)."""
+    return (y - 1) * 9 + (x - 1)
+
+
+def coordonnées(numéro):
+    """Convertir un numéro de case en position [x, y]."""
+    return [numéro % 9 + 1, numéro // 9 + 1]
+
+
+def mur_valide(orientation, x, y):
+    """Vérifier qu'un mur de cette orientation peut être posé en [x, y].
+
+    Args:
+        orientation (str): l'orientation du mur ('MH' ou 'MV').
+        x (int): la colonne du mur.
+        y (int): la ligne du mur.
+
+    Returns:
+        bool: True si le mur ne dépasse pas du damier.
+    """
+    if orientation == "MH":
+        return 1 <= x <= 8 and 2 <= y <= 9
+    if orientation == "MV":
+        return 2 <= x <= 9 and 1 <= y <= 8
+    return False
+
+
+def indice_mur(orientation, x, y):
+    """Convertir une position de mur valide en numéro de bit (0 à 63)."""
+    if orientation == "MH":
+        return (y - 2) * 8 + (x - 1)
+    return (y - 1) * 8 + (x - 2)
+
+
+def position_mur(orientation, indice):
+    """Convertir un numéro de bit (0 à 63) en position [x, y] de mur."""
+    if orientation == "MH":
+        return [indice % 8 + 1, indice // 8 + 2]
+    return [indice % 8 + 2, indice // 8 + 1]
+
+
+def énumérer_bits(masque):
+    """Énumérer, en ordre croissant, les numéros des bits à 1 d'un masque."""
+    while masque:
+        bit = masque & -masque
+        yield bit.bit_length() - 1
+        masque ^= bit
+
+
+def code_coup(type_coup, position):
+    """Convertir un coup en code d'un octet.
+
+    Les codes 0 à 80 désignent un déplacement vers la case de même numéro, 81 à 144
+    un mur horizontal et 145 à 208 un mur vertical, selon leur numéro de bit.
+
+    Args:
+        type_coup (str): le type de coup ('D' ou 'M').
+        position (List): [x, y] pour un déplacement, [x, y, orientation] pour un mur.
+
+    Returns:
+        int: le code du coup, de 0 à 208.
+    """
+    if type_coup == "D":
+        return case(*position[:2])
+    x, y, orientation = position
+    return (81 if orientation == "MH" else 145) + indice_mur(orientation, x, y)
+
+
+def coup_du_code(code):
+    """Convertir un code d'un octet en coup (type_coup, position)."""
+    if code < 81:
+        return "D", coordonnées(code)
+    orientation = "MH" if code < 145 else "MV"
+    return "M", position_mur(orientation, code - (81 if code < 145 else 145)) + [orientation]
+
+
+def _masque(*positions):
+    """Construire l'ensemble de bits des cases [x, y] données."""
+    résultat = 0
+    for x, y in positions:
+        résultat |= 1 << case(x, y)
+    return résultat
+
+
+_CASES = [(x, y) for y in range(1, 10) for x in range(1, 10)]
+
+# Cases depuis lesquelles un déplacement dans chaque direction reste sur le damier
+BORDS = (
+    _masque(*((x, y) for x, y in _CASES if y < 9)),
+    _masque(*((x, y) for x, y in _CASES if y > 1)),
+    _masque(*((x, y) for x, y in _CASES if x < 9)),
+    _masque(*((x, y) for x, y in _CASES if x > 1)),
+)
+
+# Lignes d'arrivée du joueur 1 (y = 9) et du joueur 2 (y = 1)
+LIGNES_BUT = (
+    _masque(*((x, 9) for x in range(1, 10))),
+    _masque(*((x, 1) for x in range(1, 10))),
+)
+
+# Pour chaque mur horizontal, les cases dont il ferme la sortie vers le haut et vers le bas
+FERMETURES_H = tuple(
+    (_masque((x, y - 1), (x + 1, y - 1)), _masque((x, y), (x + 1, y)))
+    for x, y in (position_mur("MH", indice) for indice in range(64))
+)
+
+# Pour chaque mur vertical, les cases dont il ferme la sortie vers la droite et vers la gauche
+FERMETURES_V = tuple(
+    (_masque((x - 1, y), (x - 1, y + 1)), _masque((x, y), (x, y + 1)))
+    for x, y in (position_mur("MV", indice) for indice in range(64))
+)
+
+# Pour chaque case, les murs horizontaux qui coupent sa sortie vers le haut et les
+# murs verticaux qui coupent sa sortie vers la droite: la sortie vers le bas d'une
+# case est la sortie vers le haut de la case du dessous, et de même à gauche
+COUPURES_HAUT = tuple(
+    sum(1 << indice for indice in range(64) if FERMETURES_H[indice][0] >> numéro & 1)
+    for numéro in range(81)
+)
+COUPURES_DROITE = tuple(
+    sum(1 << indice for indice in range(64) if FERMETURES_V[indice][0] >> numéro & 1)
+    for numéro in range(81)
+)
+
+
+def _conflits(orientation, indice):
+    """Calculer les emplacements (horizontaux, verticaux) qu'un mur rend indisponibles."""
+    x, y = position_mur(orientation, indice)
+    if orientation == "MH":
+        voisins = [indice] + [indice - 1] * (x > 1) + [indice + 1] * (x < 8)
+        return sum(1 << voisin for voisin in voisins), 1 << indice
+    voisins = [indice] + [indice - 8] * (y > 1) + [indice + 8] * (y < 8)
+    return 1 << indice, sum(1 << voisin for voisin in voisins)
+
+
+# Pour chaque mur, les masques des emplacements horizontaux et verticaux où un autre
+# mur le chevaucherait ou le croiserait, lui-même compris
+CONFLITS_H = tuple(_conflits("MH", indice) for indice in range(64))
+CONFLITS_V = tuple(_conflits("MV", indice) for indice in range(64))
+
+
+def _ouvertures(murs_h, murs_v):
+    """Calculer, pour chaque direction, les cases d'où l'on peut sortir dans ce sens."""
+    haut, bas, droite, gauche = BORDS
+    for indice in énumérer_bits(murs_h):
+        fermeture_haut, fermeture_bas = FERMETURES_H[indice]
+        haut &= ~fermeture_haut
+        bas &= ~fermeture_bas
+    for indice in énumérer_bits(murs_v):
+        fermeture_droite, fermeture_gauche = FERMETURES_V[indice]
+        droite &= ~fermeture_droite
+        gauche &= ~fermeture_gauche
+    return haut, bas, droite, gauche
+
+
+def _propager(ensemble, ouvertures):
+    """Ajouter à un ensemble de cases tous leurs voisins accessibles."""
+    haut, bas, droite, gauche = ouvertures
+    return (ensemble
+            | (ensemble & haut) << 9 | (ensemble & bas) >> 9
+            | (ensemble & droite) << 1 | (ensemble & gauche) >> 1)
+
+
+@lru_cache(maxsize=4096)
+def _carte_distances(murs_h, murs_v, joueur):
+    """Calculer par un parcours en largeur inverse les distances à la ligne d'arrivée."""
+    ouvertures = _ouvertures(murs_h, murs_v)
+    distances = [None] * 81
+    frontière = atteintes = LIGNES_BUT[joueur]
+    distance = 0
+    while frontière:
+        for numéro in énumérer_bits(frontière):
+            distances[numéro] = distance
+        frontière = _propager(frontière, ouvertures) & ~atteintes
+        atteintes |= frontière
+        distance += 1
+    return tuple(distances)
+
+
+def vider_caches():
+    """Oublier les cartes de distances mémorisées, par exemple pour une mesure à froid."""
+    _carte_distances.cache_clear()
+
+
+class Damier:
+    """Damier compact du jeu Quoridor.
+
+    Attributes:
+        positions (Tuple): les numéros de case des jetons des deux joueurs.
+        murs_h (int): le masque des murs horizontaux.
+        murs_v (int): le masque des murs verticaux.
+        ouvertures (Tuple): pour chaque direction (HAUT, BAS, DROITE, GAUCHE),
+            l'ensemble des cases dont la sortie dans ce sens n'est pas bloquée.
+    """
+
+    __slots__ = ("positions", "murs_h", "murs_v", "ouvertures")
+
+    def __init__(self, positions, murs_h=0, murs_v=0, ouvertures=None):
+        """Constructeur de la classe Damier.
+
+        Args:
+            positions (Iterable): les numéros de case des jetons des deux joueurs.
+            murs_h (int, optionnel): le masque des murs horizontaux.
+            murs_v (int, optionnel): le masque des murs verticaux.
+            ouvertures (Tuple, optionnel): les ouvertures déjà calculées pour ces murs.
+        """
+        self.positions = tuple(positions)
+        self.murs_h = murs_h
+        self.murs_v = murs_v
+        self.ouvertures = ouvertures or _ouvertures(murs_h, murs_v)
+
+    @classmethod
+    def depuis_listes(cls, positions, murs_horizontaux, murs_verticaux):
+        """Construire un damier à partir des listes utilisées par la classe Quoridor.
+
+        Args:
+            positions (List): une liste des positions [x, y] des joueurs.
+            murs_horizontaux (List): une liste des positions [x, y] des murs horizontaux.
+            murs_verticaux (List): une liste des positions [x, y] des murs verticaux.
+
+        Returns:
+            Damier: le damier correspondant.
+        """
+        murs_h = 0
+        for x, y in murs_horizontaux:
+            murs_h |= 1 << indice_mur("MH", x, y)
+        murs_v = 0
+        for x, y in murs_verticaux:
+            murs_v |= 1 << indice_mur("MV", x, y)
+        return cls((case(x, y) for x, y in positions), murs_h, murs_v)
+
+    def avec_mur(self, orientation, x, y):
+        """Produire un nouveau damier auquel on a ajouté un mur.
+
+        Args:
+            orientation (str): l'orientation du mur ('MH' ou 'MV').
+            x (int): la colonne du mur.
+            y (int): la ligne du mur.
+
+        Returns:
+            Damier: le nouveau damier; celui-ci n'est pas modifié.
+        """
+        indice = indice_mur(orientation, x, y)
+        haut, bas, droite, gauche = self.ouvertures
+        if orientation == "MH":
+            fermeture_haut, fermeture_bas = FERMETURES_H[indice]
+            return Damier(self.positions, self.murs_h | 1 << indice, self.murs_v,
+                          (haut & ~fermeture_haut, bas & ~fermeture_bas, droite, gauche))
+        fermeture_droite, fermeture_gauche = FERMETURES_V[indice]
+        return Damier(self.positions, self.murs_h, self.murs_v | 1 << indice,
+                      (haut, bas, droite & ~fermeture_droite, gauche & ~fermeture_gauche))
+
+    def chevauche(self, orientation, x, y):
+        """Vérifier qu'un mur chevaucherait ou croiserait un mur déjà posé.
+
+        Un mur horizontal [x, y] et le mur vertical [x + 1, y - 1] se croisent en
+        leur milieu et partagent donc le même numéro de bit.
+
+        Args:
+            orientation (str): l'orientation du mur ('MH' ou 'MV').
+            x (int): la colonne du mur.
+            y (int): la ligne du mur.
+
+        Returns:
+            bool: True si le mur ne peut pas être posé à cause d'un autre mur.
+        """
+        conflits_h, conflits_v = (CONFLITS_H if orientation == "MH"
+                                  else CONFLITS_V)[indice_mur(orientation, x, y)]
+        return bool(self.murs_h & conflits_h or self.murs_v & conflits_v)
+
+    def est_ouvert(self, numéro, direction):
+        """Vérifier que l'on peut quitter la case dans la direction donnée."""
+        return self.ouvertures[direction] >> numéro & 1 == 1
+
+    def successeurs(self, joueur):
+        """Énumérer les cases où le jeton d'un joueur peut se déplacer.
+
+        Les sauts par-dessus le jeton adverse, en ligne droite ou en diagonale
+        lorsqu'un mur ou le bord empêche le saut en ligne droite, sont inclus.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+
+        Returns:
+            List: les numéros des cases accessibles en un coup.
+        """
+        moi = self.positions[joueur]
+        lui = self.positions[1 - joueur]
+        résultat = []
+        for direction in range(4):
+            if not self.est_ouvert(moi, direction):
+                continue
+            voisin = moi + DÉCALAGES[direction]
+            if voisin != lui:
+                résultat.append(voisin)
+            elif self.est_ouvert(lui, direction):
+                résultat.append(lui + DÉCALAGES[direction])
+            else:
+                for côté in PERPENDICULAIRES[direction]:
+                    if self.est_ouvert(lui, côté):
+                        résultat.append(lui + DÉCALAGES[côté])
+        return résultat
+
+    def distance(self, joueur, départ=None):
+        """Calculer la longueur du plus court chemin d'un joueur vers sa ligne d'arrivée.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+            départ (int, optionnel): la case de départ, par défaut celle du jeton.
+
+        Returns:
+            int: le nombre de déplacements, ou None s'il n'existe aucun chemin.
+        """
+        atteintes = 1 << (self.positions[joueur] if départ is None else départ)
+        but = LIGNES_BUT[joueur]
+        distance = 0
+        while not atteintes & but:
+            suivantes = _propager(atteintes, self.ouvertures)
+            if suivantes == atteintes:
+                return None
+            atteintes = suivantes
+            distance += 1
+        return distance
+
+    def a_un_chemin(self, joueur):
+        """Vérifier qu'un joueur peut encore atteindre sa ligne d'arrivée."""
+        return self.distance(joueur) is not None
+
+    def carte_distances(self, joueur):
+        """Calculer la distance de chaque case à la ligne d'arrivée d'un joueur.
+
+        Comme ces distances ne dépendent que des murs, elles sont mémorisées pour les
+        dernières combinaisons de murs rencontrées.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+
+        Returns:
+            Tuple: les 81 distances, None pour les cases isolées de la ligne.
+        """
+        return _carte_distances(self.murs_h, self.murs_v, joueur)
+
+    def en_graphe(self):
+        """Construire le graphe networkx équivalent, pour le débogage seulement.
+
+        Returns:
+            DiGraph: le graphe produit par graphe.construire_graphe.
+        """
+        from graphe import construire_graphe  # pylint: disable=import-outside-toplevel
+
+        return construire_graphe(
+            [coordonnées(numéro) for numéro in self.positions],
+            [position_mur("MH", indice) for indice in énumérer_bits(self.murs_h)],
+            [position_mur("MV", indice) for indice in énumérer_bits(self.murs_v)],
+        )
@@ -0,0 +1,188 @@
+"""Module d'enregistrement et de relecture des parties
+
+Chaque coup tient sur un octet, son code damier.code_coup; une partie est la
+suite des codes de ses coups, depuis la position de départ, terminée par un
+octet de fin qui indique le gagnant. Le fichier commence par la signature
+SIGNATURE, puis les parties se suivent. Une partie est conservée en mémoire
+jusqu'à sa fin, puis ajoutée au fichier en une seule écriture, ce qui permet
+à plusieurs processus d'enregistrer dans le même fichier.
+
+La lecture se fait par blocs: les parties sont produites une à une par un
+générateur, sans charger le fichier en mémoire.
+
+    for partie, joueur, type_coup, position in rejouer("parties.bin"):
+        ...
+
+Classes:
+    * PartieEnregistrée - Coups et gagnant d'une partie lue.
+    * Enregistreur - Ajout de parties à un fichier.
+
+Functions:
+    * déduire_coup - Retrouver le coup qui fait passer d'un état à un autre.
+    * lire_parties - Produire une à une les parties d'un fichier.
+    * rejouer - Rejouer les parties d'un fichier dans le moteur de jeu.
+"""
+
+import os
+import re
+from collections import namedtuple
+from damier import code_coup, coup_du_code
+from quoridor import Quoridor
+
+SIGNATURE = b"QPAR"
+
+# Octets de fin de partie: victoire du premier joueur, du second, ou partie inachevée
+FIN_VICTOIRE = (253, 254)
+FIN_INACHEVÉE = 255
+
+_FINS = re.compile(rb"[\xfd-\xff]")
+
+PartieEnregistrée = namedtuple("PartieEnregistrée", ["coups", "gagnant"])
+PartieEnregistrée.__doc__ = """Coups et gagnant d'une partie lue.
+
+Attributes:
+    coups (List): les coups (type_coup, position) dans l'ordre où ils ont été joués.
+    gagnant (int): l'indice du gagnant (0 ou 1), ou None si la partie est inachevée.
+"""
+
+
+class Enregistreur:
+    """Ajout de parties à un fichier d'enregistrement.
+
+    Attributes:
+        chemin (str): le fichier des parties.
+        coups (bytearray): les codes des coups de la partie en cours.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe Enregistreur.
+
+        Args:
+            chemin (str): le fichier des parties; il est créé s'il n'existe pas.
+        """
+        self.chemin = chemin
+        self.coups = bytearray()
+        # Plusieurs processus peuvent créer le fichier ensemble: seul celui qui le crée
+        # effectivement écrit la signature
+        try:
+            descripteur = os.open(chemin, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        try:
+            os.write(descripteur, SIGNATURE)
+        finally:
+            os.close(descripteur)
+
+    def ajouter(self, type_coup, position):
+        """Ajouter un coup à la partie en cours.
+
+        Args:
+            type_coup (str): le type de coup ('D' pour déplacement, 'M' pour mur).
+            position (list): [x, y] pour un déplacement, [x, y, orientation] pour un mur.
+        """
+        self.coups.append(code_coup(type_coup, position))
+
+    def terminer(self, gagnant=None):
+        """Écrire la partie en cours à la fin du fichier et en commencer une nouvelle.
+
+        Args:
+            gagnant (int, optionnel): l'indice du gagnant (0 ou 1); None si la partie
+                est inachevée.
+        """
+        self.coups.append(FIN_INACHEVÉE if gagnant is None else FIN_VICTOIRE[gagnant])
+        descripteur = os.open(self.chemin, os.O_WRONLY | os.O_APPEND)
+        try:
+            os.write(descripteur, self.coups)
+        finally:
+            os.close(descripteur)
+        self.coups = bytearray()
+
+
+def déduire_coup(avant, après, joueur):
+    """Retrouver le coup d'un joueur qui fait passer d'un état de partie à un autre.
+
+    Args:
+        avant (Dict): l'état précédent, au format de état_partie.
+        après (Dict): l'état suivant.
+        joueur (int): l'indice du joueur qui a joué (0 ou 1).
+
+    Returns:
+        tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position,
+            ou None si les états ne diffèrent pas d'un seul coup de ce joueur.
+    """
+    position = après["joueurs"][joueur]["position"]
+    if position != avant["joueurs"][joueur]["position"]:
+        return "D", list(position)
+    for orientation, clé in (("MH", "horizontaux"), ("MV", "verticaux")):
+        nouveaux = [mur for mur in après["murs"][clé] if mur not in avant["murs"][clé]]
+        if len(nouveaux) == 1:
+            return "M", list(nouveaux[0]) + [orientation]
+    return None
+
+
+def lire_parties(chemin, taille_bloc=1 << 16):
+    """Produire une à une les parties d'un fichier, en le lisant par blocs.
+
+    Une partie dont l'octet de fin manque, parce que son écriture a été
+    interrompue, est ignorée.
+
+    Args:
+        chemin (str): le fichier des parties.
+        taille_bloc (int, optionnel): la taille des lectures, en octets.
+
+    Yields:
+        PartieEnregistrée: les coups et le gagnant de chaque partie.
+
+    Raises:
+        ValueError: Le fichier n'est pas un fichier de parties.
+    """
+    with open(chemin, "rb") as fichier:
+        if fichier.read(len(SIGNATURE)) != SIGNATURE:
+            raise ValueError(f"Le fichier {chemin} n'est pas un fichier de parties.")
+        reste = b""
+        while True:
+            bloc = fichier.read(taille_bloc)
+            if not bloc:
+                return
+            tampon = reste + bloc
+            début = 0
+            for fin in _FINS.finditer(tampon):
+                octet = fin.group()[0]
+                gagnant = None if octet == FIN_INACHEVÉE else FIN_VICTOIRE.index(octet)
+                yield PartieEnregistrée(
+                    [coup_du_code(code) for code in tampon[début:fin.start()]], gagnant)
+                début = fin.end()
+            reste = tampon[début:]
+
+
+def rejouer(chemin, valider=False):
+    """Rejouer les parties d'un fichier dans le moteur de jeu.
+
+    Chaque partie est jouée sur une nouvelle instance de Quoridor, à partir de la
+    position de départ. La partie produite est celle d'avant le coup; elle est
+    modifiée en place dès que l'itération reprend et ne doit donc pas être
+    conservée telle quelle.
+
+    Args:
+        chemin (str): le fichier des parties.
+        valider (bool, optionnel): appliquer les coups avec appliquer_un_coup, qui
+            vérifie leur légalité, plutôt qu'avec push_move.
+
+    Yields:
+        tuple: la partie, l'indice du joueur qui joue, le type de coup et la position.
+
+    Raises:
+        QuoridorError: Un coup est illégal (seulement si valider est vrai).
+    """
+    for enregistrée in lire_parties(chemin):
+        partie = Quoridor([
+            {"nom": "1", "murs": 10, "position": [5, 1]},
+            {"nom": "2", "murs": 10, "position": [5, 9]},
+        ])
+        for numéro, (type_coup, position) in enumerate(enregistrée.coups):
+            joueur = numéro % 2
+            yield partie, joueur, type_coup, position
+            if valider:
+                partie.appliquer_un_coup(str(joueur + 1), position, type_coup)
+            else:
+                partie.push_move(joueur, type_coup, position)
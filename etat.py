@@ -0,0 +1,189 @@
+"""Module de l'état compact et immuable d'une partie
+
+Un ÉtatPartie tient en quelques entiers: la case de chaque jeton, un masque de
+64 bits par orientation de murs (voir damier), les murs restants et le tour.
+Il est immuable et hachable, ce qui permet de le placer dans un ensemble ou
+de l'utiliser comme clé de dictionnaire; jouer un coup produit un nouvel état
+qui partage les noms des joueurs et les masques inchangés avec le précédent.
+Un état se convertit vers et depuis le dictionnaire de l'API, ou une partie
+Quoridor.
+
+Classes:
+    * ÉtatPartie - État compact et immuable d'une partie.
+"""
+
+from damier import Damier, case, coordonnées, indice_mur, position_mur, énumérer_bits
+from quoridor import Quoridor
+import zobrist
+
+
+class ÉtatPartie:
+    """État compact et immuable d'une partie.
+
+    Attributes:
+        noms (tuple): les noms des deux joueurs.
+        cases (tuple): les numéros des cases des deux jetons.
+        murs_h (int): le masque des murs horizontaux.
+        murs_v (int): le masque des murs verticaux.
+        restants (tuple): le nombre de murs restants de chaque joueur.
+        tour (int): le tour du jeu.
+    """
+
+    __slots__ = ("noms", "cases", "murs_h", "murs_v", "restants", "tour")
+
+    def __init__(self, noms, cases, murs_h=0, murs_v=0, restants=(10, 10), tour=1):
+        """Constructeur de la classe ÉtatPartie.
+
+        Args:
+            noms (tuple): les noms des deux joueurs.
+            cases (tuple): les numéros des cases des deux jetons.
+            murs_h (int, optionnel): le masque des murs horizontaux.
+            murs_v (int, optionnel): le masque des murs verticaux.
+            restants (tuple, optionnel): le nombre de murs restants de chaque joueur.
+            tour (int, optionnel): le tour du jeu.
+        """
+        for nom, valeur in zip(self.__slots__, (tuple(noms), tuple(cases), murs_h, murs_v,
+                                                tuple(restants), tour)):
+            object.__setattr__(self, nom, valeur)
+
+    def __setattr__(self, nom, valeur):
+        raise AttributeError("Un ÉtatPartie ne peut pas être modifié.")
+
+    def __delattr__(self, nom):
+        raise AttributeError("Un ÉtatPartie ne peut pas être modifié.")
+
+    def _champs(self):
+        return (self.noms, self.cases, self.murs_h, self.murs_v, self.restants, self.tour)
+
+    def __eq__(self, autre):
+        if not isinstance(autre, ÉtatPartie):
+            return NotImplemented
+        return self._champs() == autre._champs()
+
+    def __hash__(self):
+        return hash(self._champs())
+
+    def __reduce__(self):
+        return ÉtatPartie, self._champs()
+
+    def __repr__(self):
+        return (f"ÉtatPartie(noms={self.noms}, cases={self.cases}, murs_h={self.murs_h:#x}, "
+                f"murs_v={self.murs_v:#x}, restants={self.restants}, tour={self.tour})")
+
+    @classmethod
+    def depuis_état(cls, état):
+        """Créer un état compact à partir d'un état au format de l'API.
+
+        Args:
+            état (Dict): un dictionnaire comportant les clés 'joueurs', 'murs' et,
+                optionnellement, 'tour', comme celui produit par état_partie.
+
+        Returns:
+            ÉtatPartie: l'état compact correspondant.
+        """
+        joueurs, murs = état["joueurs"], état["murs"]
+        murs_h = 0
+        for x, y in murs["horizontaux"]:
+            murs_h |= 1 << indice_mur("MH", x, y)
+        murs_v = 0
+        for x, y in murs["verticaux"]:
+            murs_v |= 1 << indice_mur("MV", x, y)
+        return cls(
+            (joueurs[0]["nom"], joueurs[1]["nom"]),
+            (case(*joueurs[0]["position"]), case(*joueurs[1]["position"])),
+            murs_h, murs_v,
+            (joueurs[0]["murs"], joueurs[1]["murs"]),
+            état.get("tour", 1),
+        )
+
+    @classmethod
+    def depuis_partie(cls, partie):
+        """Créer un état compact à partir d'une partie Quoridor."""
+        return cls.depuis_état({"joueurs": partie.joueurs, "murs": partie.murs,
+                                "tour": partie.tour})
+
+    def en_état(self):
+        """Produire l'état au format de l'API.
+
+        Returns:
+            Dict: un dictionnaire de même forme que celui produit par état_partie.
+        """
+        return {
+            "tour": self.tour,
+            "joueurs": [
+                {"nom": nom, "murs": murs, "position": coordonnées(numéro)}
+                for nom, murs, numéro in zip(self.noms, self.restants, self.cases)
+            ],
+            "murs": {
+                "horizontaux": [position_mur("MH", i) for i in énumérer_bits(self.murs_h)],
+                "verticaux": [position_mur("MV", i) for i in énumérer_bits(self.murs_v)],
+            },
+        }
+
+    def en_partie(self):
+        """Produire une partie Quoridor dans cet état."""
+        état = self.en_état()
+        return Quoridor(état["joueurs"], état["murs"], état["tour"])
+
+    def damier(self):
+        """Produire le damier compact de cet état."""
+        return Damier(self.cases, self.murs_h, self.murs_v)
+
+    def a_un_mur(self, orientation, x, y):
+        """Vérifier qu'un mur est posé exactement à cette position.
+
+        Args:
+            orientation (str): l'orientation du mur ('MH' ou 'MV').
+            x (int): la colonne du mur.
+            y (int): la ligne du mur.
+
+        Returns:
+            bool: True si ce mur est posé.
+        """
+        masque = self.murs_h if orientation == "MH" else self.murs_v
+        return bool(masque >> indice_mur(orientation, x, y) & 1)
+
+    def jouer(self, joueur, type_coup, position):
+        """Produire l'état qui suit un coup, sans le valider.
+
+        Comme push_move, cette méthode est destinée au code qui n'explore que des
+        coups déjà reconnus comme légaux.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+            type_coup (str): le type de coup ('D' pour déplacement, 'M' pour mur).
+            position (list): [x, y] pour un déplacement, [x, y, orientation] pour un mur.
+
+        Returns:
+            ÉtatPartie: le nouvel état.
+        """
+        tour = self.tour + 1 if joueur == 1 else self.tour
+        if type_coup == "D":
+            cases = list(self.cases)
+            cases[joueur] = case(position[0], position[1])
+            return ÉtatPartie(self.noms, cases, self.murs_h, self.murs_v, self.restants, tour)
+        x, y, orientation = position
+        bit = 1 << indice_mur(orientation, x, y)
+        restants = list(self.restants)
+        restants[joueur] -= 1
+        if orientation == "MH":
+            return ÉtatPartie(self.noms, self.cases, self.murs_h | bit, self.murs_v, restants, tour)
+        return ÉtatPartie(self.noms, self.cases, self.murs_h, self.murs_v | bit, restants, tour)
+
+    def clé(self, trait):
+        """Calculer la clé de Zobrist de l'état, avec le joueur au trait.
+
+        Args:
+            trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+        Returns:
+            int: la même clé que zobrist.hacher pour la position correspondante.
+        """
+        clé = zobrist.TRAIT if trait == 1 else 0
+        for i in range(2):
+            clé ^= zobrist.POSITIONS[i][self.cases[i]] ^ zobrist.RESTANTS[i][self.restants[i]]
+        for indice in énumérer_bits(self.murs_h):
+            clé ^= zobrist.MURS_H[indice]
+        for indice in énumérer_bits(self.murs_v):
+            clé ^= zobrist.MURS_V[indice]
+        return clé
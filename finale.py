@@ -0,0 +1,144 @@
+"""Module de résolution exacte des finales sans murs
+
+Lorsqu'aucun des deux joueurs n'a plus de murs, la partie n'est plus qu'une
+course entre les jetons, dont l'issue dépend toutefois des sauts par-dessus le
+jeton adverse. Pour un ensemble de murs posés, les 81 x 81 x 2 positions
+(case de chaque jeton, joueur au trait) sont résolues par analyse rétrograde:
+en partant des positions gagnées en un coup, chaque position reçoit le nombre
+exact de coups avant la fin de la partie en jeu parfait. Les tables sont
+mémorisées par ensemble de murs.
+
+Une valeur positive n annonce une victoire du joueur au trait en n coups
+(demi-coups: les siens et ceux de l'adversaire), une valeur négative -n une
+défaite en n coups, et 0 une partie qui ne se termine pas.
+
+Functions:
+    * résoudre - Résoudre toutes les positions de la course pour un ensemble de murs.
+    * valeur - Produire l'issue exacte d'une position.
+    * meilleur_déplacement - Choisir un déplacement optimal.
+"""
+
+from array import array
+from collections import deque
+from functools import lru_cache
+from damier import LIGNES_BUT, DÉCALAGES, Damier, _ouvertures
+from quoridor_error import QuoridorError
+
+
+def _indice(case_1, case_2, trait):
+    """Numéroter une position de la course."""
+    return (case_1 * 81 + case_2) * 2 + trait
+
+
+@lru_cache(maxsize=64)
+def résoudre(murs_h, murs_v):
+    """Résoudre toutes les positions de la course pour un ensemble de murs.
+
+    Args:
+        murs_h (int): le masque des murs horizontaux.
+        murs_v (int): le masque des murs verticaux.
+
+    Returns:
+        array: pour chaque position numérotée par (case_1 * 81 + case_2) * 2 + trait,
+            le nombre signé de coups avant la fin de la partie.
+    """
+    ouvertures = _ouvertures(murs_h, murs_v)
+    voisins = [[numéro + DÉCALAGES[direction] for direction in range(4)
+                if ouvertures[direction] >> numéro & 1] for numéro in range(81)]
+
+    valeurs = array("h", bytes(2 * 81 * 81 * 2))
+    restants = array("h", bytes(2 * 81 * 81 * 2))
+    parents = [[] for _ in range(81 * 81 * 2)]
+    file = deque()
+    for case_1 in range(81):
+        if LIGNES_BUT[0] >> case_1 & 1:
+            continue
+        for case_2 in range(81):
+            if case_2 == case_1 or LIGNES_BUT[1] >> case_2 & 1:
+                continue
+            cases = (case_1, case_2)
+            for trait in range(2):
+                moi, lui = cases[trait], cases[1 - trait]
+                if lui in voisins[moi]:
+                    successeurs = Damier(cases, murs_h, murs_v, ouvertures).successeurs(trait)
+                else:
+                    successeurs = voisins[moi]
+                indice = _indice(case_1, case_2, trait)
+                if any(LIGNES_BUT[trait] >> numéro & 1 for numéro in successeurs):
+                    valeurs[indice] = 1
+                    file.append(indice)
+                    continue
+                enfants = {_indice(numéro, lui, 1) if trait == 0 else _indice(lui, numéro, 0)
+                           for numéro in successeurs}
+                restants[indice] = len(enfants)
+                for enfant in enfants:
+                    parents[enfant].append(indice)
+
+    # Les positions sont résolues par longueur croissante: une victoire dès qu'un
+    # coup mène à une défaite adverse, une défaite quand tous les coups mènent
+    # à une victoire adverse, la plus longue possible.
+    while file:
+        enfant = file.popleft()
+        valeur_enfant = valeurs[enfant]
+        for parent in parents[enfant]:
+            if valeurs[parent]:
+                continue
+            if valeur_enfant < 0:
+                valeurs[parent] = 1 - valeur_enfant
+                file.append(parent)
+            else:
+                restants[parent] -= 1
+                if restants[parent] == 0:
+                    valeurs[parent] = -1 - valeur_enfant
+                    file.append(parent)
+    return valeurs
+
+
+def valeur(damier, trait):
+    """Produire l'issue exacte d'une position sans murs restants.
+
+    Args:
+        damier (Damier): le damier, où aucun jeton n'a atteint sa ligne d'arrivée.
+        trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+    Returns:
+        int: n > 0 si le joueur au trait gagne en n coups, -n s'il perd en n coups,
+            0 si la partie ne se termine pas.
+    """
+    return résoudre(damier.murs_h, damier.murs_v)[_indice(*damier.positions, trait)]
+
+
+def meilleur_déplacement(damier, trait):
+    """Choisir un déplacement optimal dans une position sans murs restants.
+
+    Le joueur qui gagne choisit la victoire la plus rapide, celui qui perd la
+    défaite la plus lente.
+
+    Args:
+        damier (Damier): le damier, où aucun jeton n'a atteint sa ligne d'arrivée.
+        trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+    Returns:
+        int: le numéro de la case où déplacer le jeton.
+
+    Raises:
+        QuoridorError: Le jeton est enfermé et n'a aucun déplacement légal.
+    """
+    successeurs = list(damier.successeurs(trait))
+    if not successeurs:
+        raise QuoridorError("Aucun coup valide trouvé.")
+    valeurs = résoudre(damier.murs_h, damier.murs_v)
+    lui = damier.positions[1 - trait]
+
+    def préférence(numéro):
+        if LIGNES_BUT[trait] >> numéro & 1:
+            return (3, 0)
+        cases = (numéro, lui) if trait == 0 else (lui, numéro)
+        issue = valeurs[_indice(*cases, 1 - trait)]
+        if issue < 0:
+            return (2, issue)
+        if issue == 0:
+            return (1, 0)
+        return (0, issue)
+
+    return max(successeurs, key=préférence)
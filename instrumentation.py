@@ -0,0 +1,165 @@
+"""Module d'instrumentation des opérations critiques
+
+Sur demande, les fonctions et méthodes de CIBLES sont remplacées par des
+enveloppes qui chronomètrent et comptent chacun de leurs appels; les durées
+sont regroupées par opération en histogrammes. Tant que l'instrumentation
+n'est pas activée, rien n'est remplacé et son coût est nul. Le profileur
+cProfile peut être mené en même temps, pour un fichier pstats.
+
+    instrumentation.activer(profil=True)
+    ...
+    instrumentation.écrire_json("mesures.json")
+    instrumentation.écrire_pstats("profil.pstats")
+
+Functions:
+    * activer - Remplacer les cibles par des versions chronométrées.
+    * désactiver - Rétablir les cibles d'origine.
+    * réinitialiser - Effacer les mesures accumulées.
+    * rapport - Résumer les mesures de chaque opération.
+    * écrire_json - Écrire le rapport dans un fichier JSON.
+    * écrire_pstats - Écrire les statistiques du profileur dans un fichier pstats.
+"""
+
+import cProfile
+import functools
+import importlib
+import json
+import sys
+import time
+from collections import defaultdict
+
+# Opérations instrumentées: (module, classe ou None, attribut)
+CIBLES = (
+    ("graphe", None, "construire_graphe"),
+    ("quoridor", "Quoridor", "placer_un_mur"),
+    ("quoridor", "Quoridor", "déplacer_un_joueur"),
+    ("quoridor", "Quoridor", "_trouver_coup_bloquant"),
+    ("quoridor", "Quoridor", "jouer_un_coup"),
+    ("quoridor", "Quoridor", "état_partie"),
+    ("api", "ClientAPI", "créer_une_partie"),
+    ("api", "ClientAPI", "récupérer_une_partie"),
+    ("api", "ClientAPI", "appliquer_un_coup"),
+    ("quoridorx", "QuoridorX", "update_screen"),
+)
+
+# Modules qui ne sont instrumentés que s'ils ont déjà été importés par ailleurs
+MODULES_OPTIONNELS = ("quoridorx",)
+
+# Bornes supérieures des classes des histogrammes, en microsecondes
+CLASSES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+_durées = defaultdict(list)
+_originaux = []
+_profileur = None
+
+
+def _envelopper(nom, fonction):
+    """Produire une version de la fonction qui chronomètre chacun de ses appels."""
+    durées = _durées[nom]
+
+    @functools.wraps(fonction)
+    def enveloppe(*args, **kwargs):
+        début = time.perf_counter()
+        try:
+            return fonction(*args, **kwargs)
+        finally:
+            durées.append(time.perf_counter() - début)
+    return enveloppe
+
+
+def activer(profil=False):
+    """Remplacer les cibles par des versions chronométrées.
+
+    Args:
+        profil (bool, optionnel): mener aussi le profileur cProfile.
+    """
+    global _profileur  # pylint: disable=global-statement
+    if not _originaux:
+        for nom_module, nom_classe, attribut in CIBLES:
+            if nom_module in MODULES_OPTIONNELS and nom_module not in sys.modules:
+                continue
+            module = importlib.import_module(nom_module)
+            propriétaire = getattr(module, nom_classe) if nom_classe else module
+            original = getattr(propriétaire, attribut)
+            nom = f"{nom_classe}.{attribut}" if nom_classe else f"{nom_module}.{attribut}"
+            _originaux.append((propriétaire, attribut, original))
+            setattr(propriétaire, attribut, _envelopper(nom, original))
+    if profil and _profileur is None:
+        _profileur = cProfile.Profile()
+        _profileur.enable()
+
+
+def désactiver():
+    """Rétablir les cibles d'origine et arrêter le profileur; les mesures sont conservées."""
+    while _originaux:
+        propriétaire, attribut, original = _originaux.pop()
+        setattr(propriétaire, attribut, original)
+    if _profileur is not None:
+        _profileur.disable()
+
+
+def réinitialiser():
+    """Effacer les mesures accumulées, par exemple entre deux parties."""
+    global _profileur  # pylint: disable=global-statement
+    for durées in _durées.values():
+        durées.clear()
+    if _profileur is not None:
+        _profileur.disable()
+        _profileur = cProfile.Profile()
+        _profileur.enable()
+
+
+def rapport():
+    """Résumer les mesures de chaque opération.
+
+    Returns:
+        Dict: pour chaque opération appelée, le nombre d'appels, la durée totale en
+            secondes, la médiane, le 99e centile et le maximum en microsecondes,
+            et l'histogramme des durées par classe (bornes supérieures CLASSES).
+    """
+    résultat = {}
+    for nom, durées in _durées.items():
+        if not durées:
+            continue
+        triées = sorted(durées)
+        histogramme = {f"<{borne}us": 0 for borne in CLASSES}
+        histogramme[f">={CLASSES[-1]}us"] = 0
+        for durée in triées:
+            micro = 1e6 * durée
+            classe = next((f"<{borne}us" for borne in CLASSES if micro < borne),
+                          f">={CLASSES[-1]}us")
+            histogramme[classe] += 1
+        résultat[nom] = {
+            "appels": len(triées),
+            "total_s": sum(triées),
+            "p50_us": 1e6 * triées[len(triées) // 2],
+            "p99_us": 1e6 * triées[min(len(triées) - 1, len(triées) * 99 // 100)],
+            "max_us": 1e6 * triées[-1],
+            "histogramme": histogramme,
+        }
+    return résultat
+
+
+def écrire_json(chemin):
+    """Écrire le rapport dans un fichier JSON.
+
+    Args:
+        chemin (str): le fichier à écrire.
+    """
+    with open(chemin, "w", encoding="utf-8") as fichier:
+        json.dump(rapport(), fichier, ensure_ascii=False, indent=2)
+
+
+def écrire_pstats(chemin):
+    """Écrire les statistiques du profileur dans un fichier pstats.
+
+    Args:
+        chemin (str): le fichier à écrire, lisible avec le module pstats ou snakeviz.
+
+    Raises:
+        RuntimeError: Le profileur n'a pas été activé.
+    """
+    if _profileur is None:
+        raise RuntimeError("Le profileur n'a pas été activé.")
+    _profileur.disable()
+    _profileur.dump_stats(chemin)
@@ -0,0 +1,102 @@
+"""Module de validation rapide des murs
+
+Un mur ne peut enfermer un joueur que s'il coupe tous ses chemins, et ne peut
+allonger son chemin que s'il en coupe les plus courts. Les distances des deux
+joueurs et un plus court chemin pour chacun sont donc calculés une seule fois
+par position, et convertis, par la table damier.COUPURES_*, en masques des murs
+qui les coupent: un nouveau parcours n'est lancé que pour ces murs, et les
+chevauchements sont testés sur les masques de murs.
+
+Functions:
+    * murs_libres - Calculer les emplacements qui ne touchent aucun mur posé.
+    * analyser_murs - Énumérer les murs légaux avec les distances qui en résultent.
+    * murs_légaux - Énumérer les murs légaux d'une position.
+"""
+
+from damier import (BAS, COUPURES_DROITE, COUPURES_HAUT, DÉCALAGES, HAUT, énumérer_bits,
+                    position_mur)
+
+_TOUS = (1 << 64) - 1
+_PREMIÈRE_COLONNE = sum(1 << (8 * rangée) for rangée in range(8))
+_DERNIÈRE_COLONNE = _PREMIÈRE_COLONNE << 7
+
+
+def murs_libres(damier):
+    """Calculer les emplacements où un mur ne chevauche ni ne croise aucun mur posé.
+
+    Args:
+        damier (Damier): le damier à analyser.
+
+    Returns:
+        Tuple: les masques des emplacements libres horizontaux et verticaux.
+    """
+    murs_h, murs_v = damier.murs_h, damier.murs_v
+    occupés_h = (murs_h | murs_v
+                 | (murs_h << 1) & ~_PREMIÈRE_COLONNE
+                 | (murs_h >> 1) & ~_DERNIÈRE_COLONNE)
+    occupés_v = murs_v | murs_h | murs_v << 8 | murs_v >> 8
+    return ~occupés_h & _TOUS, ~occupés_v & _TOUS
+
+
+def _murs_coupants(damier, joueur, distances):
+    """Calculer les murs horizontaux et verticaux qui coupent un plus court chemin du joueur."""
+    coupants_h = coupants_v = 0
+    numéro = damier.positions[joueur]
+    while distances[numéro]:
+        for direction in range(4):
+            voisin = numéro + DÉCALAGES[direction]
+            if damier.est_ouvert(numéro, direction) and distances[voisin] == distances[numéro] - 1:
+                # Le passage est désigné par sa case du bas ou de gauche
+                if direction in (HAUT, BAS):
+                    coupants_h |= COUPURES_HAUT[min(numéro, voisin)]
+                else:
+                    coupants_v |= COUPURES_DROITE[min(numéro, voisin)]
+                numéro = voisin
+                break
+    return coupants_h, coupants_v
+
+
+def analyser_murs(damier):
+    """Énumérer les murs légaux d'une position avec les distances qui en résultent.
+
+    Args:
+        damier (Damier): le damier à analyser.
+
+    Returns:
+        List: des tuples (orientation, x, y, distances) où distances est le couple
+            des longueurs des plus courts chemins des joueurs 1 et 2 après le mur.
+    """
+    cartes = [damier.carte_distances(joueur) for joueur in range(2)]
+    actuelles = tuple(cartes[joueur][damier.positions[joueur]] for joueur in range(2))
+    if None in actuelles:
+        return []
+    coupants = [_murs_coupants(damier, joueur, cartes[joueur]) for joueur in range(2)]
+
+    libres_h, libres_v = murs_libres(damier)
+    résultat = []
+    for sens, (orientation, libres) in enumerate((("MH", libres_h), ("MV", libres_v))):
+        for indice in énumérer_bits(libres):
+            x, y = position_mur(orientation, indice)
+            distances = actuelles
+            essai = None
+            for joueur in range(2):
+                # Seul un mur qui coupe le plus court chemin peut l'allonger
+                if coupants[joueur][sens] >> indice & 1:
+                    essai = essai or damier.avec_mur(orientation, x, y)
+                    distances = (distances[:joueur] + (essai.distance(joueur),)
+                                 + distances[joueur + 1:])
+            if None not in distances:
+                résultat.append((orientation, x, y, distances))
+    return résultat
+
+
+def murs_légaux(damier):
+    """Énumérer les murs légaux d'une position.
+
+    Args:
+        damier (Damier): le damier à analyser.
+
+    Returns:
+        List: des tuples (orientation, x, y).
+    """
+    return [(orientation, x, y) for orientation, x, y, _ in analyser_murs(damier)]
@@ -0,0 +1,175 @@
+"""Module du livre d'ouvertures
+
+Le livre associe la clé de Zobrist d'une position du début de partie, joueur
+au trait compris, au meilleur coup trouvé hors ligne par une recherche longue.
+Il est conservé dans un fichier binaire d'enregistrements de taille fixe
+triés par clé; le fichier est projeté en mémoire et consulté par recherche
+dichotomique, sans être lu ni décodé au démarrage.
+
+Format: l'en-tête ENTÊTE (signature, nombre d'enregistrements), puis chaque
+enregistrement ENREGISTREMENT (clé de 64 bits, code du coup sur un octet).
+
+    python livre.py --coups 5 --largeur 3 --temps 2
+
+Classes:
+    * LivreOuvertures - Livre d'ouvertures projeté en mémoire.
+
+Functions:
+    * écrire_livre - Écrire un livre d'ouvertures.
+    * générer_livre - Construire un livre par des recherches depuis la position de départ.
+    * livre_par_défaut - Ouvrir le livre livré avec le module.
+"""
+
+import argparse
+import mmap
+import os
+import struct
+from damier import code_coup, coup_du_code
+from recherche import Recherche, formater_coup
+import zobrist
+
+SIGNATURE = b"QLIV"
+ENTÊTE = struct.Struct("<4sI")
+ENREGISTREMENT = struct.Struct("<QB")
+
+CHEMIN_PAR_DÉFAUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "livre.bin")
+
+
+class LivreOuvertures:
+    """Livre d'ouvertures projeté en mémoire.
+
+    Attributes:
+        chemin (str): le fichier du livre.
+    """
+
+    def __init__(self, chemin):
+        """Constructeur de la classe LivreOuvertures.
+
+        Args:
+            chemin (str): le fichier du livre.
+
+        Raises:
+            ValueError: Le fichier n'est pas un livre d'ouvertures.
+        """
+        self.chemin = chemin
+        with open(chemin, "rb") as fichier:
+            self._données = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+        signature, self._taille = ENTÊTE.unpack_from(self._données)
+        if (signature != SIGNATURE
+                or len(self._données) != ENTÊTE.size + self._taille * ENREGISTREMENT.size):
+            self._données.close()
+            raise ValueError(f"Le fichier {chemin} n'est pas un livre d'ouvertures.")
+
+    def __len__(self):
+        return self._taille
+
+    def consulter(self, clé):
+        """Chercher le coup d'une position.
+
+        Args:
+            clé (int): la clé de Zobrist de la position, joueur au trait compris.
+
+        Returns:
+            tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position,
+                ou None si la position n'est pas dans le livre.
+        """
+        bas, haut = 0, self._taille
+        while bas < haut:
+            milieu = (bas + haut) // 2
+            clé_lue, code = ENREGISTREMENT.unpack_from(
+                self._données, ENTÊTE.size + milieu * ENREGISTREMENT.size)
+            if clé_lue == clé:
+                return coup_du_code(code)
+            if clé_lue < clé:
+                bas = milieu + 1
+            else:
+                haut = milieu
+        return None
+
+    def fermer(self):
+        """Libérer la projection du fichier."""
+        self._données.close()
+
+
+def écrire_livre(chemin, entrées):
+    """Écrire un livre d'ouvertures.
+
+    Args:
+        chemin (str): le fichier à écrire.
+        entrées (Dict): pour chaque clé de position, le coup (type_coup, position).
+    """
+    with open(chemin, "wb") as fichier:
+        fichier.write(ENTÊTE.pack(SIGNATURE, len(entrées)))
+        for clé in sorted(entrées):
+            fichier.write(ENREGISTREMENT.pack(clé, code_coup(*entrées[clé])))
+
+
+def générer_livre(partie, coups=5, largeur=3, temps=2.0):
+    """Construire un livre par des recherches depuis une position.
+
+    Chaque position reçoit le coup trouvé par une recherche de la durée donnée.
+    L'arbre est développé en suivant ce coup, ainsi que les meilleures réponses
+    selon l'ordre des coups de la recherche, pour couvrir les écarts de l'adversaire.
+
+    Args:
+        partie (Quoridor): la position de départ, où le premier joueur est au trait.
+        coups (int, optionnel): le nombre de coups, des deux joueurs, couverts par le livre.
+        largeur (int, optionnel): le nombre de coups développés par position.
+        temps (float, optionnel): la durée de la recherche par position, en secondes.
+
+    Returns:
+        Dict: pour chaque clé de position, le meilleur coup (type_coup, position).
+    """
+    entrées = {}
+
+    def développer(joueur, restants):
+        clé = zobrist.hacher(partie.joueurs, partie.murs, joueur)
+        if restants == 0 or clé in entrées or partie.partie_terminée():
+            return
+        coup = Recherche(temps=temps).meilleur_coup(partie, joueur)
+        entrées[clé] = coup
+        autres = [formater_coup(autre) for autre in Recherche().coups_ordonnés(partie, joueur)]
+        suivants = [coup] + [autre for autre in autres if autre != coup][:largeur - 1]
+        for type_coup, position in suivants:
+            partie.push_move(joueur, type_coup, position)
+            développer(1 - joueur, restants - 1)
+            partie.pop_move()
+
+    développer(0, coups)
+    return entrées
+
+
+_LIVRE = None
+
+
+def livre_par_défaut():
+    """Ouvrir, au premier appel, le livre livré avec le module.
+
+    Returns:
+        LivreOuvertures: le livre, ou None si le fichier est absent ou illisible.
+    """
+    global _LIVRE  # pylint: disable=global-statement
+    if _LIVRE is None:
+        try:
+            _LIVRE = LivreOuvertures(CHEMIN_PAR_DÉFAUT)
+        except (OSError, ValueError):
+            _LIVRE = False
+    return _LIVRE or None
+
+
+if __name__ == "__main__":
+    from autojeu import nouvelle_partie  # pylint: disable=import-outside-toplevel
+
+    parser = argparse.ArgumentParser(prog="livre.py", description="Générer le livre d'ouvertures")
+    parser.add_argument("-c", "--coups", type=int, default=5,
+                        help="Nombre de coups couverts par le livre.")
+    parser.add_argument("-l", "--largeur", type=int, default=3,
+                        help="Nombre de coups développés par position.")
+    parser.add_argument("-t", "--temps", type=float, default=2.0,
+                        help="Durée de la recherche par position, en secondes.")
+    parser.add_argument("-o", "--sortie", default=CHEMIN_PAR_DÉFAUT, help="Fichier à écrire.")
+    args = parser.parse_args()
+
+    livre = générer_livre(nouvelle_partie(), args.coups, args.largeur, args.temps)
+    écrire_livre(args.sortie, livre)
+    print(f"{len(livre)} positions écrites dans {args.sortie}")
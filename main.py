@@ -8,15 +8,18 @@ et un mode "automatique" (nécessite l'implémentation de la
 logique de jeu automatique dans la classe Quoridor ou QuoridorX).
 """
 
+import atexit
 import sys
 import argparse
-import time
-import turtle
 from copy import deepcopy
-from api import créer_une_partie, récupérer_une_partie, appliquer_un_coup
-from quoridor import Quoridor
+from api import (ClientAPI, créer_une_partie, récupérer_une_partie, appliquer_un_coup,
+                 définir_client_par_défaut)
+from attente import POLITIQUES, attendre_changement, créer_politique
+from enregistrement import Enregistreur, déduire_coup
+from ponderation import Pondération
+from quoridor import Quoridor, STRATÉGIES
 from quoridor_error import QuoridorError
-from quoridorx import QuoridorX
+from zobrist import hacher
 
 # Mettre ici votre IDUL comme clé et votre Jeton comme secret.
 JETONS = {
@@ -45,6 +48,12 @@ def créer_ou_mettre_à_jour_partie(classe_jeu, état_serveur, partie_existante=
     return classe_jeu(joueurs, murs, tour)
 
 
+def états_concordants(partie, état_serveur):
+    """Vérifie, par leurs clés de Zobrist, que la partie locale et l'état du serveur concordent."""
+    return (hacher(partie.joueurs, partie.murs, 0)
+            == hacher(état_serveur['joueurs'], état_serveur['murs'], 0))
+
+
 if __name__ == "__main__":
     # === Analyse des arguments ===
     parser = argparse.ArgumentParser(prog="main.py", description="Quoridor")
@@ -52,6 +61,31 @@ if __name__ == "__main__":
     parser.add_argument("-a", "--automatique", action="store_true",
                          help="Activer le mode automatique.")
     parser.add_argument("-x", "--graphique", action="store_true", help="Activer le mode graphique.")
+    parser.add_argument("-s", "--stratégie", choices=STRATÉGIES, default="heuristique",
+                        help="Stratégie du mode automatique.")
+    parser.add_argument("-t", "--temps", type=float, default=1.0,
+                        help="Temps de réflexion par coup, en secondes.")
+    parser.add_argument("-p", "--processus", type=int, default=1,
+                        help="Nombre de processus des recherches alphabeta et mcts.")
+    parser.add_argument("-w", "--attente", choices=sorted(POLITIQUES), default="exponentielle",
+                        help="Politique d'attente du coup adverse.")
+    parser.add_argument("-y", "--synchronisation", type=int, default=10,
+                        help="Nombre de coups entre deux vérifications auprès du serveur "
+                             "(0: seulement en cas d'erreur locale).")
+    parser.add_argument("-l", "--hors-ligne", action="store_true",
+                        help="Jouer contre le serveur local plutôt que contre l'API.")
+    parser.add_argument("-r", "--pondérer", action="store_true",
+                        help="Réfléchir pendant le tour de l'adversaire (mode automatique, "
+                             "stratégie alphabeta).")
+    parser.add_argument("-q", "--silencieux", action="store_true",
+                        help="N'afficher la partie que lorsque son état a changé.")
+    parser.add_argument("-e", "--enregistrer", metavar="FICHIER",
+                        help="Ajouter la partie à ce fichier d'enregistrement.")
+    parser.add_argument("--mesures", metavar="FICHIER",
+                        help="Chronométrer les opérations critiques et écrire les mesures "
+                             "dans ce fichier JSON.")
+    parser.add_argument("--profil", metavar="FICHIER",
+                        help="Profiler la partie avec cProfile et écrire ce fichier pstats.")
     args = parser.parse_args()
 
     # === Récupération du secret ===
@@ -61,6 +95,27 @@ if __name__ == "__main__":
         sys.exit(1)
     secret_joueur = JETONS[idul_joueur]
 
+    if args.hors_ligne:
+        # pylint: disable-next=import-outside-toplevel
+        from serveur_local import ServeurLocal, SessionLocale
+        définir_client_par_défaut(ClientAPI(session=SessionLocale(ServeurLocal(JETONS))))
+
+    # Le mode graphique et ses dépendances ne sont chargés que s'ils servent
+    classe_jeu = Quoridor
+    if args.graphique:
+        import turtle  # pylint: disable=import-outside-toplevel
+        from quoridorx import QuoridorX  # pylint: disable=import-outside-toplevel
+        classe_jeu = QuoridorX
+
+    if args.mesures or args.profil:
+        import instrumentation  # pylint: disable=import-outside-toplevel
+        instrumentation.activer(profil=bool(args.profil))
+        # Écrits à la sortie du programme, y compris après une erreur
+        if args.mesures:
+            atexit.register(instrumentation.écrire_json, args.mesures)
+        if args.profil:
+            atexit.register(instrumentation.écrire_pstats, args.profil)
+
     # === Création de la partie via API ===
     id_partie = None
     état_partie_actuel = None
@@ -79,21 +134,36 @@ if __name__ == "__main__":
     # === Initialisation de l'instance de jeu (sera créée/MAJ dans la boucle) ===
     partie = None
     gagnant = None
-    classe_jeu = QuoridorX if args.graphique else Quoridor
+    politique = créer_politique(args.attente)
+    coups_joués = 0
+    clé_affichée = None
+    enregistreur = Enregistreur(args.enregistrer) if args.enregistrer else None
+    # État après notre dernier coup, pour retrouver la réponse adverse qui a fini la partie
+    état_avant_réponse = None
+    pondération = (Pondération(args.temps)
+                   if args.pondérer and args.automatique and args.stratégie == "alphabeta"
+                   else None)
 
     # === Boucle principale du jeu ===
     while gagnant is None:
         try:
-            # 1. Mettre à jour/Créer l'instance locale et afficher
-            partie = créer_ou_mettre_à_jour_partie(classe_jeu, état_partie_actuel, partie)
+            # 1. Mettre à jour/Créer l'instance locale si un nouvel état du serveur est arrivé,
+            #    puis afficher
+            if état_partie_actuel is not None:
+                partie = créer_ou_mettre_à_jour_partie(classe_jeu, état_partie_actuel, partie)
+                état_partie_actuel = None
 
+            clé = hacher(partie.joueurs, partie.murs, 0)
             if args.graphique:
                 partie.afficher()
-            else:
+            elif not args.silencieux or clé != clé_affichée:
                 print(partie)
+            clé_affichée = clé
 
-            # 2. Déterminer qui doit jouer selon l'état du serveur
-            joueur_actif = état_partie_actuel['joueurs'][0]['nom']
+            # 2. Déterminer qui doit jouer
+            joueur_actif = partie.joueurs[0]['nom']
+            index_adversaire = next(i for i, j in enumerate(partie.joueurs)
+                                    if j['nom'] != idul_joueur)
             print(f"\nTour {partie.tour} - C'est au tour de: {joueur_actif}")
 
             # 3. Si c'est notre tour, jouer
@@ -105,7 +175,9 @@ if __name__ == "__main__":
                 try:
                     if args.automatique:
                         print("Mode automatique activé pour vous...")
-                        type_coup, position = partie.jouer_un_coup(idul_joueur)
+                        type_coup, position = partie.jouer_un_coup(idul_joueur, args.stratégie,
+                                                                   args.temps, args.processus,
+                                                                   pondération)
                         print(f"Coup choisi par l'IA ({idul_joueur}): {type_coup} {position}")
                     else:
                         print("Mode manuel activé.")
@@ -120,33 +192,83 @@ if __name__ == "__main__":
 
                 # Appliquer le coup via l'API
                 print(f"Envoi du coup {type_coup} {position} au serveur...")
-                appliquer_un_coup(id_partie, type_coup, position, idul_joueur, secret_joueur)
+                # Pendant que le serveur calcule la réponse de l'adversaire, on y réfléchit aussi
+                if pondération:
+                    pondération.démarrer(partie, index_adversaire, (type_coup, position))
+                try:
+                    coup_adverse, position_adverse = appliquer_un_coup(
+                        id_partie, type_coup, position, idul_joueur, secret_joueur)
+                except StopIteration:
+                    # Le coup a été accepté et la partie est terminée, par ce coup ou par
+                    # la réponse de l'adversaire, que le serveur ne renvoie pas
+                    if enregistreur:
+                        enregistreur.ajouter(type_coup, position)
+                        avant_réponse = deepcopy(partie)
+                        try:
+                            avant_réponse.appliquer_un_coup(idul_joueur, position, type_coup)
+                            état_avant_réponse = avant_réponse.état_partie()
+                        except QuoridorError:
+                            état_avant_réponse = None
+                    raise
+                finally:
+                    if pondération:
+                        pondération.arrêter()
+                if enregistreur:
+                    enregistreur.ajouter(type_coup, position)
+                    enregistreur.ajouter(coup_adverse, position_adverse)
+                coups_joués += 1
 
-                # Si on arrive ici, le coup a été accepté et la partie n'est pas finie par ce coup
-                print("Coup accepté par le serveur. Récupération de l'état...")
+                # Si on arrive ici, le coup a été accepté et la partie n'est pas finie par ce coup.
+                # Le serveur a retourné la réponse de l'adversaire: les deux coups sont appliqués
+                # localement plutôt que de récupérer l'état complet.
+                print(f"Coup accepté par le serveur. Réponse: {coup_adverse} {position_adverse}")
                 try:
-                    _, état_partie_actuel = récupérer_une_partie(id_partie, idul_joueur,
-                                                                 secret_joueur)
-                except (PermissionError, RuntimeError, ConnectionError,
-                         ReferenceError) as e_recup:
-                    print(f"\nERREUR API lors de la récupération après coup : {e_recup}")
-                    print("Arrêt de la partie.")
-                    sys.exit(1)
+                    partie.appliquer_un_coup(idul_joueur, position, type_coup)
+                    partie.appliquer_un_coup(partie.joueurs[index_adversaire]['nom'],
+                                             position_adverse, coup_adverse)
+                    divergence = False
+                except QuoridorError:
+                    divergence = True
+
+                # Vérification périodique, ou immédiate si un coup n'a pas pu être appliqué
+                if divergence or (args.synchronisation
+                                  and coups_joués % args.synchronisation == 0):
+                    try:
+                        _, état_serveur = récupérer_une_partie(id_partie, idul_joueur,
+                                                               secret_joueur)
+                    except (PermissionError, RuntimeError, ConnectionError,
+                             ReferenceError) as e_recup:
+                        print(f"\nERREUR API lors de la récupération après coup : {e_recup}")
+                        print("Arrêt de la partie.")
+                        sys.exit(1)
+                    if divergence or not états_concordants(partie, état_serveur):
+                        print("État local différent de celui du serveur, synchronisation.")
+                        état_partie_actuel = état_serveur
 
 
             else:
                 # Ce n'est pas notre tour, attendre/récupérer l'état
                 print("En attente du coup de l'adversaire...")
-                # Pause optionnelle pour ne pas surcharger le serveur avec des GETs
-                time.sleep(0.5)
+                # Les consultations s'espacent tant que l'état reste identique;
+                # la partie n'est reconstruite et réaffichée qu'après un changement
+                if pondération:
+                    pondération.démarrer(partie, index_adversaire)
+                état_précédent = partie.état_partie()
                 try:
-                    _, état_partie_actuel = récupérer_une_partie(id_partie, idul_joueur,
-                                                              secret_joueur)
+                    état_partie_actuel = attendre_changement(
+                        lambda: récupérer_une_partie(id_partie, idul_joueur, secret_joueur)[1],
+                        état_précédent, politique)
                 except (PermissionError, RuntimeError, ConnectionError,
                          ReferenceError) as e_recup_attente:
                     print(f"\nERREUR API lors de la récupération en attente : {e_recup_attente}")
                     print("Arrêt de la partie.")
                     sys.exit(1)
+                finally:
+                    if pondération:
+                        pondération.arrêter()
+                coup_adverse = déduire_coup(état_précédent, état_partie_actuel, index_adversaire)
+                if enregistreur and coup_adverse:
+                    enregistreur.ajouter(*coup_adverse)
 
 
         except StopIteration as e:
@@ -169,6 +291,7 @@ if __name__ == "__main__":
     # --- Fin de Partie ---
     print("\n===== PARTIE TERMINÉE =====")
     # Essayer de récupérer un dernier état pour affichage final
+    état_final = None
     try:
         _, état_final = récupérer_une_partie(id_partie, idul_joueur, secret_joueur)
         partie = créer_ou_mettre_à_jour_partie(classe_jeu, état_final, partie)
@@ -186,6 +309,22 @@ if __name__ == "__main__":
 
 
     print(f"Le gagnant est : {gagnant}")
+    if enregistreur:
+        index_gagnant = next((i for i, j in enumerate(partie.joueurs) if j['nom'] == gagnant),
+                             None)
+        if état_avant_réponse is not None and index_gagnant == index_adversaire:
+            # Le coup gagnant de l'adversaire est retrouvé dans l'état final; à défaut,
+            # la partie est enregistrée comme inachevée plutôt que sans son dernier coup
+            coup_final = (déduire_coup(état_avant_réponse, état_final, index_adversaire)
+                          if état_final else None)
+            if coup_final:
+                enregistreur.ajouter(*coup_final)
+            else:
+                index_gagnant = None
+        enregistreur.terminer(index_gagnant)
+    if pondération:
+        print(f"Pondération : {pondération.succès} coups trouvés d'avance sur "
+              f"{pondération.succès + pondération.échecs}")
 
     if args.graphique and partie:
         print("Cliquez sur la fenêtre graphique pour quitter.")
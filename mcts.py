@@ -0,0 +1,293 @@
+"""Module de recherche arborescente Monte-Carlo (UCT) du jeu Quoridor
+
+Chaque itération descend l'arbre en choisissant l'enfant de plus grande borne
+UCT, ajoute un nœud, puis termine la partie par une simulation rapide dont le
+résultat est remonté jusqu'à la racine. Les simulations jouent directement sur
+les masques du damier, sans construire de graphe ni de partie Quoridor: le
+jeton suit le plus souvent un plus court chemin, et un mur qui allonge le
+chemin adverse est parfois posé. Une simulation qui part d'une position où plus
+aucun joueur n'a de murs est remplacée par l'issue exacte du module finale.
+
+L'arbre est conservé d'un coup à l'autre: au coup suivant, le nœud de la
+nouvelle position, s'il a déjà été atteint, devient la racine. Avec plusieurs
+processus, chacun développe son propre arbre jusqu'à la même échéance et les
+visites des coups de la racine sont additionnées; le groupe de processus est
+celui du module parallele.
+
+Classes:
+    * RechercheMonteCarlo - Recherche arborescente Monte-Carlo à borne UCT.
+"""
+
+import math
+import random
+import time
+from damier import LIGNES_BUT, Damier, position_mur, énumérer_bits
+from etat import ÉtatPartie
+import finale
+from legalite import murs_libres
+from parallele import MARGE, groupe_processus
+from quoridor_error import QuoridorError
+from recherche import coups_candidats, formater_coup
+
+# Recherche propre à chaque processus, dont l'arbre est conservé d'un coup à l'autre
+_RECHERCHE = None
+
+
+class _Nœud:
+    """Nœud de l'arbre: une position et les statistiques des simulations qui l'ont traversée."""
+
+    __slots__ = ("état", "trait", "coup", "parent", "enfants", "à_essayer",
+                 "visites", "gains", "gagnant")
+
+    def __init__(self, état, trait, coup=None, parent=None):
+        self.état = état
+        self.trait = trait
+        self.coup = coup
+        self.parent = parent
+        self.enfants = []
+        self.à_essayer = None
+        self.visites = 0
+        # Les gains sont comptés pour le joueur qui a joué le coup menant au nœud
+        self.gains = 0.0
+        adversaire = 1 - trait
+        self.gagnant = adversaire if LIGNES_BUT[adversaire] >> état.cases[adversaire] & 1 else None
+
+
+class RechercheMonteCarlo:
+    """Recherche arborescente Monte-Carlo à borne UCT.
+
+    Attributes:
+        temps (float): le budget de temps par coup, en secondes.
+        exploration (float): la constante d'exploration de la borne UCT.
+        processus (int): le nombre de processus; 1 pour une recherche en série.
+        largeur_murs (int): le nombre maximal de murs envisagés à chaque nœud.
+        profondeur_simulation (int): le nombre maximal de coups d'une simulation,
+            au-delà duquel la course est départagée par les longueurs des chemins.
+        probabilité_mur (float): la probabilité qu'un joueur d'une simulation
+            tente de poser un mur plutôt que de se déplacer.
+        itérations (int): le nombre d'itérations de la dernière recherche.
+        itérations_par_seconde (float): le débit de la dernière recherche.
+    """
+
+    def __init__(self, temps=1.0, exploration=0.7, processus=1, largeur_murs=10,
+                 profondeur_simulation=60, probabilité_mur=0.2, graine=None):
+        """Constructeur de la classe RechercheMonteCarlo.
+
+        Args:
+            temps (float, optionnel): le budget de temps par coup, en secondes.
+            exploration (float, optionnel): la constante d'exploration de la borne UCT.
+            processus (int, optionnel): le nombre de processus.
+            largeur_murs (int, optionnel): le nombre maximal de murs envisagés à chaque
+                nœud, choisis parmi ceux qui allongent le plus le chemin adverse.
+            profondeur_simulation (int, optionnel): le nombre maximal de coups d'une simulation.
+            probabilité_mur (float, optionnel): la probabilité de tenter un mur en simulation.
+            graine (int, optionnel): la graine du générateur aléatoire des simulations.
+        """
+        self.temps = temps
+        self.exploration = exploration
+        self.processus = processus
+        self.largeur_murs = largeur_murs
+        self.profondeur_simulation = profondeur_simulation
+        self.probabilité_mur = probabilité_mur
+        self.itérations = 0
+        self.itérations_par_seconde = 0.0
+        self._aléa = random.Random(graine)
+        self._racine = None
+
+    def meilleur_coup(self, partie, joueur):
+        """Chercher le meilleur coup d'un joueur dans le temps alloué.
+
+        Args:
+            partie (Quoridor): la partie à analyser; elle n'est pas modifiée.
+            joueur (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+        Returns:
+            tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position.
+                   Pour 'D': [x, y]
+                   Pour 'M': [x, y, orientation ('MH' ou 'MV')]
+
+        Raises:
+            QuoridorError: Le joueur n'a aucun coup légal.
+        """
+        état = ÉtatPartie.depuis_partie(partie)
+        if self.processus > 1:
+            statistiques = self._répartir(état, joueur)
+        else:
+            statistiques = self.statistiques_racine(état, joueur, self.temps)
+        if not statistiques:
+            raise QuoridorError("Aucun coup valide trouvé.")
+        coup = max(statistiques, key=lambda c: (statistiques[c][0], statistiques[c][1]))
+        return formater_coup(coup)
+
+    def statistiques_racine(self, état, joueur, temps):
+        """Développer l'arbre d'une position jusqu'à l'échéance.
+
+        Args:
+            état (ÉtatPartie): la position.
+            joueur (int): l'indice du joueur qui doit jouer (0 ou 1).
+            temps (float): le budget de temps, en secondes.
+
+        Returns:
+            Dict: pour chaque coup de la racine, le couple (visites, gains).
+        """
+        racine = self._nouvelle_racine(état, joueur)
+        début = time.perf_counter()
+        échéance = début + temps
+        itérations = 0
+        # Au moins une itération, pour que chaque coup de la racine ait été généré
+        while itérations == 0 or time.perf_counter() < échéance:
+            self._itérer(racine)
+            itérations += 1
+        durée = time.perf_counter() - début
+        self.itérations = itérations
+        self.itérations_par_seconde = itérations / durée if durée > 0 else 0.0
+        if not racine.enfants and not racine.à_essayer:
+            return {}
+        statistiques = {enfant.coup: (enfant.visites, enfant.gains) for enfant in racine.enfants}
+        for coup in racine.à_essayer:
+            statistiques[coup] = (0, 0.0)
+        return statistiques
+
+    def _nouvelle_racine(self, état, trait):
+        """Retrouver la position dans l'arbre conservé, ou commencer un nouvel arbre."""
+        clé = état.clé(trait)
+        nœuds = [self._racine] if self._racine is not None else []
+        # La position se trouve au plus deux coups sous l'ancienne racine
+        for _ in range(3):
+            for nœud in nœuds:
+                if nœud.état.clé(nœud.trait) == clé:
+                    nœud.parent = None
+                    self._racine = nœud
+                    return nœud
+            nœuds = [enfant for nœud in nœuds for enfant in nœud.enfants]
+        self._racine = _Nœud(état, trait)
+        return self._racine
+
+    def _itérer(self, racine):
+        """Mener une itération: sélection, expansion, simulation et rétropropagation."""
+        nœud = racine
+        # Sélection
+        while nœud.gagnant is None and nœud.à_essayer == [] and nœud.enfants:
+            nœud = self._sélectionner(nœud)
+        # Expansion
+        if nœud.gagnant is None:
+            if nœud.à_essayer is None:
+                nœud.à_essayer = coups_candidats(nœud.état.damier(), nœud.trait,
+                                                 nœud.état.restants[nœud.trait],
+                                                 self.largeur_murs)
+                # Les coups les plus prometteurs sont développés en premier
+                nœud.à_essayer.reverse()
+            if nœud.à_essayer:
+                coup = nœud.à_essayer.pop()
+                enfant = _Nœud(nœud.état.jouer(nœud.trait, coup[0], coup[1:]),
+                               1 - nœud.trait, coup, nœud)
+                nœud.enfants.append(enfant)
+                nœud = enfant
+        # Simulation
+        gagnant = nœud.gagnant
+        if gagnant is None:
+            gagnant = self.simuler(nœud.état, nœud.trait)
+        # Rétropropagation
+        while nœud is not None:
+            nœud.visites += 1
+            if gagnant is None:
+                nœud.gains += 0.5
+            elif gagnant != nœud.trait:
+                nœud.gains += 1.0
+            nœud = nœud.parent
+
+    def _sélectionner(self, nœud):
+        """Choisir l'enfant de plus grande borne UCT."""
+        logarithme = math.log(nœud.visites)
+        exploration = self.exploration
+        return max(nœud.enfants, key=lambda enfant: enfant.gains / enfant.visites
+                   + exploration * math.sqrt(logarithme / enfant.visites))
+
+    def simuler(self, état, trait):
+        """Jouer rapidement la fin d'une partie, comme le fait chaque itération.
+
+        Args:
+            état (ÉtatPartie): la position de départ de la simulation.
+            trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+        Returns:
+            int: l'indice du gagnant (0 ou 1), ou None si la partie est nulle.
+        """
+        aléa = self._aléa
+        positions = list(état.cases)
+        restants = list(état.restants)
+        damier = état.damier()
+        if not restants[0] and not restants[1]:
+            # Course sans murs: l'issue exacte est connue
+            issue = finale.valeur(damier, trait)
+            if issue == 0:
+                return None
+            return trait if issue > 0 else 1 - trait
+        for _ in range(self.profondeur_simulation):
+            if restants[trait] and aléa.random() < self.probabilité_mur:
+                avec_mur = self._mur_bloquant(damier, trait)
+                if avec_mur is not None:
+                    damier = avec_mur
+                    restants[trait] -= 1
+                    trait = 1 - trait
+                    continue
+            distances = damier.carte_distances(trait)
+            voisins = [numéro for numéro in damier.successeurs(trait)
+                       if distances[numéro] is not None]
+            if aléa.random() < 0.8:
+                positions[trait] = min(voisins, key=distances.__getitem__)
+            else:
+                positions[trait] = aléa.choice(voisins)
+            if LIGNES_BUT[trait] >> positions[trait] & 1:
+                return trait
+            damier = Damier(positions, damier.murs_h, damier.murs_v, damier.ouvertures)
+            trait = 1 - trait
+        # Course départagée par les chemins: le joueur au trait gagne à égalité
+        if damier.distance(trait) <= damier.distance(1 - trait):
+            return trait
+        return 1 - trait
+
+    def _mur_bloquant(self, damier, joueur):
+        """Tirer quelques emplacements libres et retourner le damier du meilleur mur bloquant."""
+        adversaire = 1 - joueur
+        libres_h, libres_v = murs_libres(damier)
+        emplacements = ([("MH", indice) for indice in énumérer_bits(libres_h)]
+                        + [("MV", indice) for indice in énumérer_bits(libres_v)])
+        sa_distance = damier.distance(adversaire)
+        meilleur, meilleure_distance = None, sa_distance
+        for orientation, indice in self._aléa.sample(emplacements, min(4, len(emplacements))):
+            essai = damier.avec_mur(orientation, *position_mur(orientation, indice))
+            distance = essai.distance(adversaire)
+            if (distance is not None and distance > meilleure_distance
+                    and essai.distance(joueur) is not None):
+                meilleur, meilleure_distance = essai, distance
+        return meilleur
+
+    def _répartir(self, état, joueur):
+        """Développer un arbre par processus et additionner les statistiques de la racine."""
+        exécuteur = groupe_processus(self.processus)
+        tâches = [exécuteur.submit(_développer, état, joueur, max(self.temps - MARGE, 0.0),
+                                   self.exploration, self.largeur_murs)
+                  for _ in range(self.processus)]
+        statistiques = {}
+        self.itérations = 0
+        self.itérations_par_seconde = 0.0
+        for tâche in tâches:
+            partielles, itérations, débit = tâche.result()
+            self.itérations += itérations
+            self.itérations_par_seconde += débit
+            for coup, (visites, gains) in partielles.items():
+                anciennes = statistiques.get(coup, (0, 0.0))
+                statistiques[coup] = (anciennes[0] + visites, anciennes[1] + gains)
+        return statistiques
+
+
+def _développer(état, joueur, temps, exploration, largeur_murs):
+    """Développer l'arbre du processus et en retourner les statistiques (dans un processus)."""
+    global _RECHERCHE  # pylint: disable=global-statement
+    if _RECHERCHE is None:
+        _RECHERCHE = RechercheMonteCarlo()
+    _RECHERCHE.exploration = exploration
+    _RECHERCHE.largeur_murs = largeur_murs
+    statistiques = _RECHERCHE.statistiques_racine(état, joueur, temps)
+    return statistiques, _RECHERCHE.itérations, _RECHERCHE.itérations_par_seconde
@@ -0,0 +1,154 @@
+"""Module de recherche parallèle à la racine
+
+Les coups de la racine sont répartis entre plusieurs processus qui mènent chacun
+leur propre recherche alpha-bêta sur leur part des coups, jusqu'à la même
+échéance. La position leur est transmise sous la forme compacte d'un
+ÉtatPartie plutôt que sous forme de dictionnaires.
+
+Le groupe de processus est partagé avec les autres recherches parallèles, comme
+celle du module mcts: une partie entre deux d'entre elles n'en démarre qu'un.
+
+Classes:
+    * RechercheParallèle - Recherche alpha-bêta répartie sur un groupe de processus.
+
+Functions:
+    * groupe_processus - Produire le groupe de processus partagé d'une taille donnée.
+"""
+
+import atexit
+from concurrent.futures import ProcessPoolExecutor
+from damier import LIGNES_BUT
+from etat import ÉtatPartie
+from quoridor_error import QuoridorError
+from recherche import VICTOIRE, Recherche, formater_coup, évaluer
+from transposition import TableTransposition
+
+# Temps réservé à la transmission des coups et des résultats, en secondes
+MARGE = 0.05
+
+_EXÉCUTEURS = {}
+
+# Table de transposition propre à chaque processus, conservée d'un coup à l'autre
+_TABLE = None
+
+
+def _classer(partie, joueur, coups):
+    """Retenir le coup d'une part de meilleure évaluation statique, avec son score."""
+    meilleur = None
+    for coup in coups:
+        partie.push_move(joueur, coup[0], coup[1:])
+        try:
+            damier = partie.damier()
+            if LIGNES_BUT[joueur] >> damier.positions[joueur] & 1:
+                # Score d'une victoire au premier coup, comme dans la recherche
+                score = VICTOIRE - 1
+            else:
+                score = -évaluer(partie, damier, 1 - joueur)
+        finally:
+            partie.pop_move()
+        if meilleur is None or score > meilleur[0]:
+            meilleur = (score, coup)
+    return meilleur
+
+
+def _chercher(état, joueur, coups, temps):
+    """Chercher le meilleur coup parmi une part des coups de la racine (dans un processus)."""
+    global _TABLE  # pylint: disable=global-statement
+    if _TABLE is None:
+        _TABLE = TableTransposition()
+    partie = état.en_partie()
+    recherche = Recherche(temps=temps, table=_TABLE)
+    recherche.meilleur_coup(partie, joueur, coups)
+    if not recherche.historique:
+        # La profondeur 1 n'a pas été terminée avant l'échéance: chaque coup de la part
+        # reçoit tout de même un score, celui de l'évaluation statique, pour être
+        # comparé à ceux des autres parts sans dépasser le temps alloué
+        score, coup = _classer(partie, joueur, coups)
+        return [(1, score, coup)], recherche.nœuds + len(coups)
+    return recherche.historique, recherche.nœuds
+
+
+def groupe_processus(processus):
+    """Produire le groupe de processus partagé de cette taille, créé au premier usage.
+
+    Args:
+        processus (int): le nombre de processus du groupe.
+
+    Returns:
+        ProcessPoolExecutor: le groupe, arrêté à la fin du programme.
+    """
+    if processus not in _EXÉCUTEURS:
+        _EXÉCUTEURS[processus] = ProcessPoolExecutor(max_workers=processus)
+    return _EXÉCUTEURS[processus]
+
+
+@atexit.register
+def _fermer_exécuteurs():
+    """Arrêter les groupes de processus à la fin du programme."""
+    for exécuteur in _EXÉCUTEURS.values():
+        exécuteur.shutdown(cancel_futures=True)
+    _EXÉCUTEURS.clear()
+
+
+class RechercheParallèle:
+    """Recherche alpha-bêta répartie à la racine sur un groupe de processus.
+
+    Chaque processus explore sa part des coups par approfondissement itératif; les
+    résultats sont comparés à la plus grande profondeur terminée par tous.
+
+    Attributes:
+        processus (int): le nombre de processus; 1 pour une recherche en série.
+        temps (float): le budget de temps par coup, en secondes.
+        nœuds (int): le nombre total de nœuds visités lors de la dernière recherche.
+        profondeur (int): la profondeur à laquelle les coups ont été comparés.
+    """
+
+    def __init__(self, processus, temps=1.0):
+        """Constructeur de la classe RechercheParallèle.
+
+        Args:
+            processus (int): le nombre de processus.
+            temps (float, optionnel): le budget de temps par coup, en secondes.
+        """
+        self.processus = processus
+        self.temps = temps
+        self.nœuds = 0
+        self.profondeur = 0
+
+    def meilleur_coup(self, partie, joueur):
+        """Chercher le meilleur coup d'un joueur dans le temps alloué.
+
+        Args:
+            partie (Quoridor): la partie à analyser; elle n'est pas modifiée.
+            joueur (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+        Returns:
+            tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position.
+
+        Raises:
+            QuoridorError: Le joueur n'a aucun coup légal.
+        """
+        if self.processus <= 1:
+            recherche = Recherche(temps=self.temps)
+            coup = recherche.meilleur_coup(partie, joueur)
+            self.nœuds, self.profondeur = recherche.nœuds, recherche.profondeur
+            return coup
+
+        coups = Recherche().coups_ordonnés(partie, joueur)
+        if not coups:
+            raise QuoridorError("Aucun coup valide trouvé.")
+        # Répartir les coups en alternance pour que chaque part contienne de bons coups
+        parts = [coups[i::self.processus] for i in range(self.processus)
+                 if coups[i::self.processus]]
+        état = ÉtatPartie.depuis_partie(partie)
+        exécuteur = groupe_processus(self.processus)
+        tâches = [exécuteur.submit(_chercher, état, joueur, part, max(self.temps - MARGE, 0.0))
+                  for part in parts]
+        résultats = [tâche.result() for tâche in tâches]
+
+        self.nœuds = sum(nœuds for _, nœuds in résultats)
+        historiques = [historique for historique, _ in résultats]
+        self.profondeur = min(len(historique) for historique in historiques)
+        _, _, coup = max((historique[self.profondeur - 1] for historique in historiques),
+                         key=lambda résultat: résultat[1])
+        return formater_coup(coup)
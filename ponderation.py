@@ -0,0 +1,128 @@
+"""Module de réflexion pendant le tour de l'adversaire
+
+Pendant que le serveur calcule la réponse de l'adversaire, ou que l'on attend
+son coup, un fil de fond joue tour à tour ses réponses les plus probables et
+cherche, pour chacune, notre meilleur coup. Les coups trouvés sont mémorisés
+par clé de Zobrist de la position atteinte; jouer_un_coup les retourne
+aussitôt si l'adversaire a bien joué l'une de ces réponses.
+
+Le fil de fond avance surtout pendant que le fil principal attend le réseau,
+qui relâche alors le verrou global de l'interpréteur.
+
+Classes:
+    * Pondération - Recherche spéculative des réponses aux coups adverses probables.
+"""
+
+import threading
+from quoridor import Quoridor
+from recherche import Recherche
+from transposition import TableTransposition
+import zobrist
+
+
+class Pondération:
+    """Recherche spéculative de nos réponses aux coups adverses probables.
+
+    Attributes:
+        temps (float): le budget de temps de la recherche de chaque réponse, en secondes.
+        largeur (int): le nombre de coups adverses envisagés.
+        réponses (Dict): pour chaque clé de position, notre coup trouvé d'avance.
+        table (TableTransposition): la table de transposition des recherches du fil
+            de fond, conservée d'un tour à l'autre.
+        succès (int): le nombre de consultations qui ont trouvé la position.
+        échecs (int): le nombre de consultations qui ne l'ont pas trouvée.
+    """
+
+    def __init__(self, temps=1.0, largeur=3):
+        """Constructeur de la classe Pondération.
+
+        Args:
+            temps (float, optionnel): le budget de temps de chaque recherche, en secondes.
+            largeur (int, optionnel): le nombre de coups adverses envisagés.
+        """
+        self.temps = temps
+        self.largeur = largeur
+        self.réponses = {}
+        self.table = TableTransposition()
+        self.succès = 0
+        self.échecs = 0
+        self._fil = None
+        self._arrêt = threading.Event()
+        self._recherche = None
+        self._verrou = threading.Lock()
+
+    def démarrer(self, partie, adversaire, coup=None):
+        """Commencer à réfléchir au tour de l'adversaire dans un fil de fond.
+
+        Args:
+            partie (Quoridor): la partie; elle est copiée et n'est pas modifiée.
+            adversaire (int): l'indice de l'adversaire (0 ou 1).
+            coup (tuple, optionnel): notre coup (type_coup, position) qui n'a pas encore
+                été appliqué à la partie; l'adversaire joue après lui.
+        """
+        self.arrêter()
+        self.réponses.clear()
+        copie = Quoridor(partie.joueurs, partie.murs, partie.tour)
+        if coup is not None:
+            copie.push_move(1 - adversaire, *coup)
+        self._arrêt.clear()
+        self._fil = threading.Thread(target=self._réfléchir, args=(copie, adversaire),
+                                     name="pondération", daemon=True)
+        self._fil.start()
+
+    def arrêter(self):
+        """Interrompre la réflexion et attendre la fin du fil de fond."""
+        if self._fil is None:
+            return
+        self._arrêt.set()
+        with self._verrou:
+            if self._recherche is not None:
+                self._recherche.interrompre()
+        self._fil.join()
+        self._fil = None
+
+    def consulter(self, partie, joueur):
+        """Chercher notre coup trouvé d'avance pour la position de la partie.
+
+        Args:
+            partie (Quoridor): la partie.
+            joueur (int): notre indice (0 ou 1), c'est-à-dire le joueur au trait.
+
+        Returns:
+            tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position,
+                ou None si la position n'a pas été analysée.
+        """
+        coup = self.réponses.get(zobrist.hacher(partie.joueurs, partie.murs, joueur))
+        if coup is None:
+            self.échecs += 1
+        else:
+            self.succès += 1
+        return coup
+
+    def _réfléchir(self, partie, adversaire):
+        """Analyser nos réponses aux coups adverses les plus probables (dans le fil de fond)."""
+        joueur = 1 - adversaire
+        coups_adverses = Recherche().coups_ordonnés(partie, adversaire)[:self.largeur]
+        for coup_adverse in coups_adverses:
+            if self._arrêt.is_set():
+                return
+            partie.push_move(adversaire, coup_adverse[0], coup_adverse[1:])
+            try:
+                if partie.partie_terminée():
+                    continue
+                clé = zobrist.hacher(partie.joueurs, partie.murs, joueur)
+                if clé in self.réponses:
+                    continue
+                recherche = Recherche(temps=self.temps, table=self.table)
+                with self._verrou:
+                    if self._arrêt.is_set():
+                        return
+                    self._recherche = recherche
+                coup = recherche.meilleur_coup(partie, joueur)
+                with self._verrou:
+                    self._recherche = None
+                # Une recherche interrompue n'a pas exploré sa position assez profondément
+                if not recherche.interrompue:
+                    self.réponses[clé] = coup
+            finally:
+                partie.pop_move()
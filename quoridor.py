@@ -7,9 +7,62 @@ Classes:
 
 import argparse
 from copy import deepcopy
-import networkx as nx
+from functools import lru_cache
 from quoridor_error import QuoridorError
-from graphe import construire_graphe
+from damier import (Damier, LIGNES_BUT, case, coordonnées, indice_mur, mur_valide,
+                    position_mur, énumérer_bits)
+from finale import meilleur_déplacement
+from legalite import analyser_murs
+from livre import livre_par_défaut
+from recherche import Recherche
+from transposition import TableTransposition
+import zobrist
+
+STRATÉGIES = ("heuristique", "alphabeta", "mcts")
+
+# Gabarit du damier en texte: le bord du haut, puis, pour y de 9 à 1, la rangée y
+# suivie (sauf pour y = 1) de la ligne qui la sépare de la rangée y - 1
+_GABARIT = (
+    ("   " + "-" * 35,)
+    + tuple(ligne for y in range(9, 0, -1)
+            for ligne in (f"{y} | " + "   ".join("." * 9) + " |",
+                          "  |" + " " * 35 + "|")[:2 if y > 1 else 1])
+    + ("--|" + "-" * 35, "  | 1   2   3   4   5   6   7   8   9")
+)
+
+
+def _rangée(y):
+    """Indice dans _GABARIT de la ligne des cases de la rangée y."""
+    return 1 + 2 * (9 - y)
+
+
+@lru_cache(maxsize=256)
+def _dessiner_damier(cases, murs_h, murs_v):
+    """Dessiner le damier en texte à partir des cases des jetons et des masques des murs.
+
+    La case x d'une rangée occupe la colonne 4x; un mur vertical à gauche de la
+    case x occupe la colonne 4x - 2.
+    """
+    lignes = {}
+
+    def modifier(indice, colonne, texte):
+        ligne = lignes.setdefault(indice, list(_GABARIT[indice]))
+        ligne[colonne:colonne + len(texte)] = texte
+
+    for joueur, numéro in enumerate(cases):
+        x, y = coordonnées(numéro)
+        modifier(_rangée(y), 4 * x, str(joueur + 1))
+    # Le mur horizontal [x, y] sépare les rangées y et y - 1 sous les cases x et x + 1
+    for indice in énumérer_bits(murs_h):
+        x, y = position_mur("MH", indice)
+        modifier(_rangée(y) + 1, 4 * x - 1, "-" * 7)
+    # Le mur vertical [x, y] longe la gauche des cases x des rangées y et y + 1
+    for indice in énumérer_bits(murs_v):
+        x, y = position_mur("MV", indice)
+        for ligne in (_rangée(y), _rangée(y) - 1, _rangée(y + 1)):
+            modifier(ligne, 4 * x - 2, "|")
+    return "\n".join("".join(lignes[i]) if i in lignes else gabarit
+                     for i, gabarit in enumerate(_GABARIT)) + "\n"
 
 
 class Quoridor:
@@ -49,6 +102,10 @@ class Quoridor:
         self.joueurs = deepcopy(joueurs)
         self.murs = deepcopy(murs or {"horizontaux": [], "verticaux": []})
         self.max_nom_len = max(len(j["nom"]) for j in self.joueurs)
+        self._pile = []
+        self._hachage = None
+        self._table = None
+        self._mcts = None
 
     def état_partie(self):
         """Produire l'état actuel du jeu.
@@ -90,47 +147,20 @@ class Quoridor:
     def formater_le_damier(self):
         """Formater la représentation graphique du damier.
 
+        Le rendu est mémorisé pour les dernières positions rencontrées: afficher de
+        nouveau une partie inchangée ne coûte que le calcul de sa clé.
+
         Returns:
             str: Chaîne de caractères représentant le damier.
         """
-        damier = [row[:] for row in self.EMPTY_DAMIER]
-
-        # Placement des joueurs
-        p1 = self.joueurs[0]["position"]
-        p2 = self.joueurs[1]["position"]
-        damier[p1[1] - 1][p1[0] - 1] = '1'
-        damier[p2[1] - 1][p2[0] - 1] = '2'
-
-        # Convert lists in "horizontaux" to tuples to make them hashable
-        mh = set(tuple(pos) for pos in self.murs.get("horizontaux", []))
-
-        lignes = []
-        lignes.append("   " + "-" * 35)
-
-        for y in range(9, 0, -1):
-            # Ligne principale avec les cases
-            ligne = f"{y} |"
-            for x in range(1, 10):
-                ligne += f" {damier[y - 1][x - 1]}  "
-            ligne = ligne.rstrip() + " |"
-            lignes.append(ligne)
-
-            # Ligne des murs horizontaux (si ce n'est pas la dernière ligne)
-            if y > 1:
-                if (any((x, y - 1) in mh for x in range(1, 10)) ):
-                    ligne_sep = "  |"
-                    for x in range(1, 9):
-                        ligne_sep += '-------' if (x, y - 1) in mh else '    '
-                        ligne_sep += ''
-                    ligne_sep +="|"
-                else:
-                    ligne_sep = "  |                                   |"
-                lignes.append(ligne_sep)
-
-        lignes.append("--|" + "-" * 35)
-        lignes.append("  | 1   2   3   4   5   6   7   8   9")
-
-        return "\n".join(lignes) + "\n"
+        murs_h = 0
+        for x, y in self.murs["horizontaux"]:
+            murs_h |= 1 << indice_mur("MH", x, y)
+        murs_v = 0
+        for x, y in self.murs["verticaux"]:
+            murs_v |= 1 << indice_mur("MV", x, y)
+        return _dessiner_damier(tuple(case(*j["position"]) for j in self.joueurs),
+                                murs_h, murs_v)
 
     def __str__(self):
         """Représentation en art ascii de l'état actuel de la partie.
@@ -142,6 +172,18 @@ class Quoridor:
         """
         return self.formater_entête() + self.formater_le_damier()
 
+    def damier(self):
+        """Construire le damier compact de l'état actuel du jeu.
+
+        Returns:
+            Damier: le damier des positions des joueurs et des murs.
+        """
+        return Damier.depuis_listes(
+            [j["position"] for j in self.joueurs],
+            self.murs["horizontaux"],
+            self.murs["verticaux"],
+        )
+
     def déplacer_un_joueur(self, joueur, position):
         """Déplace un jeton.
 
@@ -172,20 +214,11 @@ class Quoridor:
             raise QuoridorError(f"La position {position} est invalide.")
 
         # Étape 3: Vérification de la validité du déplacement
-        position_acuelle = tuple(self.joueurs[index_joueur]["position"])
-        position_souhaitée = tuple(position)
-
-        graphe = construire_graphe(
-            [j["position"] for j in self.joueurs],
-            self.murs["horizontaux"],
-            self.murs["verticaux"],
-        )
-
-        if position_souhaitée not in list(graphe.successors(position_acuelle)):
+        if case(x, y) not in self.damier().successeurs(index_joueur):
             raise QuoridorError(f"La position {position} est invalide pour l'état actuel du jeu.")
 
         # Étape 4: Déplacer le joueur
-        self.joueurs[index_joueur]["position"] = list(position_souhaitée)
+        self.joueurs[index_joueur]["position"] = [x, y]
 
     def placer_un_mur(self, joueur, position, orientation):
         """Placer un mur.
@@ -219,41 +252,33 @@ class Quoridor:
         if self.joueurs[index_joueur]["murs"] <= 0:
             raise QuoridorError(f"Le joueur {joueur} a déjà placé tous ses murs.")
 
-        # Étape 3: Vérifier que la position est dans les bornes (1 à 8)
-        x, y = position
-        if not (1 <= x <= 8 and 1 <= y <= 8):
-            raise QuoridorError(f"La position {position} est invalide (en dehors du damier).")
-
-        # Étape 4: Vérifier que l'orientation est valide
+        # Étape 3: Vérifier que l'orientation est valide
         if orientation not in ("MH", "MV"):
             raise QuoridorError("L'orientation du mur est invalide (doit être 'MH' ou 'MV').")
 
+        # Étape 4: Vérifier que le mur ne dépasse pas du damier
+        x, y = position
+        if not mur_valide(orientation, x, y):
+            raise QuoridorError(f"La position {position} est invalide (en dehors du damier).")
+
         # Étape 5: Vérifier qu'aucun mur n'occupe déjà cette position
         if orientation == "MH" and position in self.murs["horizontaux"]:
             raise QuoridorError(f"Un mur horizontal occupe déjà la position {position}.")
         if orientation == "MV" and position in self.murs["verticaux"]:
             raise QuoridorError(f"Un mur vertical occupe déjà la position {position}.")
 
-        # Étape 6: Vérifier que ce mur ne bloque pas tous les chemins
-        murs_temp = deepcopy(self.murs)
-        if orientation == "MH":
-            murs_temp["horizontaux"].append(position)
-        else:
-            murs_temp["verticaux"].append(position)
+        # Étape 6: Vérifier que ce mur ne chevauche ni ne croise un mur existant
+        damier = self.damier()
+        if damier.chevauche(orientation, x, y):
+            raise QuoridorError(f"Un mur occupe déjà la position {position}.")
 
-        graphe = construire_graphe(
-            [j["position"] for j in self.joueurs],
-            murs_temp["horizontaux"],
-            murs_temp["verticaux"]
-        )
-
-        # Vérifie que chaque joueur a toujours un chemin vers sa cible
-        cibles = ["B1", "B2"]
-        for i, joueur_pos in enumerate([j["position"] for j in self.joueurs]):
-            if not nx.has_path(graphe, tuple(joueur_pos), cibles[i]):
+        # Étape 7: Vérifier que ce mur ne bloque pas tous les chemins
+        damier = damier.avec_mur(orientation, x, y)
+        for i in range(2):
+            if not damier.a_un_chemin(i):
                 raise QuoridorError("Vous ne pouvez pas enfermer un joueur.")
 
-        # Étape 7: Ajouter le mur et décrémenter les murs du joueur
+        # Étape 8: Ajouter le mur et décrémenter les murs du joueur
 
         if orientation == "MH":
             self.murs["horizontaux"].append(position)
@@ -309,6 +334,85 @@ class Quoridor:
 
         return (type_coup, position)
 
+    def push_move(self, joueur, type_coup, position):
+        """Jouer un coup hypothétique, sans copie, en mémorisant comment l'annuler.
+
+        Le coup n'est pas validé: cette méthode est destinée à la recherche, qui
+        n'explore que des coups déjà reconnus comme légaux. L'état est modifié sur
+        place et pop_move le restaure exactement. Si la clé de Zobrist a été calculée
+        avec hachage(), elle est mise à jour au passage et le trait change de joueur.
+
+        Args:
+            joueur (int): l'indice du joueur (0 ou 1).
+            type_coup (str): le type de coup ('D' pour déplacement, 'M' pour mur).
+            position (list): [x, y] pour un déplacement, [x, y, orientation] pour un mur.
+        """
+        données = self.joueurs[joueur]
+        ancien_hachage = self._hachage
+        if type_coup == "D":
+            self._pile.append((joueur, type_coup, données["position"], ancien_hachage))
+            if ancien_hachage is not None:
+                self._hachage ^= (zobrist.POSITIONS[joueur][case(*données["position"])]
+                                  ^ zobrist.POSITIONS[joueur][case(position[0], position[1])])
+            données["position"] = [position[0], position[1]]
+        else:
+            clé = "horizontaux" if position[2] == "MH" else "verticaux"
+            self._pile.append((joueur, type_coup, clé, ancien_hachage))
+            if ancien_hachage is not None:
+                murs = zobrist.MURS_H if position[2] == "MH" else zobrist.MURS_V
+                self._hachage ^= (murs[indice_mur(position[2], position[0], position[1])]
+                                  ^ zobrist.RESTANTS[joueur][données["murs"]]
+                                  ^ zobrist.RESTANTS[joueur][données["murs"] - 1])
+            self.murs[clé].append([position[0], position[1]])
+            données["murs"] -= 1
+
+        if ancien_hachage is not None:
+            self._hachage ^= zobrist.TRAIT
+        if joueur == 1:
+            self.tour += 1
+
+    def pop_move(self):
+        """Annuler le dernier coup joué avec push_move.
+
+        Returns:
+            tuple: (joueur, type_coup, position) du coup annulé.
+
+        Raises:
+            QuoridorError: Aucun coup hypothétique à annuler.
+        """
+        if not self._pile:
+            raise QuoridorError("Aucun coup à annuler.")
+
+        joueur, type_coup, mémoire, self._hachage = self._pile.pop()
+        données = self.joueurs[joueur]
+        if type_coup == "D":
+            position = données["position"]
+            données["position"] = mémoire
+        else:
+            position = self.murs[mémoire].pop()
+            position.append("MH" if mémoire == "horizontaux" else "MV")
+            données["murs"] += 1
+
+        if joueur == 1:
+            self.tour -= 1
+
+        return joueur, type_coup, position
+
+    def hachage(self, trait=None):
+        """Produire la clé de Zobrist de la position.
+
+        Args:
+            trait (int, optionnel): l'indice du joueur qui doit jouer. S'il est fourni,
+                la clé est recalculée à partir de zéro et mémorisée, puis maintenue par
+                push_move et pop_move. Sinon, la clé mémorisée est retournée.
+
+        Returns:
+            int: la clé de 64 bits de la position, ou None si elle n'a jamais été calculée.
+        """
+        if trait is not None:
+            self._hachage = zobrist.hacher(self.joueurs, self.murs, trait)
+        return self._hachage
+
     def sélectionner_un_coup(self, joueur):
         """Récupérer le coup.
 
@@ -350,10 +454,10 @@ class Quoridor:
                 x = int(input("Entrez la position x du mur: "))
                 y = int(input("Entrez la position y du mur: "))
                 orientation = input("Entrez l'orientation du mur [MH ou MV]: ").strip().upper()
-                if not (1 <= x <= 8 and 1 <= y <= 8):
-                    raise QuoridorError("La position du mur est invalide (en dehors du damier).")
                 if orientation not in ("MH", "MV"):
                     raise QuoridorError("L'orientation du mur est invalide.")
+                if not mur_valide(orientation, x, y):
+                    raise QuoridorError("La position du mur est invalide (en dehors du damier).")
                 return "M", [x, y, orientation]
 
         except ValueError as exc:
@@ -367,20 +471,38 @@ class Quoridor:
             return self.joueurs[1]["nom"]
         return False
 
-    def jouer_un_coup(self, joueur):
+    def jouer_un_coup(self, joueur, stratégie="heuristique", temps=1.0, processus=1,
+                      pondération=None):
         """Jouer un coup automatique pour un joueur.
 
         Pour le joueur spécifié, jouer automatiquement son meilleur coup pour l'état actuel
         de la partie. Ce coup est soit le déplacement de son jeton, soit le placement d'un
-        mur horizontal ou vertical. La priorité est donnée au placement d'un mur si
-        cela empêche l'adversaire de gagner au prochain coup.
+        mur horizontal ou vertical.
+
+        Avec la stratégie 'heuristique', la priorité est donnée au placement d'un mur si
+        cela empêche l'adversaire de gagner au prochain coup. Avec la stratégie
+        'alphabeta', le coup est lu dans le livre d'ouvertures si la position s'y trouve,
+        sinon il est choisi par une recherche alpha-bêta à approfondissement
+        itératif qui retourne le meilleur coup trouvé à l'échéance; avec plusieurs
+        processus, les coups de la racine sont répartis entre eux. Avec la stratégie
+        'mcts', le coup est choisi par une recherche Monte-Carlo dont l'arbre est
+        conservé d'un coup à l'autre. Lorsqu'aucun joueur
+        n'a plus de murs, quelle que soit la stratégie, le déplacement est choisi par
+        la résolution exacte de la course.
 
         Args:
             joueur (str): le nom du joueur.
+            stratégie (str, optionnel): 'heuristique', 'alphabeta' ou 'mcts'.
+            temps (float, optionnel): le temps alloué à la recherche, en secondes.
+            processus (int, optionnel): le nombre de processus de la recherche 'alphabeta'
+                ou 'mcts'.
+            pondération (Pondération, optionnel): la réflexion menée pendant le tour
+                adverse; avec 'alphabeta', son coup est retourné s'il a été trouvé d'avance.
 
         Raises:
             QuoridorError: Le joueur n'existe pas.
             QuoridorError: La partie est déjà terminée.
+            QuoridorError: La stratégie est inconnue.
 
         Returns:
             tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position.
@@ -398,138 +520,75 @@ class Quoridor:
         if id_joueur == -1:
             raise QuoridorError(f"Le joueur {joueur} n'existe pas.")
 
+        if stratégie not in STRATÉGIES:
+            raise QuoridorError(f"La stratégie {stratégie} est inconnue.")
+        if not self.joueurs[0]["murs"] and not self.joueurs[1]["murs"]:
+            # Course sans murs: le déplacement optimal est connu exactement
+            return ("D", coordonnées(meilleur_déplacement(self.damier(), id_joueur)))
+
+        if stratégie == "alphabeta" and pondération is not None:
+            coup = pondération.consulter(self, id_joueur)
+            if coup is not None:
+                return coup
+        if stratégie == "alphabeta":
+            # Les positions du début de partie sont lues dans le livre d'ouvertures
+            livre = livre_par_défaut()
+            if livre is not None:
+                coup = livre.consulter(zobrist.hacher(self.joueurs, self.murs, id_joueur))
+                if coup is not None:
+                    return coup
+        if stratégie == "alphabeta" and processus > 1:
+            from parallele import RechercheParallèle  # pylint: disable=import-outside-toplevel
+            return RechercheParallèle(processus, temps).meilleur_coup(self, id_joueur)
+        if stratégie == "alphabeta":
+            if self._table is None:
+                self._table = TableTransposition()
+            return Recherche(temps=temps, table=self._table).meilleur_coup(self, id_joueur)
+        if stratégie == "mcts":
+            from mcts import RechercheMonteCarlo  # pylint: disable=import-outside-toplevel
+            if self._mcts is None or self._mcts.processus != processus:
+                self._mcts = RechercheMonteCarlo(temps, processus=processus)
+            self._mcts.temps = temps
+            return self._mcts.meilleur_coup(self, id_joueur)
+
         id_adversaire = 1 - id_joueur
-        pos_joueur = tuple(self.joueurs[id_joueur]["position"])
-        pos_adversaire = tuple(self.joueurs[id_adversaire]["position"])
         murs_restants = self.joueurs[id_joueur]["murs"]
-
-        cible_joueur = "B1" if id_joueur == 0 else "B2"
-        cible_adversaire = "B2" if id_joueur == 0 else "B1"
+        damier = self.damier()
 
         if murs_restants > 0:
-            graphe_actuel = construire_graphe(
-                [self.joueurs[0]["position"], self.joueurs[1]["position"]],
-                self.murs["horizontaux"],
-                self.murs["verticaux"]
-            )
-
-            if nx.has_path(graphe_actuel, pos_adversaire, cible_adversaire):
-                chemin_adversaire = nx.shortest_path(graphe_actuel, pos_adversaire, cible_adversaire)
-                ligne_victoire_adversaire = 9 if id_adversaire == 0 else 1
-
-                if len(chemin_adversaire) > 1 and isinstance(chemin_adversaire[1], tuple) and chemin_adversaire[1][1] == ligne_victoire_adversaire:
-                    coup_bloquant = self._trouver_coup_bloquant(id_joueur, id_adversaire, cible_joueur, cible_adversaire)
-                    if coup_bloquant:
-                        return coup_bloquant
-
-        graphe_final = construire_graphe(
-            [self.joueurs[0]["position"], self.joueurs[1]["position"]],
-            self.murs["horizontaux"],
-            self.murs["verticaux"]
-        )
+            # L'adversaire gagne au prochain coup s'il peut atteindre sa ligne d'arrivée
+            if any(LIGNES_BUT[id_adversaire] >> s & 1 for s in damier.successeurs(id_adversaire)):
+                coup_bloquant = self._trouver_coup_bloquant(id_joueur, id_adversaire)
+                if coup_bloquant:
+                    return coup_bloquant
 
-        if nx.has_path(graphe_final, pos_joueur, cible_joueur):
-            chemin_joueur = nx.shortest_path(graphe_final, pos_joueur, cible_joueur)
-            prochaine_position = chemin_joueur[1] if len(chemin_joueur) > 1 else cible_joueur
+        # Avancer vers la case accessible la plus proche de la ligne d'arrivée
+        distances = damier.carte_distances(id_joueur)
+        voisins = [s for s in damier.successeurs(id_joueur) if distances[s] is not None]
+        if voisins:
+            return ("D", coordonnées(min(voisins, key=distances.__getitem__)))
 
-            if isinstance(prochaine_position, str):
-                 if len(chemin_joueur) > 1:
-                    prochaine_position = chemin_joueur[-2]
-                 else:
-                     raise QuoridorError("Erreur de chemin: Pas de case intermédiaire avant la cible.")
+        voisins = damier.successeurs(id_joueur)
+        if voisins:
+            return ("D", coordonnées(voisins[0]))
 
-            if isinstance(prochaine_position, tuple):
-                return ("D", list(prochaine_position))
-            else:
-                raise QuoridorError(f"Erreur inattendue: prochaine_position invalide '{prochaine_position}'.")
+        raise QuoridorError("Aucun coup valide trouvé (pas de chemin et pas de voisins?).")
 
-        else:
-            voisins = list(graphe_final.successors(pos_joueur))
-            if voisins:
-                voisins_reels = [v for v in voisins if isinstance(v, tuple)]
-                if voisins_reels:
-                    return ("D", list(voisins_reels[0]))
-
-            raise QuoridorError("Aucun coup valide trouvé (pas de chemin et pas de voisins?).")
-
-
-    def _trouver_coup_bloquant(self, id_joueur, id_adversaire, cible_joueur, cible_adversaire):
+    def _trouver_coup_bloquant(self, id_joueur, id_adversaire):
         """
-        Cherche un placement de mur qui bloque l'adversaire sans bloquer le joueur.
+        Cherche le mur légal qui allonge le plus le chemin de l'adversaire,
+        en allongeant le moins possible celui du joueur.
         Helper pour jouer_un_coup.
         """
-        pos_joueur = tuple(self.joueurs[id_joueur]["position"])
-        pos_adversaire = tuple(self.joueurs[id_adversaire]["position"])
-
-
-        for x in range(1, 9):
-            for y in range(1, 9):
-                for orientation in ["MH", "MV"]:
-                    pos_mur = [x, y]
-                    murs_h_temp = deepcopy(self.murs["horizontaux"])
-                    murs_v_temp = deepcopy(self.murs["verticaux"])
-                    mur_ajoute = False # Flag pour savoir si on a tenté d'ajouter
-                    placement_valide = True # Flag pour la validation initiale
-
-                    # 1. Valider le placement potentiel du mur (simplifié)
-                    #    et préparer les listes temporaires
-                    if orientation == "MH":
-                         # Vérifie si un mur H est déjà là, ou juste à gauche/droite
-                         # Vérifie si un mur V croise au même point (simplifié)
-                        if pos_mur in murs_h_temp or \
-                           [pos_mur[0]-1, pos_mur[1]] in murs_h_temp or \
-                           [pos_mur[0]+1, pos_mur[1]] in murs_h_temp or \
-                           (pos_mur in murs_v_temp): # Chevauchement simple avec un mur V
-                            placement_valide = False
-                        else:
-                            murs_h_temp.append(pos_mur)
-                            mur_ajoute = True
-                    else: # orientation == "MV"
-                        # Vérifie si un mur V est déjà là, ou juste au dessus/dessous
-                        # Vérifie si un mur H croise au même point (simplifié)
-                        if pos_mur in murs_v_temp or \
-                           [pos_mur[0], pos_mur[1]-1] in murs_v_temp or \
-                           [pos_mur[0], pos_mur[1]+1] in murs_v_temp or \
-                           (pos_mur in murs_h_temp): # Chevauchement simple avec un mur H
-                            placement_valide = False
-                        else:
-                            murs_v_temp.append(pos_mur)
-                            mur_ajoute = True
-
-                    # Si la validation initiale échoue, passer au mur suivant
-                    if not placement_valide:
-                        # if pos_mur == [4, 1] and orientation == 'MV':
-                        continue
-
-                    # Si le mur n'a pas pu être ajouté pour une raison quelconque (ne devrait pas arriver ici si valide)
-                    if not mur_ajoute:
-                         continue
-
-                    # 2. Essayer de construire le graphe et vérifier les chemins
-                    try:
-                        # Essayer de construire le graphe AVEC le mur temporaire
-                        graphe_temp = construire_graphe(
-                            [self.joueurs[0]["position"], self.joueurs[1]["position"]],
-                            murs_h_temp,
-                            murs_v_temp
-                        )
-
-                        # Si la construction du graphe réussit, vérifier les chemins
-                        adversaire_bloque = not nx.has_path(graphe_temp, pos_adversaire, cible_adversaire)
-                        joueur_non_bloque = nx.has_path(graphe_temp, pos_joueur, cible_joueur)
-
-                        # Imprimer l'évaluation pour les murs spécifiques en [4, 1
-                        # Si ce mur remplit les conditions de blocage
-                        if adversaire_bloque and joueur_non_bloque:
-                            return ("M", [x, y, orientation])
-
-                    except nx.NetworkXError as e:
-                         continue
-                    except Exception as e:
-                         # Attrape toute autre exception inattendue
-                         continue
-
-        return None # Aucun coup bloquant trouvé
+        damier = self.damier()
+        sa_distance = damier.distance(id_adversaire)
+        meilleur, meilleure_clé = None, None
+        for orientation, x, y, distances in analyser_murs(damier):
+            clé = (distances[id_adversaire], -distances[id_joueur])
+            if distances[id_adversaire] > sa_distance and (meilleur is None or clé > meilleure_clé):
+                meilleur, meilleure_clé = ("M", [x, y, orientation]), clé
+
+        return meilleur # None si aucun mur ne ralentit l'adversaire
 
 def interpréter_la_ligne_de_commande():
     """
@@ -543,7 +602,7 @@ def interpréter_la_ligne_de_commande():
     """
     parser = argparse.ArgumentParser(
         description='Jeu Quoridor',
-        usage='main.py [-h] [-a] [-x] idul' # Correspond à l'usage demandé
+        usage='main.py [-h] [-a] [-x] [-s STRATÉGIE] [-t TEMPS] [-p PROCESSUS] idul'
     )
 
     parser.add_argument(
@@ -563,4 +622,25 @@ def interpréter_la_ligne_de_commande():
         help='Activer le mode graphique.'
     )
 
+    parser.add_argument(
+        '-s', '--stratégie',
+        choices=STRATÉGIES,
+        default='heuristique',
+        help='Stratégie du mode automatique.'
+    )
+
+    parser.add_argument(
+        '-t', '--temps',
+        type=float,
+        default=1.0,
+        help='Temps de réflexion par coup, en secondes.'
+    )
+
+    parser.add_argument(
+        '-p', '--processus',
+        type=int,
+        default=1,
+        help='Nombre de processus de la recherche alpha-bêta.'
+    )
+
     return parser.parse_args()
\ No newline at end of file
@@ -41,6 +41,10 @@ class QuoridorX(Quoridor):
         self.wall_drawing_turtle.penup()
         self.wall_drawing_turtle.speed(0)
         self.wall_drawing_turtle.color("black")
+        self.wall_drawing_turtle.pensize(5) # Épaisseur du mur
+        # Éléments déjà dessinés, pour ne dessiner que les changements
+        self._drawn_positions = None
+        self._drawn_walls = set()
         # S'assurer que le constructeur appelle l'initialisation graphique
         self.init_graphics()
         # L'affichage initial se fera lors du premier appel à afficher() dans la boucle main
@@ -94,58 +98,60 @@ class QuoridorX(Quoridor):
 
 
     def update_screen(self):
-        """Met à jour l'affichage des éléments dynamiques (joueurs, murs)."""
-        # --- Placer les joueurs ---
-        for i, joueur in enumerate(self.joueurs):
-            x, y = joueur["position"]
-            sx, sy = self._get_screen_coords(x, y)
-            self.player_turtles[i].goto(sx, sy) # Positionne au centre de la case
+        """Met à jour l'affichage des éléments dynamiques (joueurs, murs).
+
+        Seuls les changements depuis le dernier affichage sont dessinés: les jetons
+        déplacés et les murs ajoutés. Si rien n'a changé, l'écran n'est pas rafraîchi.
+        Les murs ne sont tous redessinés que si l'un d'eux a disparu (resynchronisation).
+        """
+        positions = [tuple(joueur["position"]) for joueur in self.joueurs]
+        murs = {("MH", x, y) for x, y in self.murs["horizontaux"]}
+        murs |= {("MV", x, y) for x, y in self.murs["verticaux"]}
+        if positions == self._drawn_positions and murs == self._drawn_walls:
+            return
+
+        # --- Placer les joueurs qui ont bougé ---
+        for i, (x, y) in enumerate(positions):
+            if self._drawn_positions is None or self._drawn_positions[i] != (x, y):
+                sx, sy = self._get_screen_coords(x, y)
+                self.player_turtles[i].goto(sx, sy) # Positionne au centre de la case
+        self._drawn_positions = positions
 
         # --- Dessiner les murs ---
-        # Effacer les anciens murs dessinés par cette tortue
-        self.wall_drawing_turtle.clear()
+        if not self._drawn_walls <= murs:
+            # Un mur a disparu: effacer les anciens murs dessinés par cette tortue
+            self.wall_drawing_turtle.clear()
+            self._drawn_walls = set()
+        for orientation, x, y in murs - self._drawn_walls:
+            self._draw_wall(orientation, x, y)
+        self._drawn_walls = murs
 
-        # Murs horizontaux (barre entre y et y-1)
-        self.wall_drawing_turtle.pensize(5) # Épaisseur du mur
-        for x, y in self.murs["horizontaux"]:
+        # Mettre à jour l'écran après tous les dessins
+        self.screen.update()
+
+    def _draw_wall(self, orientation, x, y):
+        """Dessine un mur horizontal ('MH') ou vertical ('MV') avec la tortue des murs."""
+        start_x, start_y = self._get_screen_coords(x, y) # Coin bas-gauche de la case [x,y]
+        if orientation == "MH":
             # Le mur H [x, y] est entre (x, y) et (x+1, y) ET entre (x, y-1) et (x+1, y-1)
             # Il bloque le passage vertical entre la ligne y-1 et y, sur les colonnes x et x+1
             # On dessine une barre horizontale sur la ligne de grille y-1, entre x-1 et x+1
-            start_x, start_y = self._get_screen_coords(x, y) # Coin bas-gauche de la case [x,y]
-            # Coordonnée Y de la ligne de séparation
             sep_y = start_y - self.grid_size / 2
-            # Coordonnée X du début du mur (bord gauche de la case x)
             sep_start_x = start_x - self.grid_size / 2
-            # Coordonnée X de la fin du mur (bord droit de la case x+1)
-            sep_end_x = sep_start_x + 2 * self.grid_size
-
-            self.wall_drawing_turtle.penup()
-            self.wall_drawing_turtle.goto(sep_start_x, sep_y)
-            self.wall_drawing_turtle.pendown()
-            self.wall_drawing_turtle.goto(sep_end_x, sep_y)
-            self.wall_drawing_turtle.penup()
-
-        # Murs verticaux (barre entre x et x-1)
-        for x, y in self.murs["verticaux"]:
+            début, fin = (sep_start_x, sep_y), (sep_start_x + 2 * self.grid_size, sep_y)
+        else:
             # Le mur V [x, y] est entre (x, y) et (x, y+1) ET entre (x-1, y) et (x-1, y+1)
             # Il bloque le passage horizontal entre la colonne x-1 et x, sur les lignes y et y+1
             # On dessine une barre verticale sur la ligne de grille x-1, entre y-1 et y+1
-            start_x, start_y = self._get_screen_coords(x, y) # Coin bas-gauche de la case [x,y]
-            # Coordonnée X de la ligne de séparation
             sep_x = start_x - self.grid_size / 2
-            # Coordonnée Y du début du mur (bord bas de la case y)
             sep_start_y = start_y - self.grid_size / 2
-            # Coordonnée Y de la fin du mur (bord haut de la case y+1)
-            sep_end_y = sep_start_y + 2 * self.grid_size
+            début, fin = (sep_x, sep_start_y), (sep_x, sep_start_y + 2 * self.grid_size)
 
-            self.wall_drawing_turtle.penup()
-            self.wall_drawing_turtle.goto(sep_x, sep_start_y)
-            self.wall_drawing_turtle.pendown()
-            self.wall_drawing_turtle.goto(sep_x, sep_end_y)
-            self.wall_drawing_turtle.penup()
-
-        # Mettre à jour l'écran après tous les dessins
-        self.screen.update()
+        self.wall_drawing_turtle.penup()
+        self.wall_drawing_turtle.goto(*début)
+        self.wall_drawing_turtle.pendown()
+        self.wall_drawing_turtle.goto(*fin)
+        self.wall_drawing_turtle.penup()
 
     # Hérite de __str__ de Quoridor si on veut l'affichage ASCII aussi,
     # ou on peut le redéfinir pour indiquer que c'est une instance graphique.
@@ -0,0 +1,315 @@
+"""Module de recherche alpha-bêta du jeu Quoridor
+
+La recherche explore les coups hypothétiques avec Quoridor.push_move et
+Quoridor.pop_move, sans jamais copier l'état de la partie, et évalue les
+positions par la différence des longueurs des plus courts chemins des joueurs;
+les positions où aucun joueur n'a plus de murs sont évaluées exactement par
+le module finale.
+Une table de transposition, indexée par la clé de Zobrist maintenue par
+push_move, évite de réanalyser une position atteinte par un autre ordre de coups.
+
+Classes:
+    * TempsÉcoulé - Exception levée lorsque l'échéance de la recherche est atteinte.
+    * Recherche - Recherche alpha-bêta à approfondissement itératif.
+
+Functions:
+    * coups_candidats - Générer les coups retenus d'un joueur sur un damier.
+    * évaluer - Évaluer une position du point de vue d'un joueur.
+    * formater_coup - Convertir un coup interne en tuple (type_coup, position) de l'API.
+"""
+
+import time
+from quoridor_error import QuoridorError
+from damier import LIGNES_BUT, coordonnées
+import finale
+from legalite import analyser_murs
+from transposition import EXACTE, INFÉRIEURE, SUPÉRIEURE
+
+VICTOIRE = 10000
+# Les scores au-delà de ce seuil annoncent une victoire forcée
+SEUIL_VICTOIRE = VICTOIRE - 1000
+
+
+class TempsÉcoulé(Exception):
+    """Exception levée lorsque l'échéance de la recherche est atteinte."""
+
+
+class Recherche:
+    """Recherche alpha-bêta (négamax) à approfondissement itératif.
+
+    Les profondeurs sont explorées une à une jusqu'à l'échéance; le meilleur coup
+    de la dernière profondeur terminée est alors retourné, ou celui de la
+    profondeur en cours s'il a déjà été démontré meilleur.
+
+    Attributes:
+        temps (float): le budget de temps par coup, en secondes.
+        profondeur_max (int): la profondeur maximale de l'approfondissement itératif.
+        largeur_murs (int): le nombre maximal de murs examinés à chaque nœud.
+        table (TableTransposition): la table de transposition consultée, ou None.
+        nœuds (int): le nombre de nœuds visités lors de la dernière recherche.
+        profondeur (int): la dernière profondeur entièrement explorée.
+        historique (List): les tuples (profondeur, score, coup) des profondeurs
+            entièrement explorées lors de la dernière recherche.
+        interrompue (bool): vrai si interrompre a été appelée.
+    """
+
+    def __init__(self, temps=1.0, profondeur_max=20, largeur_murs=10, table=None):
+        """Constructeur de la classe Recherche.
+
+        Args:
+            temps (float, optionnel): le budget de temps par coup, en secondes.
+            profondeur_max (int, optionnel): la profondeur maximale explorée.
+            largeur_murs (int, optionnel): le nombre maximal de murs examinés à chaque
+                nœud, choisis parmi ceux qui allongent le plus le chemin adverse.
+            table (TableTransposition, optionnel): la table de transposition à utiliser;
+                elle peut être conservée d'un coup à l'autre.
+        """
+        self.temps = temps
+        self.profondeur_max = profondeur_max
+        self.largeur_murs = largeur_murs
+        self.table = table
+        self.nœuds = 0
+        self.profondeur = 0
+        self.historique = []
+        self.interrompue = False
+        self._échéance = 0.0
+        self._partiel = None
+
+    def meilleur_coup(self, partie, joueur, coups=None):
+        """Chercher le meilleur coup d'un joueur dans le temps alloué.
+
+        Args:
+            partie (Quoridor): la partie à analyser; elle est restaurée à la fin.
+            joueur (int): l'indice du joueur qui doit jouer (0 ou 1).
+            coups (List, optionnel): les coups de la racine à examiner, sous la forme
+                produite par coups_ordonnés; par défaut, tous les coups retenus.
+
+        Returns:
+            tuple: Un tuple composé d'un type de coup ('D', 'M') et de la position.
+                   Pour 'D': [x, y]
+                   Pour 'M': [x, y, orientation ('MH' ou 'MV')]
+
+        Raises:
+            QuoridorError: Le joueur n'a aucun coup légal.
+        """
+        self._échéance = time.perf_counter() + self.temps
+        if self.interrompue:
+            self._échéance = float("-inf")
+        self.nœuds = 0
+        self.profondeur = 0
+        self.historique = []
+        partie.hachage(joueur)
+        if self.table is not None:
+            self.table.nouvelle_recherche()
+
+        coups = list(coups) if coups is not None else self.coups_ordonnés(partie, joueur)
+        if not coups:
+            raise QuoridorError("Aucun coup valide trouvé.")
+        meilleur = coups[0]
+        for profondeur in range(1, self.profondeur_max + 1):
+            self._partiel = None
+            try:
+                score = self._racine(partie, joueur, coups, profondeur)
+            except TempsÉcoulé:
+                if self._partiel is not None:
+                    meilleur = self._partiel
+                break
+            meilleur = self._partiel
+            self.profondeur = profondeur
+            self.historique.append((profondeur, score, meilleur))
+
+            # Explorer d'abord le meilleur coup à la profondeur suivante
+            coups.remove(meilleur)
+            coups.insert(0, meilleur)
+            if abs(score) >= SEUIL_VICTOIRE:
+                break
+
+        return formater_coup(meilleur)
+
+    def interrompre(self):
+        """Arrêter la recherche au plus tôt; elle peut être appelée d'un autre fil.
+
+        La recherche en cours, ou la prochaine, retourne alors son meilleur coup partiel.
+        """
+        self.interrompue = True
+        self._échéance = float("-inf")
+
+    def _racine(self, partie, joueur, coups, profondeur):
+        """Explorer les coups de la racine à une profondeur donnée."""
+        alpha = -VICTOIRE - 1
+        for coup in coups:
+            partie.push_move(joueur, coup[0], coup[1:])
+            try:
+                score = -self._négamax(partie, 1 - joueur, profondeur - 1,
+                                       -VICTOIRE - 1, -alpha, 1)
+            finally:
+                partie.pop_move()
+            if score > alpha:
+                alpha = score
+                self._partiel = coup
+        return alpha
+
+    def _négamax(self, partie, joueur, profondeur, alpha, bêta, ply):
+        """Évaluer une position du point de vue du joueur qui doit jouer."""
+        self.nœuds += 1
+        if time.perf_counter() > self._échéance:
+            raise TempsÉcoulé()
+
+        damier = partie.damier()
+        adversaire = 1 - joueur
+        if LIGNES_BUT[adversaire] >> damier.positions[adversaire] & 1:
+            return -VICTOIRE + ply
+        if not partie.joueurs[0]["murs"] and not partie.joueurs[1]["murs"]:
+            # Course sans murs: l'issue exacte est connue
+            issue = finale.valeur(damier, joueur)
+            if issue > 0:
+                return VICTOIRE - ply - issue
+            if issue < 0:
+                return -VICTOIRE + ply - issue
+            return 0
+        if profondeur == 0:
+            return évaluer(partie, damier, joueur)
+
+        clé = partie.hachage()
+        coup_mémorisé = None
+        if self.table is not None:
+            entrée = self.table.consulter(clé)
+            if entrée is not None:
+                coup_mémorisé = entrée.coup
+                if entrée.profondeur >= profondeur:
+                    score = _score_lu(entrée.score, ply)
+                    if (entrée.borne == EXACTE
+                            or entrée.borne == INFÉRIEURE and score >= bêta
+                            or entrée.borne == SUPÉRIEURE and score <= alpha):
+                        return score
+
+        coups = self.coups_ordonnés(partie, joueur, damier)
+        if coup_mémorisé in coups:
+            coups.remove(coup_mémorisé)
+            coups.insert(0, coup_mémorisé)
+
+        alpha_initial = alpha
+        meilleur_score = -VICTOIRE - 1
+        meilleur_coup = None
+        for coup in coups:
+            partie.push_move(joueur, coup[0], coup[1:])
+            try:
+                score = -self._négamax(partie, adversaire, profondeur - 1, -bêta, -alpha, ply + 1)
+            finally:
+                partie.pop_move()
+            if score > meilleur_score:
+                meilleur_score = score
+                meilleur_coup = coup
+                alpha = max(alpha, score)
+            if score >= bêta:
+                break
+
+        if self.table is not None:
+            if meilleur_score >= bêta:
+                borne = INFÉRIEURE
+            elif meilleur_score > alpha_initial:
+                borne = EXACTE
+            else:
+                borne = SUPÉRIEURE
+            self.table.enregistrer(clé, profondeur, _score_écrit(meilleur_score, ply),
+                                   borne, meilleur_coup)
+        return meilleur_score
+
+    def coups_ordonnés(self, partie, joueur, damier=None):
+        """Générer les coups légaux d'un joueur, les plus prometteurs en premier.
+
+        Les déplacements sont classés selon le raccourcissement du chemin du joueur
+        et les murs selon l'allongement net du chemin adverse; seuls les murs qui
+        allongent le chemin adverse sont retenus, au plus largeur_murs d'entre eux.
+
+        Args:
+            partie (Quoridor): la partie à analyser.
+            joueur (int): l'indice du joueur (0 ou 1).
+            damier (Damier, optionnel): le damier de la partie, s'il est déjà construit.
+
+        Returns:
+            List: des tuples ('D', x, y) ou ('M', x, y, orientation).
+        """
+        return coups_candidats(damier or partie.damier(), joueur,
+                               partie.joueurs[joueur]["murs"], self.largeur_murs)
+
+
+def coups_candidats(damier, joueur, murs_restants, largeur_murs=10):
+    """Générer les coups retenus d'un joueur sur un damier, les plus prometteurs en premier.
+
+    Args:
+        damier (Damier): le damier à analyser.
+        joueur (int): l'indice du joueur (0 ou 1).
+        murs_restants (int): le nombre de murs que le joueur peut encore poser.
+        largeur_murs (int, optionnel): le nombre maximal de murs retenus.
+
+    Returns:
+        List: des tuples ('D', x, y) ou ('M', x, y, orientation).
+    """
+    adversaire = 1 - joueur
+    distances = damier.carte_distances(joueur)
+    ma_distance = distances[damier.positions[joueur]]
+
+    candidats = []
+    for numéro in damier.successeurs(joueur):
+        if distances[numéro] is not None:
+            x, y = coordonnées(numéro)
+            candidats.append((ma_distance - distances[numéro], ("D", x, y)))
+
+    if murs_restants > 0:
+        sa_distance = damier.distance(adversaire)
+        murs = []
+        for orientation, x, y, distances in analyser_murs(damier):
+            if distances[adversaire] > sa_distance:
+                gain = (distances[adversaire] - sa_distance) - (distances[joueur] - ma_distance)
+                murs.append((gain, ("M", x, y, orientation)))
+        murs.sort(key=lambda candidat: candidat[0], reverse=True)
+        candidats.extend(murs[:largeur_murs])
+
+    candidats.sort(key=lambda candidat: candidat[0], reverse=True)
+    return [coup for _, coup in candidats]
+
+
+def évaluer(partie, damier, joueur):
+    """Évaluer une position du point de vue d'un joueur.
+
+    Args:
+        partie (Quoridor): la partie à évaluer.
+        damier (Damier): le damier de la partie.
+        joueur (int): l'indice du joueur (0 ou 1).
+
+    Un mur en réserve vaut un peu plus qu'une case d'avance: sans cela, la
+    recherche épuise ses murs pour des gains immédiats et reste sans défense
+    lorsque l'adversaire approche de sa ligne d'arrivée.
+
+    Returns:
+        int: la différence des longueurs des chemins et celle des murs restants,
+            pondérées.
+    """
+    adversaire = 1 - joueur
+    écart = damier.distance(adversaire) - damier.distance(joueur)
+    murs = partie.joueurs[joueur]["murs"] - partie.joueurs[adversaire]["murs"]
+    return 10 * écart + 12 * murs
+
+
+def _score_écrit(score, ply):
+    """Rendre un score de victoire relatif à la position plutôt qu'à la racine."""
+    if score >= SEUIL_VICTOIRE:
+        return score + ply
+    if score <= -SEUIL_VICTOIRE:
+        return score - ply
+    return score
+
+
+def _score_lu(score, ply):
+    """Ramener un score de victoire lu dans la table à la distance de la racine."""
+    if score >= SEUIL_VICTOIRE:
+        return score - ply
+    if score <= -SEUIL_VICTOIRE:
+        return score + ply
+    return score
+
+
+def formater_coup(coup):
+    """Convertir un coup interne en tuple (type_coup, position) de l'API."""
+    return coup[0], list(coup[1:])
@@ -0,0 +1,172 @@
+"""Module du serveur de parties local
+
+Reproduit hors ligne les trois points d'entrée de l'API et leurs codes de
+retour: 200, 401 pour une authentification refusée, 404 pour une partie
+inconnue et 406 pour une requête refusée. L'adversaire est un joueur
+automatique local. Une SessionLocale se substitue à la session HTTP du
+ClientAPI, si bien que le client, et tout ce qui l'utilise, fonctionne sans
+réseau et sans modification.
+
+Classes:
+    * RéponseLocale - Réponse produite par le serveur local.
+    * ServeurLocal - Serveur de parties hors ligne.
+    * SessionLocale - Session HTTP qui adresse les requêtes au serveur local.
+"""
+
+import threading
+import time
+import uuid
+from quoridor import Quoridor
+from quoridor_error import QuoridorError
+
+
+class RéponseLocale:
+    """Réponse produite par le serveur local.
+
+    Attributes:
+        status_code (int): le code de retour HTTP.
+    """
+
+    def __init__(self, status_code, contenu):
+        """Constructeur de la classe RéponseLocale.
+
+        Args:
+            status_code (int): le code de retour HTTP.
+            contenu (Dict): le corps de la réponse.
+        """
+        self.status_code = status_code
+        self._contenu = contenu
+
+    def json(self):
+        """Produire le corps de la réponse."""
+        return self._contenu
+
+
+class ServeurLocal:
+    """Serveur de parties hors ligne.
+
+    Chaque partie oppose le joueur authentifié, qui commence, à un joueur
+    automatique nommé ADVERSAIRE qui répond aussitôt à chacun de ses coups.
+
+    Attributes:
+        jetons (Dict): les secrets acceptés pour chaque IDUL; None pour tout accepter.
+        stratégie (str): la stratégie de l'adversaire.
+        temps (float): le temps de réflexion de l'adversaire, en secondes.
+        parties (Dict): pour chaque identifiant, l'IDUL du joueur et la partie.
+        réflexion (float): le temps total de réflexion de l'adversaire, en secondes.
+    """
+
+    ADVERSAIRE = "robot"
+
+    def __init__(self, jetons=None, stratégie="heuristique", temps=0.1):
+        """Constructeur de la classe ServeurLocal.
+
+        Args:
+            jetons (Dict, optionnel): les secrets acceptés pour chaque IDUL.
+            stratégie (str, optionnel): la stratégie de l'adversaire.
+            temps (float, optionnel): le temps de réflexion de l'adversaire, en secondes.
+        """
+        self.jetons = jetons
+        self.stratégie = stratégie
+        self.temps = temps
+        self.parties = {}
+        self.réflexion = 0.0
+        self._verrou = threading.Lock()
+
+    def traiter(self, méthode, chemin, auth, corps=None):
+        """Traiter une requête adressée à l'API.
+
+        Args:
+            méthode (str): la méthode HTTP.
+            chemin (str): le chemin relatif à l'adresse de base, comme '/parties/<id>'.
+            auth (tuple): l'IDUL et le secret.
+            corps (Dict, optionnel): le corps JSON de la requête.
+
+        Returns:
+            RéponseLocale: la réponse du serveur.
+        """
+        idul, secret = auth
+        if self.jetons is not None and self.jetons.get(idul) != secret:
+            return RéponseLocale(401, {"message": "Authentification refusée."})
+
+        segments = chemin.strip("/").split("/")
+        if segments[0] != "parties" or len(segments) > 2:
+            return RéponseLocale(404, {"message": f"Ressource {chemin} introuvable."})
+        if len(segments) == 1:
+            if méthode != "POST":
+                return RéponseLocale(406, {"message": f"Méthode {méthode} refusée."})
+            return self._créer(idul)
+
+        with self._verrou:
+            inscrite = self.parties.get(segments[1])
+        if inscrite is None or inscrite[0] != idul:
+            return RéponseLocale(404, {"message": f"La partie {segments[1]} n'existe pas."})
+        if méthode == "GET":
+            return RéponseLocale(200, {"id": segments[1], "état": inscrite[1].état_partie()})
+        if méthode == "PUT":
+            return self._jouer(inscrite[1], idul, corps or {})
+        return RéponseLocale(406, {"message": f"Méthode {méthode} refusée."})
+
+    def _créer(self, idul):
+        """Créer une partie pour un joueur."""
+        if idul == self.ADVERSAIRE:
+            return RéponseLocale(406, {"message": f"L'IDUL {idul} est réservé."})
+        partie = Quoridor([
+            {"nom": idul, "murs": 10, "position": [5, 1]},
+            {"nom": self.ADVERSAIRE, "murs": 10, "position": [5, 9]},
+        ])
+        id_partie = str(uuid.uuid4())
+        with self._verrou:
+            self.parties[id_partie] = (idul, partie)
+        return RéponseLocale(200, {"id": id_partie, "état": partie.état_partie()})
+
+    def _jouer(self, partie, idul, corps):
+        """Appliquer le coup du joueur, puis la réponse de l'adversaire."""
+        try:
+            partie.appliquer_un_coup(idul, corps.get("position"), corps.get("coup"))
+        except (QuoridorError, TypeError, ValueError) as erreur:
+            return RéponseLocale(406, {"message": str(erreur)})
+        gagnant = partie.partie_terminée()
+        if gagnant:
+            return RéponseLocale(200, {"partie": "terminée", "gagnant": gagnant})
+
+        try:
+            départ = time.perf_counter()
+            coup, position = partie.jouer_un_coup(self.ADVERSAIRE, self.stratégie, self.temps)
+            with self._verrou:
+                self.réflexion += time.perf_counter() - départ
+            partie.appliquer_un_coup(self.ADVERSAIRE, position, coup)
+        except QuoridorError as erreur:
+            # Une défaillance de l'adversaire est une erreur du serveur, pas de la requête
+            return RéponseLocale(500, {"message": str(erreur)})
+        gagnant = partie.partie_terminée()
+        if gagnant:
+            return RéponseLocale(200, {"partie": "terminée", "gagnant": gagnant})
+        return RéponseLocale(200, {"partie": "en cours", "coup": coup, "position": position})
+
+
+class SessionLocale:
+    """Session HTTP qui adresse les requêtes au serveur local.
+
+    Elle offre la méthode request d'une Session de requests, ce qui suffit au
+    ClientAPI: ClientAPI(session=SessionLocale(ServeurLocal())).
+
+    Attributes:
+        serveur (ServeurLocal): le serveur qui traite les requêtes.
+    """
+
+    def __init__(self, serveur=None):
+        """Constructeur de la classe SessionLocale.
+
+        Args:
+            serveur (ServeurLocal, optionnel): le serveur à utiliser; un nouveau par défaut.
+        """
+        self.serveur = serveur or ServeurLocal()
+
+    def request(self, method, url, auth=None, json=None, **_):
+        """Traiter une requête; l'adresse de base est ignorée."""
+        chemin = "/parties" + url.split("/parties", 1)[-1] if "/parties" in url else url
+        return self.serveur.traiter(method, chemin, auth or (None, None), json)
+
+    def close(self):
+        """Ne rien faire: aucune connexion n'est ouverte."""
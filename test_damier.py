@@ -0,0 +1,52 @@
+"""Tests du générateur de déplacements et des coups hypothétiques
+
+Les déplacements du damier compact sont comparés au graphe de référence de
+construire_graphe, et push_move suivi de pop_move doit restaurer exactement
+la partie et sa clé de Zobrist.
+"""
+
+import copy
+from damier import Damier, coordonnées
+from graphe import construire_graphe
+from legalite import murs_légaux
+from quoridor import Quoridor
+import zobrist
+
+
+def _partie(état):
+    """Créer une partie à partir d'un état."""
+    return Quoridor(copy.deepcopy(état["joueurs"]), copy.deepcopy(état["murs"]))
+
+
+def test_successeurs_conformes_au_graphe(positions):
+    """Les déplacements du damier sont ceux du graphe de référence."""
+    for état, _ in positions:
+        joueurs = [joueur["position"] for joueur in état["joueurs"]]
+        damier = Damier.depuis_listes(joueurs, état["murs"]["horizontaux"],
+                                      état["murs"]["verticaux"])
+        graphe = construire_graphe(joueurs, état["murs"]["horizontaux"],
+                                   état["murs"]["verticaux"])
+        for joueur in range(2):
+            attendus = {case for case in graphe.successors(tuple(joueurs[joueur]))
+                        if isinstance(case, tuple)}
+            obtenus = {tuple(coordonnées(numéro)) for numéro in damier.successeurs(joueur)}
+            assert obtenus == attendus, (état, joueur)
+
+
+def test_push_pop_restaure_la_partie(positions):
+    """Chaque coup légal joué puis annulé laisse la partie et sa clé intactes."""
+    for état, trait in positions[::4]:
+        partie = _partie(état)
+        damier = partie.damier()
+        coups = [("D", list(coordonnées(numéro))) for numéro in damier.successeurs(trait)]
+        if partie.joueurs[trait]["murs"]:
+            coups += [("M", [x, y, orientation])
+                      for orientation, x, y in murs_légaux(damier)]
+        clé = partie.hachage(trait)
+        avant = (copy.deepcopy(partie.joueurs), copy.deepcopy(partie.murs), partie.tour)
+        for type_coup, position in coups:
+            partie.push_move(trait, type_coup, position)
+            assert partie.hachage() == zobrist.hacher(partie.joueurs, partie.murs, 1 - trait)
+            assert partie.pop_move() == (trait, type_coup, position)
+            assert (partie.joueurs, partie.murs, partie.tour) == avant
+            assert partie.hachage() == clé
@@ -0,0 +1,55 @@
+"""Tests de l'enregistrement et de la relecture des parties"""
+
+import pytest
+from autojeu import nouvelle_partie
+from enregistrement import SIGNATURE, Enregistreur, lire_parties, rejouer
+
+
+def _jouer(enregistreur, limite=200):
+    """Jouer une partie heuristique en l'enregistrant; retourner ses coups et son gagnant."""
+    partie = nouvelle_partie()
+    coups = []
+    while not partie.partie_terminée() and len(coups) < limite:
+        nom = "AB"[len(coups) % 2]
+        type_coup, position = partie.jouer_un_coup(nom, "heuristique")
+        partie.appliquer_un_coup(nom, position, type_coup)
+        enregistreur.ajouter(type_coup, position)
+        coups.append((type_coup, position))
+    gagnant = partie.partie_terminée()
+    gagnant = "AB".index(gagnant) if gagnant else None
+    enregistreur.terminer(gagnant)
+    return coups, gagnant
+
+
+def test_aller_retour(tmp_path):
+    """Les parties écrites sont relues et rejouées à l'identique."""
+    chemin = str(tmp_path / "parties.bin")
+    enregistreur = Enregistreur(chemin)
+    jouées = [_jouer(enregistreur), _jouer(enregistreur, limite=7)]
+    # Un second enregistreur sur le même fichier n'écrit pas de nouvelle signature
+    _jouer(Enregistreur(chemin), limite=0)
+    jouées.append(([], None))
+
+    with open(chemin, "rb") as fichier:
+        assert fichier.read(len(SIGNATURE)) == SIGNATURE
+        assert SIGNATURE not in fichier.read()
+    # Des blocs minuscules coupent les parties entre deux lectures
+    lues = list(lire_parties(chemin, taille_bloc=5))
+    assert [(partie.coups, partie.gagnant) for partie in lues] == jouées
+
+    rejouées = []
+    for partie, joueur, type_coup, position in rejouer(chemin, valider=True):
+        if not rejouées or rejouées[-1][0] is not partie:
+            rejouées.append((partie, []))
+        assert joueur == len(rejouées[-1][1]) % 2
+        rejouées[-1][1].append((type_coup, position))
+    assert [coups for _, coups in rejouées] == [coups for coups, _ in jouées if coups]
+    assert rejouées[0][0].partie_terminée() == str(jouées[0][1] + 1)
+
+
+def test_fichier_étranger(tmp_path):
+    """Un fichier sans signature est refusé."""
+    chemin = tmp_path / "autre.bin"
+    chemin.write_bytes(b"\x00\x01")
+    with pytest.raises(ValueError):
+        list(lire_parties(str(chemin)))
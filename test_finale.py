@@ -0,0 +1,70 @@
+"""Tests de la résolution exacte des finales sans murs
+
+Les tables de finale.résoudre sont comparées à une analyse naïve: chaque
+position est réévaluée à partir des valeurs de ses enfants jusqu'à ce que plus
+rien ne change, en partant de positions toutes indéterminées.
+"""
+
+import random
+from damier import LIGNES_BUT, Damier
+from finale import résoudre, valeur
+from legalite import murs_légaux
+
+
+def _par_itération(murs_h, murs_v):
+    """Calculer les valeurs de toutes les positions de la course par itération naïve."""
+    enfants = {}
+    for case_1 in range(81):
+        for case_2 in range(81):
+            if case_1 == case_2 or LIGNES_BUT[0] >> case_1 & 1 or LIGNES_BUT[1] >> case_2 & 1:
+                continue
+            damier = Damier((case_1, case_2), murs_h, murs_v)
+            for trait in range(2):
+                successeurs = damier.successeurs(trait)
+                if any(LIGNES_BUT[trait] >> numéro & 1 for numéro in successeurs):
+                    enfants[case_1, case_2, trait] = None
+                else:
+                    enfants[case_1, case_2, trait] = [
+                        (numéro, case_2, 1) if trait == 0 else (case_1, numéro, 0)
+                        for numéro in successeurs]
+
+    valeurs = dict.fromkeys(enfants, 0)
+    for _ in range(len(enfants)):
+        nouvelles = {}
+        for position, suivants in enfants.items():
+            if suivants is None:
+                nouvelles[position] = 1
+                continue
+            issues = [valeurs[suivant] for suivant in suivants]
+            défaites = [-issue for issue in issues if issue < 0]
+            if défaites:
+                nouvelles[position] = 1 + min(défaites)
+            elif issues and all(issue > 0 for issue in issues):
+                nouvelles[position] = -1 - max(issues)
+            else:
+                nouvelles[position] = 0
+        if nouvelles == valeurs:
+            return valeurs
+        valeurs = nouvelles
+    raise AssertionError("L'itération ne converge pas.")
+
+
+def _murs_aléatoires(nombre, graine):
+    """Tirer au hasard un ensemble de murs légaux."""
+    aléa = random.Random(graine)
+    damier = Damier((4, 76), 0, 0)
+    for _ in range(nombre):
+        orientation, x, y = aléa.choice(murs_légaux(damier))
+        damier = damier.avec_mur(orientation, x, y)
+    return damier.murs_h, damier.murs_v
+
+
+def test_résoudre_conforme_à_l_itération():
+    """Chaque position a la valeur trouvée par l'itération naïve."""
+    for murs_h, murs_v in ((0, 0), _murs_aléatoires(12, 1), _murs_aléatoires(20, 2)):
+        attendues = _par_itération(murs_h, murs_v)
+        valeurs = résoudre(murs_h, murs_v)
+        for (case_1, case_2, trait), attendue in attendues.items():
+            damier = Damier((case_1, case_2), murs_h, murs_v)
+            assert valeurs[(case_1 * 81 + case_2) * 2 + trait] == attendue
+            assert valeur(damier, trait) == attendue
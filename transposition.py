@@ -0,0 +1,117 @@
+"""Module de la table de transposition de la recherche
+
+Classes:
+    * Entrée - Résultat mémorisé de l'analyse d'une position.
+    * TableTransposition - Table de taille bornée indexée par clé de Zobrist.
+"""
+
+from collections import namedtuple
+
+EXACTE, INFÉRIEURE, SUPÉRIEURE = range(3)
+
+# Estimation de la mémoire occupée par une entrée (tuple, entiers et coup)
+OCTETS_PAR_ENTRÉE = 160
+
+Entrée = namedtuple("Entrée", ["clé", "profondeur", "score", "borne", "coup", "génération"])
+Entrée.__doc__ = """Résultat mémorisé de l'analyse d'une position.
+
+Attributes:
+    clé (int): la clé de Zobrist complète de la position.
+    profondeur (int): la profondeur à laquelle la position a été analysée.
+    score (int): le score obtenu.
+    borne (int): EXACTE, INFÉRIEURE ou SUPÉRIEURE selon la nature du score.
+    coup (tuple): le meilleur coup trouvé, ou None.
+    génération (int): la recherche au cours de laquelle l'entrée a été écrite.
+"""
+
+
+class TableTransposition:
+    """Table de transposition de taille fixe.
+
+    Le nombre de cases est la plus grande puissance de deux que permet le budget de
+    mémoire; une position occupe la case désignée par les bits de poids faible de
+    sa clé. En cas de collision, une entrée est remplacée si elle provient d'une
+    recherche précédente ou si la nouvelle analyse est au moins aussi profonde.
+
+    Attributes:
+        taille (int): le nombre de cases de la table.
+        succès (int): le nombre de consultations qui ont trouvé la position.
+        échecs (int): le nombre de consultations qui ne l'ont pas trouvée.
+        remplacements (int): le nombre d'entrées écrasées par une autre position.
+        génération (int): le numéro de la recherche en cours.
+    """
+
+    def __init__(self, mémoire=16 * 1024 * 1024):
+        """Constructeur de la classe TableTransposition.
+
+        Args:
+            mémoire (int, optionnel): le budget de mémoire de la table, en octets.
+        """
+        self.taille = 1 << max(0, (mémoire // OCTETS_PAR_ENTRÉE).bit_length() - 1)
+        self._masque = self.taille - 1
+        self._cases = [None] * self.taille
+        self.succès = 0
+        self.échecs = 0
+        self.remplacements = 0
+        self.génération = 0
+
+    def nouvelle_recherche(self):
+        """Signaler le début d'une recherche; les entrées plus anciennes deviennent remplaçables."""
+        self.génération += 1
+
+    def consulter(self, clé):
+        """Chercher une position dans la table.
+
+        Args:
+            clé (int): la clé de Zobrist de la position.
+
+        Returns:
+            Entrée: l'entrée de la position, ou None si elle est absente.
+        """
+        entrée = self._cases[clé & self._masque]
+        if entrée is not None and entrée.clé == clé:
+            self.succès += 1
+            return entrée
+        self.échecs += 1
+        return None
+
+    def enregistrer(self, clé, profondeur, score, borne, coup):
+        """Mémoriser le résultat de l'analyse d'une position.
+
+        Args:
+            clé (int): la clé de Zobrist de la position.
+            profondeur (int): la profondeur de l'analyse.
+            score (int): le score obtenu.
+            borne (int): EXACTE, INFÉRIEURE ou SUPÉRIEURE.
+            coup (tuple): le meilleur coup trouvé, ou None.
+        """
+        indice = clé & self._masque
+        ancienne = self._cases[indice]
+        if ancienne is not None:
+            if (ancienne.génération == self.génération
+                    and ancienne.profondeur > profondeur):
+                return
+            if ancienne.clé != clé:
+                self.remplacements += 1
+        self._cases[indice] = Entrée(clé, profondeur, score, borne, coup, self.génération)
+
+    def vider(self):
+        """Effacer toutes les entrées et remettre les compteurs à zéro."""
+        self._cases = [None] * self.taille
+        self.succès = self.échecs = self.remplacements = 0
+        self.génération = 0
+
+    def statistiques(self):
+        """Produire les compteurs de la table.
+
+        Returns:
+            Dict: la taille, l'occupation et les compteurs de succès, d'échecs
+                et de remplacements.
+        """
+        return {
+            "taille": self.taille,
+            "occupées": sum(entrée is not None for entrée in self._cases),
+            "succès": self.succès,
+            "échecs": self.échecs,
+            "remplacements": self.remplacements,
+        }
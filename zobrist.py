@@ -0,0 +1,48 @@
+"""Module de hachage de Zobrist des positions du jeu Quoridor
+
+Chaque élément d'une position (case d'un jeton, mur posé, nombre de murs
+restants d'un joueur, joueur au trait) est associé à une clé aléatoire de
+64 bits; la clé d'une position est le ou exclusif des clés de ses éléments,
+ce qui permet de la mettre à jour en quelques opérations à chaque coup.
+
+Les clés sont tirées d'un générateur à graine fixe afin qu'une même position
+ait la même clé d'un processus à l'autre.
+
+Functions:
+    * hacher - Calculer la clé d'une position à partir de zéro.
+"""
+
+import random
+from damier import case, indice_mur
+
+MURS_MAX = 10
+
+_GÉNÉRATEUR = random.Random(0x9E3779B97F4A7C15)
+
+POSITIONS = tuple(tuple(_GÉNÉRATEUR.getrandbits(64) for _ in range(81)) for _ in range(2))
+MURS_H = tuple(_GÉNÉRATEUR.getrandbits(64) for _ in range(64))
+MURS_V = tuple(_GÉNÉRATEUR.getrandbits(64) for _ in range(64))
+RESTANTS = tuple(tuple(_GÉNÉRATEUR.getrandbits(64) for _ in range(MURS_MAX + 1))
+                 for _ in range(2))
+TRAIT = _GÉNÉRATEUR.getrandbits(64)
+
+
+def hacher(joueurs, murs, trait):
+    """Calculer la clé de Zobrist d'une position à partir de zéro.
+
+    Args:
+        joueurs (List): les deux dictionnaires joueurs ('position' et 'murs').
+        murs (Dict): les listes 'horizontaux' et 'verticaux' des positions des murs.
+        trait (int): l'indice du joueur qui doit jouer (0 ou 1).
+
+    Returns:
+        int: la clé de 64 bits de la position.
+    """
+    clé = TRAIT if trait == 1 else 0
+    for i, joueur in enumerate(joueurs):
+        clé ^= POSITIONS[i][case(*joueur["position"])] ^ RESTANTS[i][joueur["murs"]]
+    for x, y in murs["horizontaux"]:
+        clé ^= MURS_H[indice_mur("MH", x, y)]
+    for x, y in murs["verticaux"]:
+        clé ^= MURS_V[indice_mur("MV", x, y)]
+    return clé